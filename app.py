@@ -1,25 +1,77 @@
-from flask import Flask, render_template, request, send_file, url_for, redirect, flash, abort, Response
+from flask import Flask, render_template, request, send_file, url_for, redirect, flash, abort, Response, make_response, session, jsonify, g, has_request_context
+from markupsafe import Markup
 import io
 import os
 import time
-from werkzeug.utils import secure_filename
+import json
+import hashlib
+import hmac
+import base64
+import mimetypes
+import uuid
+from functools import wraps, lru_cache
+import tempfile
+import gzip
+import tarfile
+import shutil
+import sqlite3
+import subprocess
+from xml.sax.saxutils import escape as xml_escape
+from werkzeug.utils import secure_filename, send_file as wsgi_send_file
+from werkzeug.security import safe_join
+from werkzeug.wrappers import Response as WSGIResponse
+from itsdangerous import URLSafeTimedSerializer, BadSignature
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
-
-from sqlalchemy import func 
+from flask.cli import AppGroup
+import click
+
+from sqlalchemy import func, event, case, null, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.orm import joinedload, contains_eager, load_only, Session
+from sqlalchemy.ext.associationproxy import association_proxy
+from collections import OrderedDict
+import threading
+import math
+from collections import defaultdict, deque
+from itertools import chain
+from contextlib import contextmanager
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from reportlab.lib import colors
 import csv 
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak, Table, TableStyle
+from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Flowable
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.lib.colors import black, blue, HexColor, lightgrey
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.lib.fonts import addMapping
+from reportlab.pdfgen import canvas as pdf_canvas
+from reportlab.graphics.shapes import Drawing, Group, String
+from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.legends import Legend
+from reportlab.lib.utils import simpleSplit, ImageReader
+from PIL import Image as PILImage, UnidentifiedImageError
+from types import SimpleNamespace
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from flask_migrate import Migrate
+try:
+    import brotli # Optional: adds Content-Encoding: br alongside gzip
+except ImportError:
+    brotli = None
+try:
+    import boto3 # Optional (requirements-s3.txt): only needed for REPORT_STORAGE=s3
+    from botocore.exceptions import ClientError
+except ImportError:
+    boto3 = ClientError = None
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -39,6 +91,63 @@ app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 # --- Configuration for PDF report storage ---
 REPORT_FOLDER = 'reports'
 app.config['REPORT_FOLDER'] = REPORT_FOLDER
+# 'local' keeps PDFs under REPORT_FOLDER; 's3' keeps them in REPORT_S3_BUCKET (under
+# REPORT_S3_PREFIX) on AWS or on the S3-compatible server at REPORT_S3_ENDPOINT_URL, and needs
+# boto3 (pip install -r requirements-s3.txt).
+app.config['REPORT_STORAGE'] = os.environ.get('REPORT_STORAGE', 'local')
+app.config['REPORT_S3_BUCKET'] = os.environ.get('REPORT_S3_BUCKET')
+app.config['REPORT_S3_PREFIX'] = os.environ.get('REPORT_S3_PREFIX', '')
+app.config['REPORT_S3_ENDPOINT_URL'] = os.environ.get('REPORT_S3_ENDPOINT_URL')
+
+# --- Report fonts ---
+# TrueType files used for all report text. Without them reports fall back to the built-in
+# Helvetica, which only covers Latin-1. Point these at a family with wider coverage
+# (e.g. DejaVuSans.ttf / DejaVuSans-Bold.ttf or Noto Sans) to render non-Latin names.
+app.config['REPORT_FONT_REGULAR'] = os.environ.get('REPORT_FONT_REGULAR')
+app.config['REPORT_FONT_BOLD'] = os.environ.get('REPORT_FONT_BOLD')
+
+# --- Deterministic PDF output ---
+# When on, a report's header date and PDF metadata come from the record and ReportLab's
+# creation timestamp and document ID are fixed, so re-rendering the same record gives
+# byte-identical output (which the blob store, ETags and render caches rely on).
+app.config['DETERMINISTIC_PDF'] = os.environ.get('DETERMINISTIC_PDF', '1') == '1'
+
+# --- PDF output profile ---
+# One of PDF_OUTPUT_PROFILES ('screen', 'print', 'archive' or the uncompressed 'draft'): controls
+# stream compression, the DPI the header logo is resampled to, JPEG quality for colour logos, and
+# the byte budget above which a rendered report is logged as oversized. PDF_SIZE_BUDGET (bytes) overrides the budget.
+app.config['PDF_OUTPUT_PROFILE'] = os.environ.get('PDF_OUTPUT_PROFILE', 'screen')
+app.config['PDF_SIZE_BUDGET'] = int(os.environ.get('PDF_SIZE_BUDGET', 0)) or None
+
+# --- Share links ---
+# Secret used to sign report share links; defaults to SECRET_KEY. Changing it invalidates
+# every link handed out so far. SHARE_LINK_MAX_DAYS caps how long a link may stay valid.
+app.config['SHARE_LINK_SECRET'] = os.environ.get('SHARE_LINK_SECRET')
+app.config['SHARE_LINK_MAX_DAYS'] = int(os.environ.get('SHARE_LINK_MAX_DAYS', 30))
+
+# --- Season booklets ---
+# Most player reports one booklet may contain, which bounds the memory a render can use,
+# and how many bytes of output are kept in memory before the booklet is spooled to a temporary file.
+app.config['BOOKLET_MAX_PLAYERS'] = int(os.environ.get('BOOKLET_MAX_PLAYERS', 200))
+app.config['BOOKLET_SPOOL_BYTES'] = int(os.environ.get('BOOKLET_SPOOL_BYTES', 8 * 1024 * 1024))
+
+# --- Server-side cache of rendered list tables (per worker process) ---
+# Upper bound in bytes for cached HTML fragments. 0 disables the cache.
+app.config['FRAGMENT_CACHE_MAX_BYTES'] = int(os.environ.get('FRAGMENT_CACHE_MAX_BYTES', 0))
+
+# --- PDF render admission (per worker process) ---
+# Total concurrent renders, renders per club, and how many more requests a club may queue
+# before getting a 429. Queued requests give up after RENDER_QUEUE_TIMEOUT seconds.
+# Limits apply between the request threads of one process, so serve the app with threaded
+# workers (gunicorn.conf.py); a sync worker handles one request at a time and never queues.
+app.config['RENDER_MAX_CONCURRENCY'] = int(os.environ.get('RENDER_MAX_CONCURRENCY', 4))
+app.config['RENDER_MAX_PER_CLUB'] = int(os.environ.get('RENDER_MAX_PER_CLUB', 2))
+app.config['RENDER_MAX_QUEUED_PER_CLUB'] = int(os.environ.get('RENDER_MAX_QUEUED_PER_CLUB', 4))
+app.config['RENDER_QUEUE_TIMEOUT'] = float(os.environ.get('RENDER_QUEUE_TIMEOUT', 10))
+
+# --- Metrics ---
+# Bearer token a scraper must send to read /metrics. The endpoint is disabled when unset.
+app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
 
 # --- Database Configuration (SQLite) ---
 # Use the live DATABASE_URL if it's available, otherwise use local SQLite
@@ -46,6 +155,24 @@ database_uri = os.environ.get('DATABASE_URL') or 'sqlite:///football_reports.db'
 app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# --- Authenticated principal cache (per worker process) ---
+# Seconds a logged-in user's identity is served from memory before being re-read
+# from the database. 0 disables the cache and every request loads the user.
+app.config['AUTH_CACHE_TTL'] = int(os.environ.get('AUTH_CACHE_TTL', 0))
+
+# --- Query instrumentation ---
+# Statements slower than SLOW_QUERY_MS are logged with their route. A request running the
+# same statement QUERY_REPEAT_THRESHOLD times or more is logged as a likely N+1 pattern.
+app.config['SLOW_QUERY_MS'] = float(os.environ.get('SLOW_QUERY_MS', 100))
+app.config['QUERY_REPEAT_THRESHOLD'] = int(os.environ.get('QUERY_REPEAT_THRESHOLD', 5))
+
+# --- Static assets and response compression ---
+# Fingerprinted static URLs (?v=<content hash>) are cached for STATIC_MAX_AGE seconds as
+# immutable. Text responses of at least COMPRESS_MIN_BYTES are gzip/brotli encoded; static
+# files use the .gz/.br variants written by `flask reports precompress-static` instead.
+app.config['STATIC_MAX_AGE'] = int(os.environ.get('STATIC_MAX_AGE', 365 * 24 * 3600))
+app.config['COMPRESS_MIN_BYTES'] = int(os.environ.get('COMPRESS_MIN_BYTES', 500))
+
 db = SQLAlchemy(app)
 migrate = Migrate(app, db)
 # --- Flask-Login Setup ---
@@ -58,6 +185,7 @@ login_manager.login_view = 'login'
 class Club(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), unique=True, nullable=False)
+    data_version = db.Column(db.Integer, nullable=False, default=0, server_default='0') # Bumped whenever a Player or Match of the club changes
     users = db.relationship('User', backref='club', lazy=True)
     players = db.relationship('Player', backref='club', lazy=True)
     matches = db.relationship('Match', backref='club', lazy=True)
@@ -80,9 +208,46 @@ class User(UserMixin, db.Model):
     def __repr__(self):
         return f'<User {self.username}>'
 
-class Player(db.Model):
+# Identity fields that live on PlayerProfile and are shared by all of a player's reports.
+PLAYER_PROFILE_FIELDS = ('player_name', 'jersey_number', 'dob', 'preferred_foot', 'height', 'weight')
+
+def text_key(text):
+    """The case- and whitespace-insensitive form of free text, used for matching and prefix search."""
+    return ' '.join((text or '').split()).lower()
+
+def profile_name_key(player_name):
+    """The form of a name used to match reports to a profile."""
+    return text_key(player_name)
+
+class PlayerProfile(db.Model):
+    """A player as a person; each Player row is one report about them."""
     id = db.Column(db.Integer, primary_key=True)
+    club_id = db.Column(db.Integer, db.ForeignKey('club.id'), nullable=False)
     player_name = db.Column(db.String(100), nullable=False)
+    name_key = db.Column(db.String(100), nullable=False) # profile_name_key(player_name), kept in sync on flush
+    jersey_number = db.Column(db.Integer)
+    dob = db.Column(db.String(20))
+    preferred_foot = db.Column(db.String(20))
+    height = db.Column(db.Float)
+    weight = db.Column(db.Float)
+    created_at = db.Column(db.DateTime, default=db.func.now())
+
+    # One profile per player: a blank date of birth counts as a value so it is unique too
+    __table_args__ = (db.Index('uq_player_profile_identity', 'club_id', 'name_key', db.func.coalesce(dob, ''), unique=True),)
+
+    def __repr__(self):
+        return f'<PlayerProfile {self.player_name} ({self.dob})>'
+
+def _profile_proxy(field):
+    # Setting a field on a report without a profile starts a new one; on flush it is swapped
+    # for the club's existing profile with the same name and date of birth, if there is one.
+    return association_proxy('profile', field, creator=lambda value: PlayerProfile(**{field: value}))
+
+class Player(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    profile_id = db.Column(db.Integer, db.ForeignKey('player_profile.id'), nullable=False, index=True)
+    profile = db.relationship('PlayerProfile', backref=db.backref('reports', lazy=True, order_by='Player.report_period_start'))
+    player_name = _profile_proxy('player_name')
     coach_name = db.Column(db.String(100)) # ADD THIS LINE
     sub_team = db.Column(db.String(50)) 
     
@@ -107,16 +272,17 @@ class Player(db.Model):
     primary_areas_development = db.Column(db.Text)
     recommended_action_plan = db.Column(db.Text)
 
-    jersey_number = db.Column(db.Integer)
+    jersey_number = _profile_proxy('jersey_number')
     position = db.Column(db.String(50))
-    dob = db.Column(db.String(20))
-    preferred_foot = db.Column(db.String(20))
-    height = db.Column(db.Float)
-    weight = db.Column(db.Float)
+    dob = _profile_proxy('dob')
+    preferred_foot = _profile_proxy('preferred_foot')
+    height = _profile_proxy('height')
+    weight = _profile_proxy('weight')
     
     pdf_report_path = db.Column(db.String(255), unique=True, nullable=False)
     created_at = db.Column(db.DateTime, default=db.func.now())
     club_id = db.Column(db.Integer, db.ForeignKey('club.id'), nullable=False)
+    versions = db.relationship('ReportVersion', backref='player', lazy=True, order_by='ReportVersion.version', cascade='all, delete-orphan')
 
     def __repr__(self):
         return f'<Player {self.player_name} ({self.jersey_number})>'
@@ -150,21 +316,690 @@ class Match(db.Model):
     pdf_report_path = db.Column(db.String(255), unique=True, nullable=False)
     created_at = db.Column(db.DateTime, default=db.func.now())
     club_id = db.Column(db.Integer, db.ForeignKey('club.id'), nullable=False)
+    versions = db.relationship('ReportVersion', backref='match', lazy=True, order_by='ReportVersion.version', cascade='all, delete-orphan')
 
     def __repr__(self):
         return f'<Match {self.home_team} vs {self.away_team} on {self.match_date}>'
 
+class ReportBlob(db.Model):
+    """A rendered PDF stored once on disk, addressed by the SHA-256 of its bytes."""
+    sha256 = db.Column(db.String(64), primary_key=True)
+    size = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=db.func.now())
+
+    def __repr__(self):
+        return f'<ReportBlob {self.sha256[:12]} ({self.size} bytes)>'
+
+class ReportVersion(db.Model):
+    """One entry in the version history of a Player or Match report."""
+    id = db.Column(db.Integer, primary_key=True)
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), index=True)
+    match_id = db.Column(db.Integer, db.ForeignKey('match.id'), index=True)
+    version = db.Column(db.Integer, nullable=False)
+    blob_sha256 = db.Column(db.String(64), db.ForeignKey('report_blob.sha256'), nullable=False, index=True)
+    snapshot = db.Column(db.Text) # JSON copy of the report's fields when this version was rendered
+    note = db.Column(db.String(100))
+    created_at = db.Column(db.DateTime, default=db.func.now())
+    created_by_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    blob = db.relationship('ReportBlob', lazy='joined')
+    created_by = db.relationship('User', lazy='joined')
+
+    __table_args__ = (
+        db.UniqueConstraint('player_id', 'version'),
+        db.UniqueConstraint('match_id', 'version'),
+    )
+
+    def __repr__(self):
+        return f'<ReportVersion v{self.version} {self.blob_sha256[:12]}>'
+
+class AutocompleteValue(db.Model):
+    """A distinct value the club has entered in a free-text field, for prefix search while typing."""
+    club_id = db.Column(db.Integer, db.ForeignKey('club.id'), primary_key=True)
+    field = db.Column(db.String(30), primary_key=True)
+    value_key = db.Column(db.String(100), primary_key=True) # text_key(value); the primary key doubles as the prefix index
+    value = db.Column(db.String(100), nullable=False) # Most recently used spelling
+    use_count = db.Column(db.Integer, nullable=False, default=0)
+    last_used_at = db.Column(db.DateTime, default=db.func.now())
+
+    def __repr__(self):
+        return f'<AutocompleteValue {self.field}={self.value!r} x{self.use_count}>'
+
+class ProgressionPoint(db.Model):
+    """A player's numbers for one reporting period, taken from their latest report on that period."""
+    profile_id = db.Column(db.Integer, db.ForeignKey('player_profile.id'), primary_key=True)
+    period_start = db.Column(db.String(20), primary_key=True) # '' when the report has no period
+    period_end = db.Column(db.String(20), primary_key=True)
+    report_id = db.Column(db.Integer, nullable=False)
+    matches_played = db.Column(db.Integer, nullable=False, default=0)
+    minutes = db.Column(db.Integer, nullable=False, default=0)
+    goals = db.Column(db.Integer, nullable=False, default=0)
+    assists = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<ProgressionPoint {self.profile_id} {self.period_start}..{self.period_end}>'
+
 
 # --- Flask-Login User Loader ---
+
+class CachedClub:
+    """Read-only snapshot of the columns of a Club that requests rely on."""
+    __slots__ = ('id', 'name')
+
+    def __init__(self, club):
+        self.id = club.id
+        self.name = club.name
+
+
+class CachedUser(UserMixin):
+    """Detached copy of an authenticated User (and their club) kept in the principal cache."""
+
+    def __init__(self, user):
+        self.id = user.id
+        self.username = user.username
+        self.club_id = user.club_id
+        self.club = CachedClub(user.club)
+
+
+class PrincipalCache:
+    """Per-worker TTL cache of authenticated principals, keyed by user id."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            return principal
+
+    def put(self, user_id, principal, ttl):
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + ttl, principal)
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def invalidate_club(self, club_id):
+        with self._lock:
+            for user_id in [uid for uid, (_, p) in self._entries.items() if p.club_id == club_id]:
+                del self._entries[user_id]
+
+
+principal_cache = PrincipalCache()
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_cached_user(mapper, connection, target):
+    principal_cache.invalidate_user(target.id)
+
+
+@event.listens_for(Club, 'after_update')
+@event.listens_for(Club, 'after_delete')
+def _invalidate_cached_club(mapper, connection, target):
+    principal_cache.invalidate_club(target.id)
+
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    """Loads the user and their club in a single joined query, optionally via the principal cache."""
+    user_id = int(user_id)
+    ttl = app.config['AUTH_CACHE_TTL']
+    if ttl > 0:
+        principal = principal_cache.get(user_id)
+        if principal is not None:
+            return principal
+
+    user = db.session.get(User, user_id, options=[joinedload(User.club)])
+    if user is None or ttl <= 0:
+        return user
+
+    principal = CachedUser(user)
+    principal_cache.put(user_id, principal, ttl)
+    return principal
+
+# --- Player Profiles ---
+
+@event.listens_for(Session, 'before_flush')
+def _attach_player_profiles(session, flush_context, instances):
+    """Keeps profile name keys current and points new reports at their player's existing profile."""
+    with session.no_autoflush:
+        for profile in chain(session.new, session.dirty):
+            if isinstance(profile, PlayerProfile):
+                profile.dob = profile.dob or None # The forms post '' for a blank date
+                if profile.player_name:
+                    profile.player_name = ' '.join(profile.player_name.split())
+                profile.name_key = profile_name_key(profile.player_name)
+
+        resolved = {}
+        for report in list(session.new):
+            if not isinstance(report, Player) or report.profile is None or report.profile not in session.new:
+                continue
+            new_profile = report.profile
+            new_profile.club_id = report.club_id
+            key = (report.club_id, new_profile.name_key, new_profile.dob)
+            profile = resolved.get(key) or find_player_profile(*key)
+            if profile is not None and profile is not new_profile:
+                merge_profile_values(profile, {field: getattr(new_profile, field) for field in PLAYER_PROFILE_FIELDS})
+                report.profile = profile
+                session.expunge(new_profile)
+            resolved[key] = profile or new_profile
+
+def find_player_profile(club_id, name_key, dob):
+    """The club's profile for a name key and date of birth, if there is one."""
+    return db.session.query(PlayerProfile).filter(
+        PlayerProfile.club_id == club_id, PlayerProfile.name_key == name_key,
+        db.func.coalesce(PlayerProfile.dob, '') == (dob or ''),
+    ).first()
+
+def merge_profile_values(profile, values):
+    """The newest report's identity values win, but a blank field keeps what the profile had."""
+    for field, value in values.items():
+        if value is not None and value != '':
+            setattr(profile, field, value)
+
+def assign_player_identity(report, values):
+    """Applies identity field values to an existing report without rewriting its player's other reports.
+
+    Values for the same player update the shared profile. A different name or date of birth moves
+    the report to that player's profile, or to a new one; a profile left without reports is deleted."""
+    profile = report.profile
+    key = (profile_name_key(values.get('player_name')), values.get('dob') or None)
+    if key == (profile.name_key, profile.dob or None):
+        for field, value in values.items():
+            setattr(profile, field, value)
+        return
+
+    target = find_player_profile(report.club_id, *key)
+    if target is not None:
+        merge_profile_values(target, values)
+    elif len(profile.reports) > 1:
+        target = PlayerProfile(club_id=report.club_id, **values)
+    else:
+        # The report is the player's only one, so renaming the profile affects nothing else
+        for field, value in values.items():
+            setattr(profile, field, value)
+        return
+
+    report.profile = target
+    if not profile.reports:
+        db.session.delete(profile)
+
+def profile_aggregates(profile_id):
+    """Totals over every report of a profile, computed from the profile_id index in one query."""
+    totals = db.session.query(
+        func.count(Player.id).label('reports'),
+        func.coalesce(func.sum(Player.matches_played), 0).label('matches_played'),
+        func.coalesce(func.sum(Player.total_minutes_played), 0).label('minutes_played'),
+        func.coalesce(func.sum(Player.goals), 0).label('goals'),
+        func.coalesce(func.sum(Player.assists), 0).label('assists'),
+        func.min(Player.report_period_start).label('first_period_start'),
+        func.max(Player.report_period_end).label('last_period_end'),
+    ).filter(Player.profile_id == profile_id).one()
+    return SimpleNamespace(
+        **totals._asdict(),
+        goals_per_90=per_90(totals.goals, totals.minutes_played),
+        assists_per_90=per_90(totals.assists, totals.minutes_played),
+    )
+
+def per_90(value, minutes):
+    return round(value * 90 / minutes, 2) if minutes else None
+
+# --- Club Data Versioning ---
+
+@event.listens_for(Session, 'before_flush')
+def _bump_club_data_versions(session, flush_context, instances):
+    """Increments Club.data_version for every club whose players, profiles or matches are created, edited or deleted."""
+    club_ids = {
+        obj.club_id for obj in chain(session.new, session.dirty, session.deleted)
+        if isinstance(obj, (Player, Match, PlayerProfile)) and obj.club_id is not None
+    }
+    for club_id in club_ids:
+        session.connection().execute(
+            Club.__table__.update().where(Club.id == club_id).values(data_version=Club.data_version + 1)
+        )
+
+def club_data_version(club_id):
+    return db.session.query(Club.data_version).filter_by(id=club_id).scalar()
+
+# --- Autocomplete Index ---
+# Distinct values of the free-text fields below, per club, keyed by their text_key. A
+# prefix search is a range scan on the primary key, so it never touches the Player or
+# Match tables. Use counts are updated on flush as rows gain, change or lose one of the values.
+# Home and away teams share the 'team' list.
+
+AUTOCOMPLETE_SOURCES = {
+    Match: {'home_team': 'team', 'away_team': 'team', 'competition': 'competition', 'venue': 'venue', 'season': 'season'},
+    Player: {'coach_name': 'coach', 'sub_team': 'sub_team'},
+}
+AUTOCOMPLETE_FIELDS = sorted({field for sources in AUTOCOMPLETE_SOURCES.values() for field in sources.values()})
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_VALUE_LENGTH = 100
+
+def upsert_autocomplete_values(connection, uses):
+    """Applies {(club_id, field, value_key): (value, count)} to the index.
+
+    Counts are added to the known values' use counts; a value of None only adjusts the count,
+    so the stored spelling stays the most recently entered one. Values no longer used by any
+    row are dropped.
+    """
+    if not uses:
+        return
+    table = AutocompleteValue.__table__
+    rows = [
+        {'club_id': club_id, 'field': field, 'value_key': value_key, 'value': value, 'use_count': count}
+        for (club_id, field, value_key), (value, count) in uses.items()
+    ]
+    removals = [row for row in rows if row['value'] is None]
+    for row in removals:
+        connection.execute(table.update().where(
+            table.c.club_id == row['club_id'], table.c.field == row['field'], table.c.value_key == row['value_key'],
+        ).values(use_count=table.c.use_count + row['use_count']))
+
+    rows = [row for row in rows if row['value'] is not None]
+    insert = {'sqlite': sqlite_insert, 'postgresql': postgresql_insert}.get(connection.dialect.name)
+    if rows and insert is not None:
+        statement = insert(table).values(rows)
+        connection.execute(statement.on_conflict_do_update(
+            index_elements=[table.c.club_id, table.c.field, table.c.value_key],
+            set_={'value': statement.excluded.value, 'use_count': table.c.use_count + statement.excluded.use_count, 'last_used_at': func.now()},
+        ))
+    else:
+        for row in rows:
+            updated = connection.execute(table.update().where(
+                table.c.club_id == row['club_id'], table.c.field == row['field'], table.c.value_key == row['value_key'],
+            ).values(value=row['value'], use_count=table.c.use_count + row['use_count'], last_used_at=func.now()))
+            if not updated.rowcount:
+                connection.execute(table.insert().values(row))
+
+    decremented = [(club_id, field, value_key) for (club_id, field, value_key), (value, count) in uses.items() if count <= 0]
+    if decremented:
+        connection.execute(table.delete().where(
+            db.tuple_(table.c.club_id, table.c.field, table.c.value_key).in_(decremented), table.c.use_count <= 0,
+        ))
+
+def _count_autocomplete_use(uses, club_id, field, value, count=1):
+    """Adds count uses of value to uses; negative counts are for values that stopped being used."""
+    value = ' '.join((value or '').split())[:AUTOCOMPLETE_VALUE_LENGTH]
+    if not value:
+        return
+    key = (club_id, field, text_key(value))
+    known_value, known_count = uses.get(key, (None, 0))
+    uses[key] = (value if count > 0 else known_value, known_count + count)
+
+@event.listens_for(Session, 'before_flush')
+def _index_autocomplete_values(session, flush_context, instances):
+    """Keeps use counts in step with the rows: a new or changed value counts once, and the
+    value it replaced, like every value of a deleted row, is counted down."""
+    uses = {}
+    with session.no_autoflush:
+        for obj in chain(session.new, session.dirty, session.deleted):
+            sources = AUTOCOMPLETE_SOURCES.get(type(obj))
+            if not sources or obj.club_id is None:
+                continue
+            state = inspect(obj)
+            for attribute, field in sources.items():
+                if obj in session.deleted:
+                    _count_autocomplete_use(uses, obj.club_id, field, getattr(obj, attribute), -1)
+                    continue
+                history = state.attrs[attribute].history
+                for value in history.deleted:
+                    _count_autocomplete_use(uses, obj.club_id, field, value, -1)
+                for value in history.added:
+                    _count_autocomplete_use(uses, obj.club_id, field, value)
+    upsert_autocomplete_values(session.connection(), uses)
+
+def autocomplete_suggestions(club_id, field, prefix, limit=AUTOCOMPLETE_LIMIT):
+    """Up to limit values of the field starting with prefix, most used first."""
+    query = db.session.query(AutocompleteValue.value).filter(
+        AutocompleteValue.club_id == club_id, AutocompleteValue.field == field,
+    )
+    prefix = text_key(prefix)
+    if prefix:
+        # value_key >= 'abc' AND value_key < 'abd' is a range scan on the primary key
+        upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        query = query.filter(AutocompleteValue.value_key >= prefix, AutocompleteValue.value_key < upper_bound)
+    query = query.order_by(AutocompleteValue.use_count.desc(), AutocompleteValue.value_key).limit(limit)
+    return [row.value for row in query]
+
+# --- Player Progression ---
+# Each profile's series of ProgressionPoint rows is rebuilt from its reports after every
+# flush that adds, edits, moves or deletes one of them, so rendering a report reads a few
+# ready-made rows instead of aggregating reports. `flask reports rebuild-progression`
+# recomputes every series from scratch.
+
+def refresh_progression(connection, profile_ids):
+    """Rebuilds the progression points of the given profiles from their reports."""
+    if not profile_ids:
+        return
+    table = ProgressionPoint.__table__
+    connection.execute(table.delete().where(table.c.profile_id.in_(profile_ids)))
+    reports = connection.execute(
+        db.select(Player.id, Player.profile_id, Player.report_period_start, Player.report_period_end,
+                  Player.matches_played, Player.total_minutes_played, Player.goals, Player.assists)
+        .where(Player.profile_id.in_(profile_ids))
+        .order_by(Player.created_at, Player.id)
+    )
+    points = {}
+    for report in reports: # Oldest first, so the latest report on a period wins
+        key = (report.profile_id, report.report_period_start or '', report.report_period_end or '')
+        points[key] = {
+            'profile_id': key[0], 'period_start': key[1], 'period_end': key[2], 'report_id': report.id,
+            'matches_played': report.matches_played or 0, 'minutes': report.total_minutes_played or 0,
+            'goals': report.goals or 0, 'assists': report.assists or 0,
+        }
+    if points:
+        connection.execute(table.insert(), list(points.values()))
+
+@event.listens_for(Session, 'before_flush')
+def _drop_deleted_profiles_progression(session, flush_context, instances):
+    """Removes the points of deleted profiles before their rows go."""
+    profile_ids = {obj.id for obj in session.deleted if isinstance(obj, PlayerProfile)}
+    if profile_ids:
+        table = ProgressionPoint.__table__
+        session.connection().execute(table.delete().where(table.c.profile_id.in_(profile_ids)))
+
+@event.listens_for(Session, 'after_flush')
+def _refresh_changed_progression(session, flush_context):
+    """Rebuilds the series of every profile whose reports were flushed, including ones a report moved away from."""
+    profile_ids = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Player):
+            profile_ids.add(obj.profile_id)
+            profile_ids.update(inspect(obj).attrs.profile_id.history.deleted)
+    profile_ids -= {obj.id for obj in session.deleted if isinstance(obj, PlayerProfile)}
+    profile_ids.discard(None)
+    refresh_progression(session.connection(), sorted(profile_ids))
+
+def progression_series(profile_ids):
+    """Returns {profile_id: [ProgressionPoint rows by period]} for the given profiles, in one query."""
+    query = db.session.query(ProgressionPoint).filter(ProgressionPoint.profile_id.in_(profile_ids))
+    series = defaultdict(list)
+    for point in query.order_by(ProgressionPoint.period_start, ProgressionPoint.period_end):
+        series[point.profile_id].append(point)
+    return series
+
+def report_progression(player_obj, series):
+    """The part of a profile's series a report shows: periods starting no later than its own.
+
+    A report re-rendered later therefore does not gain the periods that came after it.
+    """
+    if player_obj.report_period_start:
+        series = [point for point in series if point.period_start and point.period_start <= player_obj.report_period_start]
+    return series[-PROGRESSION_MAX_POINTS:]
+
+# --- Query Instrumentation ---
+# Engine events time every statement and add it to each active QueryStats: one per request,
+# plus any opened by track_queries() (e.g. query budgets in tests). Counts and DB time
+# are returned in a Server-Timing header and totalled per endpoint for /metrics.
+
+class QueryStats:
+    """Statements executed while a recorder is active, with their total database time."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = defaultdict(int)
+
+    def record(self, statement, seconds):
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def repeated(self, threshold):
+        """Statements run at least threshold times, most repeated first."""
+        return sorted(((n, sql) for sql, n in self.statements.items() if n >= threshold), reverse=True)
+
+
+class EndpointQueryStats:
+    """Per-worker query totals keyed by endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats = defaultdict(lambda: {'requests': 0, 'queries': 0, 'seconds': 0.0, 'max_queries': 0, 'repeated': 0})
+
+    def observe(self, endpoint, query_stats, repeated):
+        with self._lock:
+            stats = self.stats[endpoint]
+            stats['requests'] += 1
+            stats['queries'] += query_stats.count
+            stats['seconds'] += query_stats.seconds
+            stats['max_queries'] = max(stats['max_queries'], query_stats.count)
+            stats['repeated'] += bool(repeated)
+
+    def snapshot(self):
+        with self._lock:
+            return {endpoint: dict(values) for endpoint, values in sorted(self.stats.items())}
+
+
+endpoint_queries = EndpointQueryStats()
+active_query_stats = ContextVar('active_query_stats', default=())
+
+
+@contextmanager
+def track_queries():
+    """Records the statements executed inside the block into a new QueryStats."""
+    stats = QueryStats()
+    token = active_query_stats.set(active_query_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        active_query_stats.reset(token)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+    for stats in active_query_stats.get():
+        stats.record(statement, elapsed)
+    if elapsed * 1000 >= app.config['SLOW_QUERY_MS']:
+        endpoint = request.endpoint if has_request_context() else None
+        app.logger.warning('Slow query (%.1f ms) on %s: %s', elapsed * 1000, endpoint or 'no request', statement)
+
+
+@app.before_request
+def _start_request_queries():
+    g.query_stats = QueryStats()
+    g.query_stats_token = active_query_stats.set(active_query_stats.get() + (g.query_stats,))
+
+
+@app.after_request
+def _report_request_queries(response):
+    stats = g.get('query_stats')
+    if stats is None:
+        return response
+    repeated = stats.repeated(app.config['QUERY_REPEAT_THRESHOLD'])
+    for count, statement in repeated:
+        app.logger.warning('Possible N+1 on %s: statement run %d times: %s', request.endpoint, count, statement)
+    endpoint_queries.observe(request.endpoint or 'unmatched', stats, repeated)
+    response.headers.add('Server-Timing', f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries"')
+    return response
+
+
+@app.teardown_request
+def _stop_request_queries(exc):
+    token = g.pop('query_stats_token', None)
+    if token is not None:
+        active_query_stats.reset(token)
+
+# --- Static Assets and Response Compression ---
+# url_for('static', ...) gets a ?v= query holding a hash of the file's contents, so a URL
+# only ever names one version of a file and can be cached as immutable. Precompressed
+# variants sit next to the originals (style.css.gz, style.css.br) and are picked by
+# Accept-Encoding; dynamic text responses are compressed once on the way out.
+
+COMPRESSIBLE_MIMETYPES = {'text/html', 'text/css', 'text/javascript', 'application/javascript', 'application/json', 'text/plain', 'image/svg+xml'}
+STATIC_ENCODINGS = [('br', '.br'), ('gzip', '.gz')] # In order of preference
+
+_static_fingerprints = {}
+
+def static_fingerprint(filename):
+    """Short content hash of a static file, recomputed when its size or mtime changes."""
+    path = safe_join(app.static_folder, filename)
+    try:
+        stat = os.stat(path)
+    except (TypeError, OSError):
+        return None
+    cached = _static_fingerprints.get(filename)
+    if cached is None or cached[0] != (stat.st_mtime_ns, stat.st_size):
+        with open(path, 'rb') as f:
+            cached = ((stat.st_mtime_ns, stat.st_size), hashlib.sha256(f.read()).hexdigest()[:12])
+        _static_fingerprints[filename] = cached
+    return cached[1]
+
+def static_files():
+    """Paths of the static files, relative to the static folder, skipping precompressed variants."""
+    for root, _, files in os.walk(app.static_folder):
+        for name in sorted(files):
+            if not name.endswith(tuple(suffix for _, suffix in STATIC_ENCODINGS)):
+                yield os.path.relpath(os.path.join(root, name), app.static_folder).replace(os.sep, '/')
+
+_static_digest_cache = None
+
+def static_digest():
+    """Hashes every static fingerprint, so pages that link to assets change when an asset does.
+
+    Static files only change with a deploy, so the folder is walked once per process unless
+    templates are auto-reloaded (TEMPLATES_AUTO_RELOAD or debug), as in development.
+    """
+    global _static_digest_cache
+    if _static_digest_cache is None or app.jinja_env.auto_reload:
+        digest = hashlib.sha256()
+        for filename in sorted(static_files()):
+            digest.update(f'{filename}={static_fingerprint(filename)}'.encode('utf-8'))
+        _static_digest_cache = digest.hexdigest()
+    return _static_digest_cache
+
+@app.url_defaults
+def _fingerprint_static_urls(endpoint, values):
+    if endpoint == 'static' and 'v' not in values:
+        fingerprint = static_fingerprint(values.get('filename', ''))
+        if fingerprint:
+            values['v'] = fingerprint
+
+def accepted_encodings():
+    return {value for value, quality in request.accept_encodings if quality > 0}
+
+@app.endpoint('static') # Replaces Flask's default static view
+def static(filename):
+    """Serves a static file, precompressed if possible, and as immutable when fingerprinted."""
+    path = safe_join(app.static_folder, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    send_path, encoding = path, None
+    if mimetype in COMPRESSIBLE_MIMETYPES:
+        accepted = accepted_encodings()
+        for candidate, suffix in STATIC_ENCODINGS:
+            variant = path + suffix
+            # Variants older than the original are stale leftovers of a previous build
+            if candidate in accepted and os.path.exists(variant) and os.path.getmtime(variant) >= os.path.getmtime(path):
+                send_path, encoding = variant, candidate
+                break
+
+    response = send_file(send_path, mimetype=mimetype, download_name=os.path.basename(path), conditional=True)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if mimetype in COMPRESSIBLE_MIMETYPES:
+        response.vary.add('Accept-Encoding')
+    if request.args.get('v') and request.args.get('v') == static_fingerprint(filename):
+        response.headers['Cache-Control'] = f'public, max-age={app.config["STATIC_MAX_AGE"]}, immutable'
+    else:
+        response.headers['Cache-Control'] = 'public, no-cache'
+    return response
+
+def compress_bytes(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=5)
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+@app.after_request
+def _compress_response(response):
+    """Compresses buffered text responses the client accepts in a compressed form."""
+    if (response.direct_passthrough or response.is_streamed or response.status_code != 200
+            or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    accepted = accepted_encodings()
+    encoding = next((name for name, _ in STATIC_ENCODINGS if name in accepted and (name != 'br' or brotli)), None)
+    data = response.get_data()
+    if encoding is None or len(data) < app.config['COMPRESS_MIN_BYTES']:
+        return response
+
+    response.set_data(compress_bytes(data, encoding))
+    response.headers['Content-Encoding'] = encoding
+    # The compressed bytes differ from the identity ones, so a strong validator becomes weak
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
 
 # --- Helper function for checking allowed file extensions ---
 def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+# --- Report Font Registry ---
+# TTF files are parsed once per process when the app is imported; pdfmetrics keeps the parsed
+# metrics for the life of the process. ReportLab embeds TrueType fonts as subsets, so each
+# PDF only carries the glyphs its text actually uses.
+
+class FontRegistry:
+    """Tracks the regular/bold font names every renderer should use."""
+
+    BUILTIN = ('Helvetica', 'Helvetica-Bold')
+
+    def __init__(self):
+        self.regular, self.bold = self.BUILTIN
+        self._families = {}
+
+    def register_family(self, family, regular_path, bold_path=None):
+        """Registers a TTF family under ``family`` (once) and returns its (regular, bold) font names."""
+        if family not in self._families:
+            bold_name = f'{family}-Bold'
+            pdfmetrics.registerFont(TTFont(family, regular_path))
+            pdfmetrics.registerFont(TTFont(bold_name, bold_path or regular_path))
+            addMapping(family, 0, 0, family)
+            addMapping(family, 1, 0, bold_name)
+            addMapping(family, 0, 1, family)
+            addMapping(family, 1, 1, bold_name)
+            self._families[family] = (family, bold_name)
+        return self._families[family]
+
+    def activate(self, regular, bold, styles):
+        """Switches the active fonts, updating paragraph styles that used the previous ones."""
+        replacements = {self.regular: regular, self.bold: bold}
+        for style in styles.byName.values():
+            if getattr(style, 'fontName', None) in replacements:
+                style.fontName = replacements[style.fontName]
+        self.regular, self.bold = regular, bold
+
+    @contextmanager
+    def using(self, regular, bold, styles):
+        """Temporarily renders with another font pair."""
+        previous = (self.regular, self.bold)
+        self.activate(regular, bold, styles)
+        try:
+            yield
+        finally:
+            self.activate(*previous, styles)
+
+
+report_fonts = FontRegistry()
+
 # --- ReportLab Style Definitions ---
 _styles = getSampleStyleSheet()
 _styles.add(ParagraphStyle(
@@ -196,6 +1031,12 @@ _styles.add(ParagraphStyle(
     textColor=colors.HexColor('#4F4F4F')
 ))
 _styles.add(ParagraphStyle(name='MatchDetail', fontSize=11, spaceAfter=8, leading=14, fontName='Helvetica'))
+
+if app.config['REPORT_FONT_REGULAR']:
+    report_fonts.activate(
+        *report_fonts.register_family('ReportSans', app.config['REPORT_FONT_REGULAR'], app.config['REPORT_FONT_BOLD']),
+        _styles,
+    )
 # --- PDF Generation Functions (Directly uses Player/Match object attributes) ---
 
 # In app.py
@@ -205,7 +1046,7 @@ from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak
-from datetime import datetime # Make sure this import is here
+from datetime import datetime, timedelta, timezone # Make sure this import is here
 from reportlab.lib.units import inch # And this one
 from reportlab.lib import colors # And this one
 # ... (rest of your app.py code)
@@ -219,7 +1060,123 @@ def format_date_dmy(date_string):
     try: return datetime.strptime(date_string, '%Y-%m-%d').strftime('%d/%m/%Y')
     except (ValueError, TypeError): return date_string
 
-def draw_header(canvas, doc, logo_path=None):
+def report_header_date(report):
+    """Returns the DD/MM/YYYY date a report is about: the match date, or the end of a player's reporting period."""
+    record_date = report.match_date if isinstance(report, Match) else report.report_period_end
+    if record_date:
+        return format_date_dmy(record_date)
+    if report.created_at:
+        return report.created_at.strftime('%d/%m/%Y')
+    return None
+
+def pdf_metadata(report):
+    """Document info fields for a report, derived only from the record itself."""
+    if isinstance(report, Match):
+        title = f'Match Report: {report.home_team} vs {report.away_team}'
+        subject = ' / '.join(filter(None, [report.competition, report.season, format_date_dmy(report.match_date)]))
+        keywords = [report.home_team, report.away_team, report.competition, report.season]
+    else:
+        title = f'Player Report: {report.player_name}'
+        subject = f'{format_date_dmy(report.report_period_start)} - {format_date_dmy(report.report_period_end)}'
+        keywords = [report.player_name, report.sub_team, report.position]
+    club_name = report.club.name if report.club else getattr(report, 'player_team', None)
+    return {
+        'title': title,
+        'author': club_name or '',
+        'subject': subject,
+        'keywords': ', '.join(filter(None, keywords)),
+        'creator': 'Analysis Hub',
+    }
+
+def utc_now():
+    """The current UTC time as a naive datetime, as the database's now() stores it."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def record_date_formatter(report):
+    """A ReportLab date formatter giving when the record was created (or 2000-01-01 if it has not been saved)."""
+    created_at = report.created_at or datetime(2000, 1, 1)
+    return lambda *fields: created_at.strftime("D:%Y%m%d%H%M%S+00'00'")
+
+def stamp_pdf_metadata(canvas, report, metadata=None):
+    """Sets the document info of the PDF being drawn from the report's data (or the given metadata)."""
+    metadata = metadata or pdf_metadata(report)
+    canvas.setTitle(metadata['title'])
+    canvas.setAuthor(metadata['author'])
+    canvas.setSubject(metadata['subject'])
+    canvas.setKeywords(metadata['keywords'])
+    canvas.setCreator(metadata['creator'])
+    if app.config['DETERMINISTIC_PDF']:
+        # The canvas is invariant, so this replaces its fixed CreationDate/ModDate with the record's
+        canvas.setDateFormatter(record_date_formatter(report))
+
+# --- PDF Output Profiles ---
+# page_compression: 1 deflates page content streams, 0 leaves them readable as plain text, which
+# renders a little faster and lets a PDF be inspected or diffed with ordinary text tools.
+# logo_dpi: resolution the logo is resampled to for the 0.4 inch header box (None keeps the upload as is).
+# jpeg_quality: colour logos without transparency are re-encoded as JPEG at this quality (None keeps them lossless).
+# max_bytes: size above which a rendered report is logged as over budget (None for no budget).
+PDF_OUTPUT_PROFILES = {
+    'screen': {'page_compression': 1, 'logo_dpi': 150, 'jpeg_quality': 80, 'max_bytes': 100 * 1024},
+    'print': {'page_compression': 1, 'logo_dpi': 300, 'jpeg_quality': 90, 'max_bytes': 250 * 1024},
+    'archive': {'page_compression': 1, 'logo_dpi': None, 'jpeg_quality': None, 'max_bytes': None},
+    'draft': {'page_compression': 0, 'logo_dpi': 150, 'jpeg_quality': 80, 'max_bytes': None},
+}
+
+HEADER_LOGO_SIZE = 0.4 * inch
+
+def pdf_output_profile():
+    """The PDF_OUTPUT_PROFILES entry selected by config."""
+    name = app.config['PDF_OUTPUT_PROFILE']
+    if name not in PDF_OUTPUT_PROFILES:
+        raise ValueError(f"Unknown PDF_OUTPUT_PROFILE {name!r}, expected one of {', '.join(PDF_OUTPUT_PROFILES)}")
+    return PDF_OUTPUT_PROFILES[name]
+
+def pdf_size_budget():
+    """Bytes a single report may take before it is reported as oversized, or None."""
+    return app.config['PDF_SIZE_BUDGET'] or pdf_output_profile()['max_bytes']
+
+def prepare_logo(logo_path, profile):
+    """Returns the uploaded logo ready to embed in the header, or None if there is no logo.
+
+    The image is shrunk to the header box at the profile's DPI and colour images without
+    transparency are re-encoded as JPEG, which ReportLab embeds without decoding. Logos with
+    transparency stay lossless so their mask survives. Files Pillow cannot read are passed
+    through unchanged for ReportLab to handle.
+    """
+    if not logo_path or not os.path.exists(logo_path):
+        return None
+    if profile['logo_dpi'] is None:
+        return logo_path
+    try:
+        image = PILImage.open(logo_path)
+        image.load()
+    except (OSError, UnidentifiedImageError):
+        return logo_path
+
+    box = round(HEADER_LOGO_SIZE / inch * profile['logo_dpi'])
+    image.thumbnail((box, box), PILImage.LANCZOS) # Keeps the aspect ratio and never upscales
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    output = io.BytesIO()
+    if has_alpha or profile['jpeg_quality'] is None:
+        image.convert('RGBA' if has_alpha else 'RGB').save(output, 'PNG', optimize=True)
+    else:
+        image.convert('L' if image.mode in ('1', 'L') else 'RGB').save(output, 'JPEG', quality=profile['jpeg_quality'], optimize=True)
+    output.seek(0)
+    return ImageReader(output)
+
+def report_page_callback(report, logo_path=None):
+    """Returns the onPage callback that decorates every page of a report."""
+    header_date = report_header_date(report) if app.config['DETERMINISTIC_PDF'] else None
+    logo = prepare_logo(logo_path, pdf_output_profile()) # Once per render, reused on every page
+
+    def on_page(canvas, doc):
+        if doc.page == 1:
+            stamp_pdf_metadata(canvas, report)
+        draw_header(canvas, doc, logo, header_date)
+        draw_footer(canvas, doc)
+    return on_page
+
+def draw_header(canvas, doc, logo=None, header_date=None):
     """Draws the custom header and page background on each page."""
     canvas.saveState()
     page_width, page_height = doc.pagesize
@@ -230,7 +1187,7 @@ def draw_header(canvas, doc, logo_path=None):
     canvas.rect(0, 0, page_width, page_height, stroke=0, fill=1)
 
     # --- Header drawing logic (we reset the color for the text and lines) ---
-    canvas.setFont('Helvetica', 10)
+    canvas.setFont(report_fonts.regular, 10)
     canvas.setFillColor(colors.HexColor('#06402B')) # Color for header text
     canvas.setStrokeColor(colors.HexColor('#e3dede'))
     canvas.setLineWidth(0.5)
@@ -244,7 +1201,7 @@ def draw_header(canvas, doc, logo_path=None):
 
     # 2. Left and Right Text
     canvas.drawString(doc.leftMargin, text_y_position, "ANALYSIS HUB")
-    canvas.drawRightString(page_width - doc.rightMargin, text_y_position, f"Date: {time.strftime('%d/%m/%Y')}")
+    canvas.drawRightString(page_width - doc.rightMargin, text_y_position, f"Date: {header_date or time.strftime('%d/%m/%Y')}")
 
     # 3. Symmetrical Vertical Separators
     side_column_width = 2.2 * inch
@@ -256,11 +1213,11 @@ def draw_header(canvas, doc, logo_path=None):
     canvas.line(separator_2_x, header_y_position, separator_2_x, separator_y_top)
 
     # 4. Center Logo
-    if logo_path and os.path.exists(logo_path):
-        logo_width, logo_height = 0.4 * inch, 0.4 * inch
+    if logo:
+        logo_width, logo_height = HEADER_LOGO_SIZE, HEADER_LOGO_SIZE
         logo_x = page_width / 2 - (logo_width / 2)
         logo_y = text_y_position - 0.05 * inch
-        canvas.drawImage(logo_path, logo_x, logo_y, width=logo_width, height=logo_height, preserveAspectRatio=True, mask='auto')
+        canvas.drawImage(logo, logo_x, logo_y, width=logo_width, height=logo_height, preserveAspectRatio=True, mask='auto')
 
     canvas.restoreState()
     
@@ -268,7 +1225,7 @@ def draw_footer(canvas, doc):
     """Draws the custom footer on each page."""
     canvas.saveState()
     page_width = doc.width + doc.leftMargin * 2
-    canvas.setFont('Helvetica', 10)
+    canvas.setFont(report_fonts.regular, 10)
     canvas.setFillColor(colors.HexColor('#06402B'))
     line_y = 0.75 * inch
     canvas.setStrokeColor(colors.HexColor('#e3dede'))
@@ -278,17 +1235,275 @@ def draw_footer(canvas, doc):
     canvas.drawRightString(page_width - doc.rightMargin, line_y - 0.2 * inch, f"Page: {doc.page}")
     canvas.restoreState()
 
-# --- PDF Generation Functions ---
-# In app.py, replace the existing create_detailed_player_report_pdf function
+# --- Splittable Notes Sections ---
+# A table cell can never split across pages, so a long notes field used to either slow
+# layout down badly or raise a LayoutError once the cell was taller than the frame. Notes
+# sections are now built as a heading plus one small single-row table per chunk of text:
+# each chunk fits comfortably on a page, the frame can break between any two chunks, and
+# layout time grows linearly with the amount of text.
+
+# Upper bound on characters per chunk (~8 lines in the notes column, well under a frame).
+NOTES_CHUNK_CHARS = 600
+
+NOTES_LABEL_WIDTH = 0.3 # Fraction of doc.width used by the green label column
+
+def split_notes(text, max_chars=NOTES_CHUNK_CHARS):
+    """Splits notes into chunks of at most max_chars, preferring line breaks, then word breaks."""
+    chunks, current = [], ''
+    for line in str(text or '').splitlines():
+        while len(line) > max_chars:
+            cut = line.rfind(' ', 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            if current:
+                chunks.append(current)
+                current = ''
+            chunks.append(line[:cut])
+            line = line[cut:].lstrip()
+        if current and len(current) + len(line) + 1 > max_chars:
+            chunks.append(current)
+            current = ''
+        current = f'{current}\n{line}' if current else line
+    if current or not chunks:
+        chunks.append(current)
+    return chunks
+
+def _section_heading(title, doc):
+    heading = Table([[title]], colWidths=[doc.width])
+    heading.setStyle(TableStyle([
+        ('LEFTPADDING', (0, 0), (-1, -1), 10),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 16),
+        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, 0), report_fonts.bold),
+        ('FONTSIZE', (0, 0), (0, 0), 16),
+        ('TEXTCOLOR', (0, 0), (0, 0), colors.HexColor('#212121')),
+    ]))
+    heading.keepWithNext = 1
+    return heading
 
-def create_detailed_player_report_pdf(player_obj, logo_path=None):
-    """Creates the full PDF with final alignment and styling applied to all sections."""
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=0.75*inch, leftMargin=0.75*inch, topMargin=1.0*inch, bottomMargin=0.75*inch)
-    elements = []
+def _notes_chunk_style(is_first, is_last, single):
+    grid_color = colors.HexColor('#A3CA9B')
+    commands = [
+        ('LEFTPADDING', (0, 0), (-1, -1), 10),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+        ('TOPPADDING', (0, 0), (-1, -1), 8 if is_first else 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8 if is_last else 0),
+        ('VALIGN', (0, 0), (0, 0), 'MIDDLE' if single else 'TOP'),
+        ('VALIGN', (1, 0), (1, 0), 'TOP'),
+        ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#4CAF50')),
+        ('TEXTCOLOR', (0, 0), (0, 0), colors.HexColor('#FFFFFF')),
+        ('FONTNAME', (0, 0), (0, 0), report_fonts.regular),
+        ('TEXTCOLOR', (1, 0), (1, 0), colors.HexColor('#4F4F4F')),
+        ('LINEBEFORE', (0, 0), (-1, -1), 0.25, grid_color),
+        ('LINEAFTER', (-1, 0), (-1, -1), 0.25, grid_color),
+    ]
+    if is_first:
+        commands.append(('LINEABOVE', (0, 0), (-1, 0), 0.25, grid_color))
+    if is_last:
+        commands.append(('LINEBELOW', (0, 0), (-1, 0), 0.25, grid_color))
+    return TableStyle(commands)
+
+def notes_section_flowables(title, rows, doc):
+    """Builds a two-column notes section (green labels, wrapped notes) that can flow across pages.
+
+    ``rows`` is a list of (label, text) pairs. Each text is split with split_notes and
+    every chunk becomes its own one-row table, so page breaks can fall between chunks.
+    """
+    col_widths = [doc.width * NOTES_LABEL_WIDTH, doc.width * (1 - NOTES_LABEL_WIDTH)]
+    flowables = [_section_heading(title, doc)]
+    for label, text in rows:
+        chunks = split_notes(text)
+        for index, chunk in enumerate(chunks):
+            chunk_table = Table(
+                [[label if index == 0 else '', Paragraph(chunk, _styles['CombinedBodyText'])]],
+                colWidths=col_widths,
+            )
+            chunk_table.setStyle(_notes_chunk_style(index == 0, index == len(chunks) - 1, len(chunks) == 1))
+            flowables.append(chunk_table)
+    return flowables
+
+# --- Progression Charts ---
+# Drawn with ReportLab graphics from a report's progression rows. Charts are expanded into
+# plain shapes once per distinct series and kept in an LRU cache; each render wraps the
+# cached shapes in a fresh Drawing, since a flowable cannot be drawn by two threads at once.
+
+PROGRESSION_MAX_POINTS = 12 # Most recent periods shown
+PROGRESSION_CHART_HEIGHT = 160
+PROGRESSION_CHART_CACHE_SIZE = 256
+PROGRESSION_COLORS = (colors.HexColor('#4CAF50'), colors.HexColor('#1a5276'))
+
+def progression_label(point):
+    """Short MM/YY label for a period, from its start (or end) date."""
+    period = point.period_start or point.period_end
+    try:
+        return datetime.strptime(period, '%Y-%m-%d').strftime('%m/%y')
+    except (ValueError, TypeError):
+        return period or '?'
+
+def progression_rows(series):
+    """(label, (minutes, goals per 90, assists per 90)) per period, as used by the report sections."""
+    return [
+        (progression_label(point), (point.minutes, per_90(point.goals, point.minutes), per_90(point.assists, point.minutes)))
+        for point in series
+    ]
+
+def _style_category_axis(axis, labels, font_name):
+    axis.categoryNames = labels
+    axis.labels.fontName = font_name
+    axis.labels.fontSize = 7
+    if len(labels) > 6:
+        axis.labels.angle = 30
+        axis.labels.boxAnchor = 'ne'
+
+@lru_cache(maxsize=PROGRESSION_CHART_CACHE_SIZE)
+def progression_chart_shapes(rows, width, font_name, bold_font_name):
+    """Goals/assists per 90 beside minutes per period, expanded into a Group of plain shapes."""
+    labels = [label for label, _ in rows]
+    half = width / 2
+    chart_height = PROGRESSION_CHART_HEIGHT - 60
+    shapes = Group()
+
+    rates = HorizontalLineChart()
+    rates.x, rates.y, rates.width, rates.height = 30, 35, half - 50, chart_height
+    rates.data = [[values[1] or 0 for _, values in rows], [values[2] or 0 for _, values in rows]]
+    rates.joinedLines = 1
+    rates.valueAxis.valueMin = 0
+    rates.valueAxis.labels.fontName = font_name
+    rates.valueAxis.labels.fontSize = 7
+    _style_category_axis(rates.categoryAxis, labels, font_name)
+    for index, color in enumerate(PROGRESSION_COLORS):
+        rates.lines[index].strokeColor = color
+        rates.lines[index].strokeWidth = 1.5
+    shapes.add(rates.draw())
+
+    legend = Legend()
+    legend.x, legend.y = half - 110, PROGRESSION_CHART_HEIGHT - 12
+    legend.alignment = 'right'
+    legend.columnMaximum = 1
+    legend.fontName = font_name
+    legend.fontSize = 7
+    legend.colorNamePairs = list(zip(PROGRESSION_COLORS, ['Goals', 'Assists']))
+    shapes.add(legend.draw())
+    shapes.add(String(30, PROGRESSION_CHART_HEIGHT - 15, 'Per 90 Minutes', fontName=bold_font_name, fontSize=10))
+
+    minutes = VerticalBarChart()
+    minutes.x, minutes.y, minutes.width, minutes.height = half + 30, 35, half - 40, chart_height
+    minutes.data = [[values[0] for _, values in rows]]
+    minutes.valueAxis.valueMin = 0
+    minutes.valueAxis.labels.fontName = font_name
+    minutes.valueAxis.labels.fontSize = 7
+    minutes.bars[0].fillColor = PROGRESSION_COLORS[0]
+    minutes.bars[0].strokeColor = None
+    _style_category_axis(minutes.categoryAxis, labels, font_name)
+    shapes.add(minutes.draw())
+    shapes.add(String(half + 30, PROGRESSION_CHART_HEIGHT - 15, 'Minutes Played', fontName=bold_font_name, fontSize=10))
+    return shapes
+
+def progression_drawing(rows, width):
+    drawing = Drawing(width, PROGRESSION_CHART_HEIGHT)
+    drawing.add(progression_chart_shapes(tuple(rows), width, report_fonts.regular, report_fonts.bold))
+    return drawing
+
+# --- Report Sections ---
+# The content of a detailed player report and a match report, as a list of sections
+# (layout, heading, rows) with rows of (label, value) pairs. The PDF renderers and the HTML
+# preview are both built from these lists, so the two always show the same fields.
+# Layouts: 'vitals' lays the pairs out two per row, 'table' one per row, and 'notes' is a
+# splittable notes section (see notes_section_flowables). 'progression' rows hold
+# (period label, (minutes, goals per 90, assists per 90)) and become charts in the PDF.
+
+def player_report_sections(player_obj, series=None):
+    """Sections of a detailed player report. ``series`` is the profile's progression series,
+    looked up if not given; unsaved reports and reports with fewer than two periods get no charts.
+    """
+    profile_id = getattr(player_obj, 'profile_id', None)
+    if series is None and profile_id is not None:
+        series = progression_series([profile_id])[profile_id]
+    progression = report_progression(player_obj, series or [])
+    sections = [
+        ('vitals', 'Player Profile', [
+            ('Player Name:', player_obj.player_name or ''), ('Jersey Number:', player_obj.jersey_number or ''),
+            ("Coach's Name:", player_obj.coach_name or ''), ('Current Team:', player_obj.player_team or ''),
+            ('Position:', player_obj.position or ''), ('Other Positions:', player_obj.primary_positions or ''),
+            ('Sub Team:', player_obj.sub_team or ''), ('Date of Birth:', format_date_dmy(player_obj.dob)),
+            ('Height (cm):', f"{player_obj.height or ''}"), ('Weight (kg):', f"{player_obj.weight or ''}"),
+            ('Preferred Foot:', player_obj.preferred_foot or ''),
+            ('Reporting Period:', f"{format_date_dmy(player_obj.report_period_start)} - {format_date_dmy(player_obj.report_period_end)}"),
+        ]),
+        ('table', 'Performance Overview (Objective Metrics)', [
+            ('Matches Played:', player_obj.matches_played or ''),
+            ('Total Minutes:', player_obj.total_minutes_played or ''),
+            ('Goals:', player_obj.goals or ''),
+            ('Assists:', player_obj.assists or ''),
+        ]),
+    ]
+    if len(progression) >= 2:
+        sections.append(('progression', 'Progression', progression_rows(progression)))
+    sections += [
+        ('notes', 'Player Assessment (4-Corner Model)', [
+            ('Technical / Tactical:', player_obj.technical_tactical_notes),
+            ('Physical Attributes:', player_obj.physical_notes),
+            ('Psychological:', player_obj.psychological_notes),
+            ('Social:', player_obj.social_notes),
+        ]),
+        ('notes', 'Development & Action Plan', [
+            ('Performance Summary:', player_obj.overall_performance_summary),
+            ('Key Strengths:', player_obj.key_strengths_exhibited),
+            ('Areas for Improvement:', player_obj.primary_areas_development),
+            ('Recommended Plan:', player_obj.recommended_action_plan),
+        ]),
+    ]
+    return sections
+
+def match_report_sections(match_obj):
+    score_home = match_obj.final_score_home if match_obj.final_score_home is not None else 'N/A'
+    score_away = match_obj.final_score_away if match_obj.final_score_away is not None else 'N/A'
+    return [
+        ('table', 'Match Information', [
+            ('Competition:', match_obj.competition or ''),
+            ('Season:', match_obj.season or ''),
+            ('Match Date:', format_date_dmy(match_obj.match_date)),
+            ('Venue:', match_obj.venue or ''),
+            ('Home Team:', match_obj.home_team or ''),
+            ('Away Team:', match_obj.away_team or ''),
+            ('Final Score:', f"{score_home} - {score_away}"),
+        ]),
+        ('notes', 'Team & Player Setup', [
+            ('Home Team Formation:', match_obj.home_formation_initial),
+            ('Home Team Lineup Notes:', match_obj.home_lineup_notes),
+            ('Away Team Formation:', match_obj.away_formation_initial),
+            ('Away Team Lineup Notes:', match_obj.away_lineup_notes),
+        ]),
+        ('notes', 'Tactical Analysis', [
+            ('Home Team - Attacking Phase:', match_obj.home_attacking_phase),
+            ('Home Team - Defensive Phase:', match_obj.home_defensive_phase),
+            ('Home Team - Transitional Play:', match_obj.home_key_transitions),
+            ('Away Team - Attacking Phase:', match_obj.away_attacking_phase),
+            ('Away Team - Defensive Phase:', match_obj.away_defensive_phase),
+            ('Away Team - Transitional Play:', match_obj.away_key_transitions),
+        ]),
+        ('notes', 'Match Summary & Insights', [
+            ('Overall Match Summary:', match_obj.overall_match_summary),
+            ('Key Turning Point(s):', match_obj.key_turning_points),
+            ('Man of the Match:', match_obj.man_of_the_match),
+            ('Final Notes:', match_obj.final_analyst_notes),
+        ]),
+    ]
+
+# Report title and section builder for each kind of report (see REPORT_MODELS)
+REPORT_SECTIONS = {
+    'player': ('Player Performance Report', player_report_sections),
+    'match': ('Match Performance Report', match_report_sections),
+}
 
-    # --- Reusable Style for all 2-column tables ---
-    notes_table_style = TableStyle([
+# --- PDF Generation Functions ---
+
+def _label_table_style():
+    """Two-column table: heading row, then green labels beside their values."""
+    return TableStyle([
+        ('FONTNAME', (0, 0), (-1, -1), report_fonts.regular),
         ('LEFTPADDING', (0, 0), (-1, -1), 10),
         ('RIGHTPADDING', (0, 0), (-1, -1), 10),
         ('TOPPADDING', (0, 0), (-1, -1), 8),
@@ -297,19 +1512,21 @@ def create_detailed_player_report_pdf(player_obj, logo_path=None):
         ('VALIGN', (1, 1), (1, -1), 'TOP'),    # Top-aligns the second column (notes)
         ('SPAN', (0, 0), (-1, 0)),
         ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (0, 0), report_fonts.bold),
         ('FONTSIZE', (0, 0), (0, 0), 16),
         ('TEXTCOLOR', (0, 0), (0, 0), colors.HexColor('#212121')),
         ('BOTTOMPADDING', (0, 0), (-1, 0), 16),
         ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#4CAF50')),
         ('TEXTCOLOR', (0, 1), (0, -1), colors.HexColor('#FFFFFF')),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica'),
+        ('FONTNAME', (0, 1), (0, -1), report_fonts.regular),
         ('GRID', (0, 1), (-1, -1), 0.25, colors.HexColor('#A3CA9B')),
         ('TEXTCOLOR', (1, 1), (1, -1), colors.HexColor('#4F4F4F')),
     ])
 
-    # --- Style for the 4-column Vitals table ---
-    vitals_table_style = TableStyle([
+def _vitals_table_style():
+    """Four-column table: heading row, then two label/value pairs per row."""
+    return TableStyle([
+        ('FONTNAME', (0, 0), (-1, -1), report_fonts.regular),
         ('LEFTPADDING', (0, 0), (-1, -1), 10),
         ('RIGHTPADDING', (0, 0), (-1, -1), 10),
         ('TOPPADDING', (0, 0), (-1, -1), 8),
@@ -318,170 +1535,992 @@ def create_detailed_player_report_pdf(player_obj, logo_path=None):
         ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#4F4F4F')),
         ('SPAN', (0, 0), (-1, 0)),
         ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (0, 0), report_fonts.bold),
         ('FONTSIZE', (0, 0), (0, 0), 16),
         ('TEXTCOLOR', (0, 0), (0, 0), colors.HexColor('#212121')),
         ('BOTTOMPADDING', (0, 0), (-1, 0), 16),
-        ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#4CAF50')), 
+        ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#4CAF50')),
         ('BACKGROUND', (2, 1), (2, -1), colors.HexColor('#4CAF50')),
-        ('TEXTCOLOR', (0, 1), (0, -1), colors.HexColor('#FFFFFF')), 
+        ('TEXTCOLOR', (0, 1), (0, -1), colors.HexColor('#FFFFFF')),
         ('TEXTCOLOR', (2, 1), (2, -1), colors.HexColor('#FFFFFF')),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica'),
-        ('FONTNAME', (2, 1), (2, -1), 'Helvetica'),
+        ('FONTNAME', (0, 1), (0, -1), report_fonts.regular),
+        ('FONTNAME', (2, 1), (2, -1), report_fonts.regular),
         ('GRID', (0, 1), (-1, -1), 0.25, colors.HexColor('#A3CA9B')),
     ])
 
-    elements.append(Paragraph("Player Performance Report", _styles['MyCenteredTitle']))
-    elements.append(Spacer(1, 0.3 * inch))
-
-    # --- Section 1: Player Profile ---
-    vitals_data = [
-        ["Player Profile"],
-        ['Player Name:', player_obj.player_name or '', 'Jersey Number:', player_obj.jersey_number or ''],
-        ["Coach's Name:", player_obj.coach_name or '', 'Current Team:', player_obj.player_team or ''],
-        ['Position:', player_obj.position or '', 'Other Positions:', player_obj.primary_positions or ''],
-        ['Sub Team:', player_obj.sub_team or '', 'Date of Birth:', format_date_dmy(player_obj.dob)],
-        ['Height (cm):', f"{player_obj.height or ''}", 'Weight (kg):', f"{player_obj.weight or ''}"],
-        ['Preferred Foot:', player_obj.preferred_foot or '', 'Reporting Period:', f"{format_date_dmy(player_obj.report_period_start)} - {format_date_dmy(player_obj.report_period_end)}"]
-    ]
+def report_flowables(title, sections, doc):
+    """Lays out a report title and its sections (see Report Sections) as flowables."""
+    elements = [Paragraph(title, _styles['MyCenteredTitle']), Spacer(1, 0.3 * inch)]
+    for index, (layout, heading, rows) in enumerate(sections):
+        if index:
+            elements.append(Spacer(1, 0.2 * inch))
+        if layout == 'notes':
+            elements.extend(notes_section_flowables(heading, rows, doc))
+        elif layout == 'progression':
+            elements.extend([_section_heading(heading, doc), progression_drawing(rows, doc.width)])
+        elif layout == 'vitals':
+            data = [[heading]] + [[*rows[i], *rows[i + 1]] for i in range(0, len(rows), 2)]
+            table = Table(data, colWidths=[doc.width*0.16, doc.width*0.34, doc.width*0.16, doc.width*0.34], splitByRow=1)
+            table.setStyle(_vitals_table_style())
+            elements.append(table)
+        else:
+            table = Table([[heading]] + [list(row) for row in rows], colWidths=[doc.width*0.3, doc.width*0.7], splitByRow=1)
+            table.setStyle(_label_table_style())
+            elements.append(table)
+    return elements
 
-    vitals_table = Table(vitals_data, colWidths=[doc.width*0.16, doc.width*0.34, doc.width*0.16, doc.width*0.34], splitByRow=1)
-    vitals_table.setStyle(vitals_table_style)
-    elements.append(vitals_table)
-    elements.append(Spacer(1, 0.2 * inch))
-    
-    # --- Section 2: Performance Overview (Objective Metrics) ---
-    snapshot_data = [
-        ["Performance Overview (Objective Metrics)"],
-        ['Matches Played:', player_obj.matches_played or ''],
-        ['Total Minutes:', player_obj.total_minutes_played or ''],
-        ['Goals:', player_obj.goals or ''],
-        ['Assists:', player_obj.assists or '']
-    ]
-    snapshot_table = Table(snapshot_data, colWidths=[doc.width*0.3, doc.width*0.7], splitByRow=1)
-    snapshot_table.setStyle(notes_table_style)
-    elements.append(snapshot_table)
-    elements.append(Spacer(1, 0.2 * inch))
-
-    # --- Section 3: Player Assessment (4-Corner Model) ---
-    assessment_data = [
-        ["Player Assessment (4-Corner Model)"],
-        ['Technical / Tactical:', Paragraph(str(player_obj.technical_tactical_notes or ''), _styles['CombinedBodyText'])],
-        ['Physical Attributes:',  Paragraph(str(player_obj.physical_notes or ''), _styles['CombinedBodyText'])],
-        ['Psychological:',        Paragraph(str(player_obj.psychological_notes or ''), _styles['CombinedBodyText'])],
-        ['Social:',  Paragraph(str(player_obj.social_notes or ''), _styles['CombinedBodyText'])]
-    ]
-    assessment_table = Table(assessment_data, colWidths=[doc.width*0.3, doc.width*0.7], splitByRow=1)
-    assessment_table.setStyle(notes_table_style)
-    elements.append(assessment_table)
-    elements.append(Spacer(1, 0.2 * inch))
-
-    # --- Section 4: Development & Action Plan ---
-    development_data = [
-        ["Development & Action Plan"],
-        ['Performance Summary:',   Paragraph(str(player_obj.overall_performance_summary or ''), _styles['CombinedBodyText'])],
-        ['Key Strengths:',         Paragraph(str(player_obj.key_strengths_exhibited or ''), _styles['CombinedBodyText'])],
-        ['Areas for Improvement:', Paragraph(str(player_obj.primary_areas_development or ''), _styles['CombinedBodyText'])],
-        ['Recommended Plan:', Paragraph(str(player_obj.recommended_action_plan or ''), _styles['CombinedBodyText'])]
-    ]
-    development_table = Table(development_data, colWidths=[doc.width*0.3, doc.width*0.7], splitByRow=1)
-    development_table.setStyle(notes_table_style)
-    elements.append(development_table)
+def create_detailed_player_report_pdf(player_obj, logo_path=None):
+    """Creates the full PDF with final alignment and styling applied to all sections."""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=0.75*inch, leftMargin=0.75*inch, topMargin=1.0*inch, bottomMargin=0.75*inch, invariant=app.config['DETERMINISTIC_PDF'], pageCompression=pdf_output_profile()['page_compression'])
+    elements = detailed_player_report_flowables(player_obj, doc)
 
-    doc.build(elements, onFirstPage=lambda c, d: (draw_header(c, d, logo_path), draw_footer(c, d)), onLaterPages=lambda c, d: (draw_header(c, d, logo_path), draw_footer(c, d)))
+    on_page = report_page_callback(player_obj, logo_path)
+    doc.build(elements, onFirstPage=on_page, onLaterPages=on_page)
     buffer.seek(0)
     return buffer
 
+def detailed_player_report_flowables(player_obj, doc, series=None):
+    """The story of a detailed player report, shared by the single report and the season booklet."""
+    return report_flowables(REPORT_SECTIONS['player'][0], player_report_sections(player_obj, series), doc)
+
 def create_match_report_pdf(match_obj, club_name, logo_path=None):
     """Creates the PDF for a match report with all final visual and alignment adjustments."""
     buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=0.75*inch, leftMargin=0.75*inch, topMargin=1.0*inch, bottomMargin=0.75*inch)
-    elements = []
+    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=0.75*inch, leftMargin=0.75*inch, topMargin=1.0*inch, bottomMargin=0.75*inch, invariant=app.config['DETERMINISTIC_PDF'], pageCompression=pdf_output_profile()['page_compression'])
+    elements = report_flowables(REPORT_SECTIONS['match'][0], match_report_sections(match_obj), doc)
 
-    # --- Reusable Style for all 2-column tables in this report ---
-    notes_table_style = TableStyle([
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('VALIGN', (0, 1), (0, -1), 'MIDDLE'), # Middle-aligns the first column (labels)
-        ('VALIGN', (1, 1), (1, -1), 'TOP'),    # Top-aligns the second column (notes)
-        ('SPAN', (0, 0), (-1, 0)),
-        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (0, 0), 16),
-        ('TEXTCOLOR', (0, 0), (0, 0), colors.HexColor('#212121')),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 16),
-        ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#4CAF50')),
-        ('TEXTCOLOR', (0, 1), (0, -1), colors.HexColor('#FFFFFF')),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica'),
-        ('GRID', (0, 1), (-1, -1), 0.25, colors.HexColor('#A3CA9B')),
-        ('TEXTCOLOR', (1, 1), (1, -1), colors.HexColor('#4F4F4F')),
-    ])
+    on_page = report_page_callback(match_obj, logo_path)
+    doc.build(elements, onFirstPage=on_page, onLaterPages=on_page)
+    buffer.seek(0)
+    return buffer
 
-    elements.append(Paragraph("Match Performance Report", _styles['MyCenteredTitle']))
-    elements.append(Spacer(1, 0.3 * inch))
-
-    # --- Section 1: Match Vitals ---
-    vitals_data = [
-        ["Match Information"],
-        ['Competition:', match_obj.competition or ''],
-        ['Season:', match_obj.season or ''],
-        ['Match Date:', format_date_dmy(match_obj.match_date)],
-        ['Venue:', match_obj.venue or ''],
-        ['Home Team:', match_obj.home_team or ''],
-        ['Away Team:', match_obj.away_team or ''],
-        ['Final Score:', f"{match_obj.final_score_home if match_obj.final_score_home is not None else 'N/A'} - {match_obj.final_score_away if match_obj.final_score_away is not None else 'N/A'}"]
+# --- PDF Render Admission ---
+# Rendering is CPU-bound, so one club bulk-submitting reports could otherwise occupy every
+# worker thread. Each render takes a slot; a club may hold at most RENDER_MAX_PER_CLUB slots,
+# waiting clubs are served round-robin, and a club whose queue is full gets a 429.
+
+class RenderBusy(Exception):
+    """Raised when a club is over its share of render capacity."""
+
+    def __init__(self, retry_after):
+        super().__init__(f'Render capacity exhausted, retry after {retry_after}s')
+        self.retry_after = retry_after
+
+
+class RenderAdmission:
+    """Fair per-club admission control for PDF rendering within one worker process."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._running = 0
+        self._active = defaultdict(int)     # club_id -> renders in progress
+        self._waiting = defaultdict(deque)  # club_id -> queued tickets, oldest first
+        self._turns = deque()               # clubs with queued tickets, in round-robin order
+        self._avg_render_seconds = 1.0
+        self.stats = defaultdict(lambda: {'admitted': 0, 'rejected': 0, 'wait_seconds': 0.0, 'render_seconds': 0.0})
+
+    def _next_club(self, max_per_club):
+        """Returns the first club in round-robin order that is allowed another render."""
+        return next((club_id for club_id in self._turns if self._active[club_id] < max_per_club), None)
+
+    def _retry_after(self, club_id, max_per_club):
+        backlog = len(self._waiting[club_id]) + self._active[club_id]
+        return max(1, math.ceil(self._avg_render_seconds * backlog / max(max_per_club, 1)))
+
+    def _acquire(self, club_id, config):
+        max_running = config['RENDER_MAX_CONCURRENCY']
+        max_per_club = config['RENDER_MAX_PER_CLUB']
+        queued_at = time.monotonic()
+        with self._cond:
+            if self._running < max_running and self._active[club_id] < max_per_club and self._next_club(max_per_club) is None:
+                self._admit(club_id, queued_at)
+                return
+
+            queue = self._waiting[club_id]
+            if len(queue) >= config['RENDER_MAX_QUEUED_PER_CLUB']:
+                self.stats[club_id]['rejected'] += 1
+                raise RenderBusy(self._retry_after(club_id, max_per_club))
+
+            ticket = object()
+            queue.append(ticket)
+            if club_id not in self._turns:
+                self._turns.append(club_id)
+
+            deadline = queued_at + config['RENDER_QUEUE_TIMEOUT']
+            while not (self._running < max_running and queue[0] is ticket and self._next_club(max_per_club) == club_id):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    queue.remove(ticket)
+                    if not queue:
+                        self._turns.remove(club_id)
+                    self.stats[club_id]['rejected'] += 1
+                    self._cond.notify_all()
+                    raise RenderBusy(self._retry_after(club_id, max_per_club))
+                self._cond.wait(remaining)
+
+            queue.popleft()
+            self._turns.remove(club_id)
+            if queue:
+                self._turns.append(club_id) # Back of the line so other clubs get the next turn
+            self._admit(club_id, queued_at)
+
+    def _admit(self, club_id, queued_at):
+        self._running += 1
+        self._active[club_id] += 1
+        self.stats[club_id]['admitted'] += 1
+        self.stats[club_id]['wait_seconds'] += time.monotonic() - queued_at
+
+    def _release(self, club_id, render_seconds):
+        with self._cond:
+            self._running -= 1
+            self._active[club_id] -= 1
+            self.stats[club_id]['render_seconds'] += render_seconds
+            self._avg_render_seconds = 0.8 * self._avg_render_seconds + 0.2 * render_seconds
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, club_id, config):
+        """Holds a render slot for the club for the duration of the block, raising RenderBusy if none is available."""
+        self._acquire(club_id, config)
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(club_id, time.monotonic() - started_at)
+
+    def snapshot(self):
+        """Returns per-club queue depth, active renders and counters for the metrics endpoint."""
+        with self._cond:
+            club_ids = set(self.stats) | set(self._waiting) | set(self._active)
+            return {
+                club_id: dict(self.stats[club_id], queued=len(self._waiting.get(club_id, ())), active=self._active.get(club_id, 0))
+                for club_id in sorted(club_ids)
+            }
+
+
+render_admission = RenderAdmission()
+
+
+class ReportSizeStats:
+    """Per-worker counters of rendered PDF sizes, keyed by report kind."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats = defaultdict(lambda: {'renders': 0, 'bytes': 0, 'last_bytes': 0, 'max_bytes': 0, 'over_budget': 0})
+
+    def observe(self, kind, size, budget):
+        """Records one render and returns True if it went over the budget."""
+        over_budget = budget is not None and size > budget
+        with self._lock:
+            stats = self.stats[kind]
+            stats['renders'] += 1
+            stats['bytes'] += size
+            stats['last_bytes'] = size
+            stats['max_bytes'] = max(stats['max_bytes'], size)
+            stats['over_budget'] += over_budget
+        return over_budget
+
+    def snapshot(self):
+        with self._lock:
+            return {kind: dict(values) for kind, values in sorted(self.stats.items())}
+
+
+report_sizes = ReportSizeStats()
+
+def report_kind(renderer):
+    """Metric label for a renderer, e.g. create_match_report_pdf -> match_report."""
+    return renderer.__name__.removeprefix('create_').removesuffix('_pdf')
+
+def render_pdf(renderer, *args, logo_path=None, budget_sections=1):
+    """Runs a PDF renderer inside one of the current club's render slots.
+
+    Nothing is flushed while it waits or renders: a flush would begin a write
+    transaction and hold the SQLite write lock until the caller commits, so the
+    routes pass unsaved records with created_at and club set in Python instead.
+
+    If the club is over its share the uploaded logo is discarded and RenderBusy
+    propagates to the 429 error handler. The output size is recorded and logged
+    if it is over the profile's budget, which is per report, so documents made of
+    several reports pass how many they hold as budget_sections.
+    """
+    try:
+        with render_admission.slot(current_user.club.id, app.config), db.session.no_autoflush:
+            pdf_buffer = renderer(*args, logo_path)
+    except RenderBusy:
+        if logo_path and os.path.exists(logo_path):
+            os.remove(logo_path)
+        raise
+
+    pdf_buffer.seek(0, io.SEEK_END)
+    size, budget = pdf_buffer.tell(), pdf_size_budget()
+    pdf_buffer.seek(0)
+    if budget is not None:
+        budget *= budget_sections
+    if report_sizes.observe(report_kind(renderer), size, budget):
+        app.logger.warning(
+            '%s for club %s is %d bytes, over the %d byte budget of the %r PDF profile',
+            report_kind(renderer), current_user.club.id, size, budget, app.config['PDF_OUTPUT_PROFILE'],
+        )
+    return pdf_buffer
+
+# --- Versioned Report Storage ---
+# Every rendered PDF is written once to the report storage, keyed by its sha256 and sharded
+# as blobs/<first 2 hex>/<sha256>.pdf. Player and Match rows keep a list of ReportVersion
+# entries pointing at those blobs, so re-rendering identical bytes costs nothing and old
+# versions stay available. Content keys never collide and need no clock or coordination,
+# so several app nodes can share one store.
+
+class ReportStorage(ABC):
+    """A place to keep PDF blobs, addressed by the sha256 of their bytes."""
+
+    @staticmethod
+    def relative_path(key):
+        return f'blobs/{key[:2]}/{key}.pdf'
+
+    @abstractmethod
+    def put(self, key, data):
+        """Stores the blob, replacing any existing one under the key."""
+
+    @abstractmethod
+    def open(self, key):
+        """Returns a readable binary file for the blob, or raises FileNotFoundError."""
+
+    @abstractmethod
+    def exists(self, key):
+        """Whether a blob is stored under the key."""
+
+    @abstractmethod
+    def delete(self, key):
+        """Removes the blob; a missing blob is not an error."""
+
+    @abstractmethod
+    def keys(self):
+        """Yields the key of every stored blob."""
+
+    def local_path(self, key):
+        """Path of the blob on this machine's disk, or None if it has to be read with open()."""
+        return None
+
+
+class LocalReportStorage(ReportStorage):
+    """Blobs kept under a directory on the local disk."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, key):
+        return os.path.join(self.root, *self.relative_path(key).split('/'))
+
+    def put(self, key, data):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def open(self, key):
+        return open(self.path(key), 'rb')
+
+    def exists(self, key):
+        return os.path.exists(self.path(key))
+
+    def delete(self, key):
+        if os.path.exists(self.path(key)):
+            os.remove(self.path(key))
+
+    def keys(self):
+        for root, _, names in os.walk(os.path.join(self.root, 'blobs')):
+            for name in names:
+                if name.endswith('.pdf'):
+                    yield name[:-len('.pdf')]
+
+    def local_path(self, key):
+        path = self.path(key)
+        return path if os.path.exists(path) else None
+
+
+class S3ReportStorage(ReportStorage):
+    """Blobs kept in an S3 bucket, or on any S3-compatible server given by endpoint_url."""
+
+    def __init__(self, bucket, prefix='', endpoint_url=None):
+        if boto3 is None:
+            raise RuntimeError('REPORT_STORAGE=s3 needs boto3: pip install -r requirements-s3.txt')
+        if not bucket:
+            raise RuntimeError('REPORT_STORAGE=s3 needs REPORT_S3_BUCKET set.')
+        self.client = boto3.client('s3', endpoint_url=endpoint_url)
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def object_key(self, key):
+        return self.prefix + self.relative_path(key)
+
+    def put(self, key, data):
+        self.client.put_object(Bucket=self.bucket, Key=self.object_key(key), Body=data, ContentType='application/pdf')
+
+    def open(self, key):
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=self.object_key(key))['Body']
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                raise FileNotFoundError(key) from e
+            raise
+
+    def exists(self, key):
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.object_key(key))
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+        return True
+
+    def delete(self, key):
+        self.client.delete_object(Bucket=self.bucket, Key=self.object_key(key))
+
+    def keys(self):
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix + 'blobs/'):
+            for item in page.get('Contents', []):
+                name = item['Key'].rsplit('/', 1)[-1]
+                if name.endswith('.pdf'):
+                    yield name[:-len('.pdf')]
+
+
+_s3_report_storages = {}
+
+def report_storage(config=None, kind=None):
+    """The report storage configured by REPORT_STORAGE (or the given kind)."""
+    config = config or app.config
+    kind = kind or config['REPORT_STORAGE']
+    if kind == 'local':
+        return LocalReportStorage(config['REPORT_FOLDER'])
+    if kind == 's3':
+        settings = (config['REPORT_S3_BUCKET'], config['REPORT_S3_PREFIX'], config['REPORT_S3_ENDPOINT_URL'])
+        if settings not in _s3_report_storages:
+            _s3_report_storages[settings] = S3ReportStorage(*settings)
+        return _s3_report_storages[settings]
+    raise RuntimeError(f'Unknown REPORT_STORAGE {kind!r}; expected local or s3.')
+
+def new_report_name(*parts):
+    """Download name for a new report, made unique with a random suffix rather than the time."""
+    return '_'.join([*parts, uuid.uuid4().hex]) + '.pdf'
+
+# Fields that identify a report row rather than describe it; they are not part of a version snapshot.
+SNAPSHOT_EXCLUDED_FIELDS = {'id', 'pdf_report_path', 'created_at', 'club_id', 'profile_id'}
+
+REPORT_MODELS = {'player': Player, 'match': Match}
+
+def store_report_blob(data):
+    """Stores PDF bytes in the content-addressed blob store and returns the (possibly existing) ReportBlob."""
+    sha256 = hashlib.sha256(data).hexdigest()
+    storage = report_storage()
+    if not storage.exists(sha256):
+        storage.put(sha256, data)
+
+    blob = db.session.get(ReportBlob, sha256)
+    if blob is None:
+        blob = ReportBlob(sha256=sha256, size=len(data))
+        db.session.add(blob)
+    return blob
+
+def report_snapshot(report):
+    """Serializes the descriptive columns of a Player or Match row to JSON.
+
+    A player report's snapshot also carries its profile fields, as they were when it was rendered.
+    """
+    fields = {
+        column.name: getattr(report, column.name)
+        for column in report.__table__.columns
+        if column.name not in SNAPSHOT_EXCLUDED_FIELDS
+    }
+    if isinstance(report, Player):
+        fields.update((field, getattr(report, field)) for field in PLAYER_PROFILE_FIELDS)
+    return json.dumps(fields, sort_keys=True)
+
+def record_report_version(report, pdf_buffer, note):
+    """Adds the rendered PDF as the newest version of a Player or Match report."""
+    blob = store_report_blob(pdf_buffer.getvalue())
+    next_version = max((v.version for v in report.versions), default=0) + 1
+    version = ReportVersion(
+        version=next_version,
+        blob=blob,
+        snapshot=report_snapshot(report),
+        note=note,
+        created_by_id=current_user.id,
+    )
+    report.versions.append(version)
+    return version
+
+def send_report_blob(sha256, download_name):
+    """Sends a stored PDF as a download, streaming it from the storage backend if it is not on local disk."""
+    storage = report_storage()
+    path = storage.local_path(sha256)
+    if path is not None:
+        return send_file(path, mimetype='application/pdf', as_attachment=True, download_name=download_name)
+    try:
+        stream = storage.open(sha256)
+    except FileNotFoundError:
+        abort(404)
+    return send_file(stream, mimetype='application/pdf', as_attachment=True, download_name=download_name, etag=sha256)
+
+def prune_unreferenced_blobs(sha256s):
+    """Deletes blob rows no ReportVersion points to any more and returns their keys.
+
+    Call after the deleting flush, and only remove the returned blobs once the
+    transaction has been committed.
+    """
+    orphaned_keys = []
+    for sha256 in set(sha256s):
+        if ReportVersion.query.filter_by(blob_sha256=sha256).first():
+            continue
+        blob = db.session.get(ReportBlob, sha256)
+        if blob is not None:
+            db.session.delete(blob)
+        orphaned_keys.append(sha256)
+    return orphaned_keys
+
+def remove_report_blobs(sha256s):
+    """Best-effort removal of blobs from the report storage, flashing any errors."""
+    storage = report_storage()
+    for sha256 in sha256s:
+        try:
+            storage.delete(sha256)
+        except (OSError, RuntimeError) as e:
+            flash(f'Error deleting PDF report file: {e}', 'danger')
+
+def remove_report_files(paths):
+    """Best-effort removal of PDF files, flashing any filesystem errors."""
+    for path in paths:
+        if os.path.exists(path):
+            try:
+                os.remove(path)
+            except OSError as e:
+                flash(f'Error deleting PDF report file: {e}', 'danger')
+
+def get_club_report(kind, report_id):
+    """Loads a Player or Match owned by the current user's club, or aborts with 404."""
+    model = REPORT_MODELS.get(kind)
+    if model is None:
+        abort(404)
+    return db.session.query(model).filter_by(id=report_id, club_id=current_user.club.id).first_or_404()
+
+def report_list_endpoint(kind):
+    return 'list_players' if kind == 'player' else 'list_matches'
+
+# --- Share Links ---
+# A share link is a signed, timestamped token carrying the storage key of the report's PDF,
+# its club and a download name. ShareLinkMiddleware answers /share/<token>
+# in front of Flask: checking the signature and expiry needs only the secret, so no
+# session, user loading or database query is involved. Links pin the version that was
+# current when they were made, and stop working once that blob is deleted.
+
+SHARE_LINK_PREFIX = '/share/'
+SHARE_LINK_SALT = 'report-share-link'
+SHARE_LINK_DAYS = [1, 7, 30] # Choices offered when creating a link
+
+def share_link_serializer(config):
+    return URLSafeTimedSerializer(config['SHARE_LINK_SECRET'] or config['SECRET_KEY'], salt=SHARE_LINK_SALT)
+
+def create_share_token(report, days):
+    """Signs a token for the report's current PDF, valid for the given number of days."""
+    return share_link_serializer(app.config).dumps({
+        'key': report.versions[-1].blob_sha256, 'club_id': report.club_id, 'name': report.pdf_report_path, 'days': days,
+    })
+
+class ShareLinkMiddleware:
+    """WSGI middleware serving /share/<token> without entering the Flask app."""
+
+    def __init__(self, wsgi_app, flask_app):
+        self.wsgi_app = wsgi_app
+        self.flask_app = flask_app
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        if not path.startswith(SHARE_LINK_PREFIX):
+            return self.wsgi_app(environ, start_response)
+        return self.serve(path[len(SHARE_LINK_PREFIX):], environ)(environ, start_response)
+
+    def serve(self, token, environ):
+        config = self.flask_app.config
+        try:
+            payload, signed_at = share_link_serializer(config).loads(token, return_timestamp=True)
+        except BadSignature:
+            return WSGIResponse('Share link not found.', status=404, mimetype='text/plain')
+
+        days = min(payload['days'], config['SHARE_LINK_MAX_DAYS'])
+        if datetime.now(signed_at.tzinfo) - signed_at > timedelta(days=days):
+            return WSGIResponse('This share link has expired.', status=410, mimetype='text/plain')
+
+        storage = report_storage(config)
+        path = storage.local_path(payload['key'])
+        if path is not None:
+            # Relative report folders resolve against the app root, as with Flask's send_file
+            source = os.path.join(self.flask_app.root_path, path)
+        else:
+            try:
+                source = storage.open(payload['key'])
+            except FileNotFoundError:
+                return WSGIResponse('Share link not found.', status=404, mimetype='text/plain')
+
+        response = wsgi_send_file(source, environ, mimetype='application/pdf', download_name=payload['name'],
+                                  etag=payload['key'], max_age=3600)
+        response.headers['Cache-Control'] = 'private, max-age=3600'
+        response.headers['X-Robots-Tag'] = 'noindex'
+        return response
+
+
+app.wsgi_app = ShareLinkMiddleware(app.wsgi_app, app)
+
+# --- List Page Caching ---
+# List pages only change when the club's data_version does, so it makes a cheap ETag:
+# unchanged pages are answered with 304 before any list query runs. The rendered table
+# fragments can additionally be kept in a bounded in-memory LRU keyed on the same version.
+
+class FragmentCache:
+    """Bounded-size LRU of rendered HTML fragments."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key, render, max_bytes):
+        if max_bytes <= 0:
+            return render()
+
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                return html
+
+        html = render()
+        size = len(html.encode('utf-8'))
+        if size > max_bytes:
+            return html
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = html
+                self._size += size
+            while self._size > max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.encode('utf-8'))
+        return html
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+fragment_cache = FragmentCache()
+
+_templates_digest_cache = None
+
+def templates_digest():
+    """Hashes every template so a deploy that changes markup also changes list page ETags."""
+    global _templates_digest_cache
+    if _templates_digest_cache is None or app.jinja_env.auto_reload:
+        digest = hashlib.sha256()
+        for name in sorted(app.jinja_env.list_templates()):
+            digest.update(name.encode('utf-8'))
+            digest.update(app.jinja_env.loader.get_source(app.jinja_env, name)[0].encode('utf-8'))
+        _templates_digest_cache = digest.hexdigest()
+    return _templates_digest_cache
+
+def cached_fragment(template_name, data_version, load_context, extra_key=()):
+    """Renders a club-scoped template fragment through the fragment cache.
+
+    ``load_context`` returns the template context and is only called on a cache miss,
+    so a hit skips the list query as well as the rendering. ``extra_key`` tells apart
+    fragments of one template that show different rows, e.g. one report each.
+    """
+    key = (template_name, current_user.club.id, current_user.club.name, data_version, *extra_key)
+    html = fragment_cache.get_or_render(key, lambda: render_template(template_name, **load_context()), app.config['FRAGMENT_CACHE_MAX_BYTES'])
+    return Markup(html)
+
+def conditional_club_page(data_version, render):
+    """Serves a club-scoped page with an ETag derived from the club's data version.
+
+    ``render`` is only called when the client's copy is stale. Pages with pending
+    flash messages are always rendered so the messages are not held back.
+    """
+    etag = hashlib.sha256('|'.join([
+        templates_digest(), static_digest(), request.full_path, str(current_user.id), str(current_user.club.id), current_user.club.name, str(data_version),
+    ]).encode('utf-8')).hexdigest()[:32]
+
+    if request.if_none_match.contains_weak(etag) and not session.get('_flashes'):
+        response = Response(status=304)
+    else:
+        response = make_response(render())
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+# --- Club-Perspective Match Queries ---
+
+# How many of the most recent results make up the "form" column of the season summary.
+DEFAULT_FORM_LENGTH = 5
+MAX_FORM_LENGTH = 10
+
+def _club_result_columns(club_name):
+    """Builds the SQL expressions that describe a match from the club's point of view."""
+    is_home = func.lower(Match.home_team) == func.lower(club_name)
+    goals_for = case((is_home, Match.final_score_home), else_=Match.final_score_away)
+    goals_against = case((is_home, Match.final_score_away), else_=Match.final_score_home)
+    result = case(
+        (Match.final_score_home.is_(None) | Match.final_score_away.is_(None), null()),
+        (goals_for > goals_against, 'W'),
+        (goals_for == goals_against, 'D'),
+        else_='L',
+    )
+    return {
+        'opponent': case((is_home, Match.away_team), else_=Match.home_team).label('opponent'),
+        'venue_side': case((is_home, 'H'), else_='A').label('venue_side'),
+        'goals_for': goals_for.label('goals_for'),
+        'goals_against': goals_against.label('goals_against'),
+        'result': result.label('result'),
+    }
+
+def club_match_results_query(club_id, club_name):
+    """Returns a query over the club's matches with opponent, venue side, goals for/against and result computed in SQL.
+
+    Rows expose the Match entity as ``row.Match`` plus the labelled columns
+    ``opponent``, ``venue_side`` ('H'/'A'), ``goals_for``, ``goals_against`` and
+    ``result`` ('W'/'D'/'L', or NULL while either score is missing).
+    """
+    columns = _club_result_columns(club_name)
+    return db.session.query(Match, *columns.values()).filter(Match.club_id == club_id)
+
+def club_season_summary(club_id, club_name, season=None, form_length=DEFAULT_FORM_LENGTH):
+    """Aggregates W/D/L, goals for/against and recent form per season in one query.
+
+    Only matches with both scores recorded count towards the summary. Form is
+    returned most recent first, e.g. ``['W', 'W', 'D', 'L']``.
+    """
+    columns = _club_result_columns(club_name)
+    results = db.session.query(
+        Match.season.label('season'),
+        columns['goals_for'],
+        columns['goals_against'],
+        columns['result'],
+        func.row_number().over(
+            partition_by=Match.season,
+            order_by=(Match.match_date.desc(), Match.id.desc()),
+        ).label('recency'),
+    ).filter(
+        Match.club_id == club_id,
+        Match.final_score_home.isnot(None),
+        Match.final_score_away.isnot(None),
+    )
+    if season is not None:
+        results = results.filter(Match.season == season)
+    results = results.subquery()
+
+    form_columns = [
+        func.max(case((results.c.recency == position, results.c.result))).label(f'form_{position}')
+        for position in range(1, form_length + 1)
     ]
-    vitals_table = Table(vitals_data, colWidths=[doc.width*0.3, doc.width*0.7], splitByRow=1)
-    vitals_table.setStyle(notes_table_style) # Reusing the notes style works well here
-    elements.append(vitals_table)
-    elements.append(Spacer(1, 0.2 * inch))
-
-    # --- Section 2: Team & Player Setup ---
-    setup_data = [
-        ["Team & Player Setup"],
-        ['Home Team Formation:', Paragraph(str(match_obj.home_formation_initial or ''), _styles['CombinedBodyText'])],
-        ['Home Team Lineup Notes:', Paragraph(str(match_obj.home_lineup_notes or ''), _styles['CombinedBodyText'])],
-        ['Away Team Formation:', Paragraph(str(match_obj.away_formation_initial or ''), _styles['CombinedBodyText'])],
-        ['Away Team Lineup Notes:', Paragraph(str(match_obj.away_lineup_notes or ''), _styles['CombinedBodyText'])],
+    rows = db.session.query(
+        results.c.season,
+        func.count().label('played'),
+        func.sum(case((results.c.result == 'W', 1), else_=0)).label('won'),
+        func.sum(case((results.c.result == 'D', 1), else_=0)).label('drawn'),
+        func.sum(case((results.c.result == 'L', 1), else_=0)).label('lost'),
+        func.sum(results.c.goals_for).label('goals_for'),
+        func.sum(results.c.goals_against).label('goals_against'),
+        *form_columns,
+    ).group_by(results.c.season).order_by(results.c.season.desc()).all()
+
+    return [{
+        'season': row.season,
+        'played': row.played,
+        'won': row.won,
+        'drawn': row.drawn,
+        'lost': row.lost,
+        'goals_for': row.goals_for,
+        'goals_against': row.goals_against,
+        'goal_difference': row.goals_for - row.goals_against,
+        'points': row.won * 3 + row.drawn,
+        'form': [getattr(row, f'form_{position}') for position in range(1, form_length + 1) if getattr(row, f'form_{position}')],
+    } for row in rows]
+
+# --- One-Page Summary Report (drawn directly on the canvas) ---
+# The summary skips platypus entirely: every block has a fixed position, long text is
+# truncated rather than flowed, and the whole report is always exactly one page. That
+# makes it several times cheaper than the detailed report for bulk squad printouts.
+
+SUMMARY_GREEN = colors.HexColor('#4CAF50')
+SUMMARY_GRID = colors.HexColor('#A3CA9B')
+SUMMARY_TEXT = colors.HexColor('#4F4F4F')
+SUMMARY_HEADING = colors.HexColor('#212121')
+SUMMARY_ROW_HEIGHT = 0.3 * inch
+SUMMARY_PADDING = 6
+SUMMARY_BODY_SIZE = 9
+SUMMARY_BODY_LEADING = 11.5
+
+def _fit_text(text, font_name, font_size, max_width):
+    """Truncates a single line of text with an ellipsis so it fits max_width."""
+    text = ' '.join(str(text or '').split())
+    if pdfmetrics.stringWidth(text, font_name, font_size) <= max_width:
+        return text
+    while text and pdfmetrics.stringWidth(text + '\u2026', font_name, font_size) > max_width:
+        text = text[:-1]
+    return text.rstrip() + '\u2026'
+
+def _wrap_truncated(text, font_name, font_size, max_width, max_lines):
+    """Wraps text to max_width and keeps at most max_lines lines, ending in an ellipsis if cut."""
+    # Only the first few hundred characters per line can ever be shown, so don't wrap the rest.
+    text = str(text or '')
+    budget = max_lines * 200
+    clipped = len(text) > budget
+    lines = simpleSplit(text[:budget], font_name, font_size, max_width)
+    if len(lines) > max_lines or clipped:
+        lines = lines[:max_lines]
+        if lines:
+            lines[-1] = _fit_text(lines[-1] + '\u2026', font_name, font_size, max_width)
+    return lines
+
+def _draw_summary_heading(c, title, x, y):
+    c.setFont(report_fonts.bold, 13)
+    c.setFillColor(SUMMARY_HEADING)
+    c.drawString(x, y - 13, title)
+    return y - 13 - 8
+
+def _draw_summary_cell(c, x, y, width, height, text, label=False):
+    c.setFillColor(SUMMARY_GREEN if label else colors.white)
+    c.setStrokeColor(SUMMARY_GRID)
+    c.setLineWidth(0.25)
+    c.rect(x, y - height, width, height, stroke=1, fill=1)
+    c.setFont(report_fonts.regular, SUMMARY_BODY_SIZE)
+    c.setFillColor(colors.white if label else SUMMARY_TEXT)
+    c.drawString(x + SUMMARY_PADDING, y - height / 2 - SUMMARY_BODY_SIZE / 3,
+                 _fit_text(text, report_fonts.regular, SUMMARY_BODY_SIZE, width - 2 * SUMMARY_PADDING))
+
+def create_summary_player_report_pdf(player_obj, logo_path=None):
+    """Creates a fixed-layout, one-page player summary drawn straight onto the canvas."""
+    buffer = io.BytesIO()
+    page_width, page_height = letter
+    page = SimpleNamespace(pagesize=letter, leftMargin=0.75 * inch, rightMargin=0.75 * inch, page=1)
+    page.width = page_width - page.leftMargin - page.rightMargin
+    c = pdf_canvas.Canvas(buffer, pagesize=letter, invariant=app.config['DETERMINISTIC_PDF'], pageCompression=pdf_output_profile()['page_compression'])
+    report_page_callback(player_obj, logo_path)(c, page)
+
+    x, width = page.leftMargin, page.width
+    y = page_height - 1.35 * inch
+    c.setFont(report_fonts.bold, 22)
+    c.setFillColor(SUMMARY_GREEN)
+    c.drawCentredString(page_width / 2, y, 'Player Summary Report')
+    y -= 0.35 * inch
+
+    # --- Profile: four columns of label/value cells ---
+    y = _draw_summary_heading(c, 'Player Profile', x, y)
+    profile_rows = [
+        ('Player Name:', player_obj.player_name, 'Jersey Number:', player_obj.jersey_number),
+        ('Position:', player_obj.position, 'Other Positions:', player_obj.primary_positions),
+        ('Sub Team:', player_obj.sub_team, 'Date of Birth:', format_date_dmy(player_obj.dob)),
+        ('Height (cm):', player_obj.height, 'Weight (kg):', player_obj.weight),
+        ('Preferred Foot:', player_obj.preferred_foot, 'Reporting Period:',
+         f"{format_date_dmy(player_obj.report_period_start)} - {format_date_dmy(player_obj.report_period_end)}"),
     ]
-    setup_table = Table(setup_data, colWidths=[doc.width*0.3, doc.width*0.7], splitByRow=1)
-    setup_table.setStyle(notes_table_style)
-    elements.append(setup_table)
-    elements.append(Spacer(1, 0.2 * inch))
-
-    # --- Section 3: Tactical Analysis ---
-    tactics_data = [
-        ["Tactical Analysis"],
-        ['Home Team - Attacking Phase:', Paragraph(str(match_obj.home_attacking_phase or ''), _styles['CombinedBodyText'])],
-        ['Home Team - Defensive Phase:', Paragraph(str(match_obj.home_defensive_phase or ''), _styles['CombinedBodyText'])],
-        ['Home Team - Transitional Play:', Paragraph(str(match_obj.home_key_transitions or ''), _styles['CombinedBodyText'])],
-        ['Away Team - Attacking Phase:', Paragraph(str(match_obj.away_attacking_phase or ''), _styles['CombinedBodyText'])],
-        ['Away Team - Defensive Phase:', Paragraph(str(match_obj.away_defensive_phase or ''), _styles['CombinedBodyText'])],
-        ['Away Team - Transitional Play:', Paragraph(str(match_obj.away_key_transitions or ''), _styles['CombinedBodyText'])],
+    col_widths = [width * 0.17, width * 0.33, width * 0.17, width * 0.33]
+    for row in profile_rows:
+        cell_x = x
+        for index, (value, col_width) in enumerate(zip(row, col_widths)):
+            _draw_summary_cell(c, cell_x, y, col_width, SUMMARY_ROW_HEIGHT, '' if value is None else value, label=index % 2 == 0)
+            cell_x += col_width
+        y -= SUMMARY_ROW_HEIGHT
+    y -= 0.2 * inch
+
+    # --- Objective metrics: one tile per figure ---
+    y = _draw_summary_heading(c, 'Performance Overview', x, y)
+    metrics = [
+        ('Matches Played', player_obj.matches_played), ('Minutes', player_obj.total_minutes_played),
+        ('Goals', player_obj.goals), ('Assists', player_obj.assists),
     ]
-    tactics_table = Table(tactics_data, colWidths=[doc.width*0.3, doc.width*0.7], splitByRow=1)
-    tactics_table.setStyle(notes_table_style)
-    elements.append(tactics_table)
-    elements.append(Spacer(1, 0.2 * inch))
-
-    # --- Section 4: Conclusive Summary ---
-    summary_data = [
-        ["Match Summary & Insights"],
-        ['Overall Match Summary:', Paragraph(str(match_obj.overall_match_summary or ''), _styles['CombinedBodyText'])],
-        ['Key Turning Point(s):', Paragraph(str(match_obj.key_turning_points or ''), _styles['CombinedBodyText'])],
-        ['Man of the Match:', Paragraph(str(match_obj.man_of_the_match or ''), _styles['CombinedBodyText'])],
-        ['Final Notes:', Paragraph(str(match_obj.final_analyst_notes or ''), _styles['CombinedBodyText'])],
+    tile_gap, tile_height = 8, 0.65 * inch
+    tile_width = (width - tile_gap * (len(metrics) - 1)) / len(metrics)
+    for index, (label, value) in enumerate(metrics):
+        tile_x = x + index * (tile_width + tile_gap)
+        c.setFillColor(SUMMARY_GREEN)
+        c.roundRect(tile_x, y - tile_height, tile_width, tile_height, 4, stroke=0, fill=1)
+        c.setFillColor(colors.white)
+        c.setFont(report_fonts.bold, 18)
+        c.drawCentredString(tile_x + tile_width / 2, y - 0.35 * inch, '' if value is None else str(value))
+        c.setFont(report_fonts.regular, 8)
+        c.drawCentredString(tile_x + tile_width / 2, y - tile_height + 7, label.upper())
+    y -= tile_height + 0.2 * inch
+
+    # --- Assessment: every field gets an equal share of the space left on the page ---
+    y = _draw_summary_heading(c, 'Assessment Highlights', x, y)
+    text_rows = [
+        ('Technical / Tactical:', player_obj.technical_tactical_notes),
+        ('Physical:', player_obj.physical_notes),
+        ('Psychological:', player_obj.psychological_notes),
+        ('Social:', player_obj.social_notes),
+        ('Overall Summary:', player_obj.overall_performance_summary),
+        ('Recommended Plan:', player_obj.recommended_action_plan),
     ]
-    summary_table = Table(summary_data, colWidths=[doc.width*0.3, doc.width*0.7], splitByRow=1)
-    summary_table.setStyle(notes_table_style)
-    elements.append(summary_table)
-
-    doc.build(elements, onFirstPage=lambda c, d: (draw_header(c, d, logo_path), draw_footer(c, d)), onLaterPages=lambda c, d: (draw_header(c, d, logo_path), draw_footer(c, d)))
+    bottom = 0.95 * inch
+    row_height = (y - bottom) / len(text_rows)
+    max_lines = max(1, int((row_height - 2 * SUMMARY_PADDING) // SUMMARY_BODY_LEADING))
+    label_width, text_width = width * 0.25, width * 0.75
+    for label, text in text_rows:
+        _draw_summary_cell(c, x, y, label_width, row_height, label, label=True)
+        c.setFillColor(colors.white)
+        c.setStrokeColor(SUMMARY_GRID)
+        c.rect(x + label_width, y - row_height, text_width, row_height, stroke=1, fill=1)
+        text_object = c.beginText(x + label_width + SUMMARY_PADDING, y - SUMMARY_PADDING - SUMMARY_BODY_SIZE)
+        text_object.setFont(report_fonts.regular, SUMMARY_BODY_SIZE, SUMMARY_BODY_LEADING)
+        text_object.setFillColor(SUMMARY_TEXT)
+        for line in _wrap_truncated(text, report_fonts.regular, SUMMARY_BODY_SIZE, text_width - 2 * SUMMARY_PADDING, max_lines):
+            text_object.textLine(line)
+        c.drawText(text_object)
+        y -= row_height
+
+    c.showPage()
+    c.save()
     buffer.seek(0)
     return buffer
 
+# --- Season Booklet ---
+# Many detailed player reports in one PDF. Player rows are read BOOKLET_YIELD_PER at a time
+# and each section is laid out as soon as it is read, which reduces peak memory compared with
+# building one story for the whole booklet. Memory still grows with the page count, since the
+# canvas keeps every finished page (compressed) until the file is written, so the actual
+# bound is BOOKLET_MAX_PLAYERS, checked before rendering starts.
+# The logo and fonts are embedded once and shared by every page. Page numbers in the
+# contents would need a second layout pass, so instead each entry links to its section
+# and the PDF outline (bookmarks) lists the same sections.
+
+BOOKLET_YIELD_PER = 20 # Player rows fetched per round trip while rendering
+
+class SectionAnchor(Flowable):
+    """Zero-size flowable marking where a booklet section starts: a link target and an outline entry."""
+
+    def __init__(self, key, title):
+        super().__init__()
+        self.key = key
+        self.title = title
+
+    def wrap(self, available_width, available_height):
+        return 0, 0
+
+    def draw(self):
+        self.canv.bookmarkPage(self.key)
+        self.canv.addOutlineEntry(self.title, self.key, level=0)
+
+
+class BookletDocTemplate(BaseDocTemplate):
+    """A document template fed one section at a time instead of a complete story."""
+
+    def __init__(self, filename, on_page, **kwargs):
+        super().__init__(filename, **kwargs)
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='normal')
+        self.addPageTemplates([PageTemplate(id='Booklet', frames=frame, onPage=on_page, pagesize=self.pagesize)])
+
+    @contextmanager
+    def sections(self):
+        """Starts the document and yields add_section; the file is written when the block finishes."""
+        self._startBuild()
+        self.canv._doctemplate = self
+        try:
+            yield self.add_section
+        finally:
+            del self.canv._doctemplate
+        self._endBuild()
+
+    def add_section(self, flowables):
+        """Lays the flowables out onto pages straight away."""
+        flowables = list(flowables)
+        while flowables:
+            self.clean_hanging()
+            self.handle_flowable(flowables)
+
+
+def booklet_players_query(club_id, sub_team=None, period_from=None, period_to=None):
+    """The club's player reports for a booklet, in contents order.
+
+    A report is included when its reporting period overlaps period_from..period_to.
+    """
+    query = db.session.query(Player).join(Player.profile).filter(Player.club_id == club_id)
+    if sub_team:
+        query = query.filter(Player.sub_team == sub_team)
+    if period_from:
+        query = query.filter(Player.report_period_end >= period_from)
+    if period_to:
+        query = query.filter(Player.report_period_start <= period_to)
+    return query.order_by(Player.sub_team, PlayerProfile.player_name, Player.report_period_start, Player.id)
+
+def booklet_entry_title(entry):
+    period = f"{format_date_dmy(entry.report_period_start)} - {format_date_dmy(entry.report_period_end)}"
+    return f'{entry.player_name} ({period})' if entry.report_period_start or entry.report_period_end else entry.player_name
+
+def booklet_contents_flowables(title, entries, doc):
+    """Title page listing every section, grouped by sub team, each entry linking to its section."""
+    elements = [Paragraph(xml_escape(title), _styles['MyCenteredTitle']), Spacer(1, 0.3 * inch)]
+    sub_team = object()
+    for entry in entries:
+        if entry.sub_team != sub_team:
+            sub_team = entry.sub_team
+            elements.append(_section_heading(sub_team or 'No Sub Team', doc))
+        link = f'<a href="#player-{entry.id}" color="#06402B">{xml_escape(booklet_entry_title(entry))}</a>'
+        elements.append(Paragraph(link, _styles['MyKeyInfo']))
+    return elements
+
+def booklet_page_callback(title, club_name, entries, logo_path=None):
+    """Returns the onPage callback for a booklet: the report header and footer, plus metadata on page 1."""
+    # For deterministic output the booklet is dated by its newest report rather than the clock
+    newest = SimpleNamespace(created_at=max((entry.created_at for entry in entries if entry.created_at), default=None))
+    period_ends = [entry.report_period_end for entry in entries if entry.report_period_end]
+    header_date = None
+    if app.config['DETERMINISTIC_PDF']:
+        if period_ends:
+            header_date = format_date_dmy(max(period_ends))
+        elif newest.created_at:
+            header_date = newest.created_at.strftime('%d/%m/%Y')
+    metadata = {
+        'title': title,
+        'author': club_name,
+        'subject': f'{len(entries)} player reports',
+        'keywords': ', '.join(sorted({entry.sub_team for entry in entries if entry.sub_team})),
+        'creator': 'Analysis Hub',
+    }
+    logo = prepare_logo(logo_path, pdf_output_profile())
+
+    def on_page(canvas, doc):
+        if doc.page == 1:
+            stamp_pdf_metadata(canvas, newest, metadata)
+            canvas.showOutline()
+        draw_header(canvas, doc, logo, header_date)
+        draw_footer(canvas, doc)
+    return on_page
+
+def create_player_booklet_pdf(players_query, club_name, title, logo_path=None):
+    """Renders every player report in the query into one PDF and returns it as a spooled temporary file."""
+    entries = players_query.with_entities(
+        Player.id, PlayerProfile.player_name, Player.sub_team,
+        Player.report_period_start, Player.report_period_end, Player.created_at,
+    ).all()
+    output = tempfile.SpooledTemporaryFile(max_size=app.config['BOOKLET_SPOOL_BYTES'])
+    doc = BookletDocTemplate(
+        output, booklet_page_callback(title, club_name, entries, logo_path),
+        pagesize=letter, rightMargin=0.75*inch, leftMargin=0.75*inch, topMargin=1.0*inch, bottomMargin=0.75*inch,
+        invariant=app.config['DETERMINISTIC_PDF'], pageCompression=pdf_output_profile()['page_compression'],
+    )
+    # One query for every profile's progression instead of one per report
+    series = progression_series({profile_id for profile_id, in players_query.with_entities(Player.profile_id)})
+    with doc.sections() as add_section:
+        add_section(booklet_contents_flowables(title, entries, doc))
+        for player_obj in players_query.options(contains_eager(Player.profile)).yield_per(BOOKLET_YIELD_PER):
+            anchor = SectionAnchor(f'player-{player_obj.id}', booklet_entry_title(player_obj))
+            add_section([PageBreak(), anchor, *detailed_player_report_flowables(player_obj, doc, series[player_obj.profile_id])])
+    output.seek(0)
+    return output
+
 # --- Flask Routes ---
 
 @app.route('/')
@@ -548,14 +2587,14 @@ def generate_player_report():
             logo_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
             file.save(logo_path)
     
-    # **FIX**: Use time.time() to generate a unique timestamp for the filename
-    unique_timestamp = int(time.time())
     player_name = form_data.get('player_name', 'Unnamed_Player').replace(' ', '_')
-    pdf_filename = f"Player_Report_{player_name}_{unique_timestamp}.pdf"
+    pdf_filename = new_report_name('Player_Report', player_name)
     
     # Create Player object
     new_player = Player(
         club_id=current_user.club.id,
+        club=current_user.club, # Set with created_at here, so rendering needs no flush
+        created_at=utc_now(),
         player_name=form_data.get('player_name'),
         coach_name=form_data.get('coach_name'),
         sub_team=form_data.get('sub_team'),
@@ -579,18 +2618,16 @@ def generate_player_report():
         **player_data_dict # Add validated numeric fields
     )
 
+    db.session.add(new_player)
+
     # Generate and save PDF
     if report_type_choice == 'default_summary_player_report':
-        pdf_buffer = create_summary_player_report_pdf(new_player, logo_path) 
+        pdf_buffer = render_pdf(create_summary_player_report_pdf, new_player, logo_path=logo_path)
     else:
-        pdf_buffer = create_detailed_player_report_pdf(new_player, logo_path)
+        pdf_buffer = render_pdf(create_detailed_player_report_pdf, new_player, logo_path=logo_path)
     
-    full_pdf_path = os.path.join(app.config['REPORT_FOLDER'], pdf_filename)
-    with open(full_pdf_path, 'wb') as f:
-        f.write(pdf_buffer.getbuffer())
-
     # Commit to DB and cleanup
-    db.session.add(new_player)
+    record_report_version(new_player, pdf_buffer, 'Created')
     db.session.commit()
 
     if logo_path and os.path.exists(logo_path):
@@ -603,26 +2640,194 @@ def generate_player_report():
 @app.route('/players')
 @login_required
 def list_players():
-    players = Player.query.filter_by(club_id=current_user.club.id).order_by(Player.player_name).all()
-    return render_template('player_list.html', players=players)
+    data_version = club_data_version(current_user.club.id)
+
+    def render():
+        table_html = cached_fragment('_player_table.html', data_version, lambda: {
+            'players': Player.query.join(Player.profile).options(contains_eager(Player.profile))
+                .filter(Player.club_id == current_user.club.id)
+                .order_by(PlayerProfile.player_name, Player.report_period_start, Player.id).all(),
+        })
+        return render_template('player_list.html', table_html=table_html)
+
+    return conditional_club_page(data_version, render)
+
+@app.route('/players/profile/<int:profile_id>')
+@login_required
+def player_profile(profile_id):
+    profile = db.session.query(PlayerProfile).filter_by(id=profile_id, club_id=current_user.club.id).first_or_404()
+    reports = Player.query.filter_by(profile_id=profile.id).order_by(Player.report_period_start, Player.id).all()
+    return render_template('player_profile.html', profile=profile, reports=reports, totals=profile_aggregates(profile.id))
+
+@app.route('/players/booklet', methods=['GET', 'POST'])
+@login_required
+def player_booklet():
+    club = current_user.club
+    sub_teams = [row.sub_team for row in db.session.query(Player.sub_team).filter(
+        Player.club_id == club.id, Player.sub_team.isnot(None), Player.sub_team != '',
+    ).distinct().order_by(Player.sub_team)]
+
+    if request.method == 'GET':
+        return render_template('booklet_form.html', sub_teams=sub_teams, form_data=None)
+
+    form_data = request.form
+    sub_team = form_data.get('sub_team') or None
+    period_from = form_data.get('period_from') or None
+    period_to = form_data.get('period_to') or None
+
+    errors = []
+    if period_from and period_to and period_from > period_to:
+        errors.append('The period start must be on or before the period end.')
+    query = booklet_players_query(club.id, sub_team, period_from, period_to)
+    player_count = query.count()
+    if not errors and player_count == 0:
+        errors.append('No player reports match this selection.')
+    if player_count > app.config['BOOKLET_MAX_PLAYERS']:
+        errors.append(f"A booklet can hold at most {app.config['BOOKLET_MAX_PLAYERS']} player reports; this selection has {player_count}. Narrow it by sub team or period.")
+    if errors:
+        for error in errors:
+            flash(error, 'danger')
+        return render_template('booklet_form.html', sub_teams=sub_teams, form_data=form_data)
+
+    logo_path = None
+    if 'club_logo' in request.files:
+        file = request.files['club_logo']
+        if file and file.filename != '' and allowed_file(file.filename):
+            filename = secure_filename(f"{current_user.id}_{file.filename}")
+            logo_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+            file.save(logo_path)
+
+    title = f'{club.name} Player Booklet' + (f' - {sub_team}' if sub_team else '')
+    booklet = render_pdf(create_player_booklet_pdf, query, club.name, title, logo_path=logo_path, budget_sections=player_count)
+
+    if logo_path and os.path.exists(logo_path):
+        os.remove(logo_path)
+    return send_file(booklet, mimetype='application/pdf', as_attachment=True, download_name=f'{secure_filename(title)}.pdf')
 
 @app.route('/download_report/<path:filename>')
 @login_required
 def download_report(filename):
     secure_name = secure_filename(filename)
     
-    player_report = Player.query.filter_by(pdf_report_path=secure_name, club_id=current_user.club.id).first()
-    match_report = Match.query.filter_by(pdf_report_path=secure_name, club_id=current_user.club.id).first()
+    report = Player.query.filter_by(pdf_report_path=secure_name, club_id=current_user.club.id).first() \
+        or Match.query.filter_by(pdf_report_path=secure_name, club_id=current_user.club.id).first()
 
-    if not (player_report or match_report):
+    if not report:
         abort(404)
 
-    report_file_path = os.path.join(app.config['REPORT_FOLDER'], secure_name)
-    if os.path.exists(report_file_path):
-        return send_file(report_file_path, as_attachment=True)
-    else:
+    if report.versions:
+        return send_report_blob(report.versions[-1].blob_sha256, secure_name)
+    legacy_path = os.path.join(app.config['REPORT_FOLDER'], report.pdf_report_path)
+    if os.path.exists(legacy_path):
+        return send_file(legacy_path, as_attachment=True, download_name=secure_name)
+    abort(404)
+
+
+@app.route('/reports/<kind>/<int:report_id>/history')
+@login_required
+def report_history(kind, report_id):
+    report = get_club_report(kind, report_id)
+    return render_template('report_history.html', kind=kind, report=report, versions=list(reversed(report.versions)))
+
+@app.route('/reports/<kind>/<int:report_id>/versions/<int:version>')
+@login_required
+def download_report_version(kind, report_id, version):
+    report = get_club_report(kind, report_id)
+    report_version = next((v for v in report.versions if v.version == version), None)
+    if report_version is None:
+        abort(404)
+
+    stem, extension = os.path.splitext(report.pdf_report_path)
+    return send_report_blob(report_version.blob_sha256, f"{stem}_v{version}{extension}")
+
+def report_preview_context(kind, report):
+    title, build_sections = REPORT_SECTIONS[kind]
+    return {'title': title, 'sections': build_sections(report)}
+
+def preview_report_from_form(kind, form):
+    """An unsaved stand-in for a Player or Match holding the submitted form values.
+
+    Blank fields become None, as they would be once saved. It is never added to the session.
+    """
+    model = REPORT_MODELS[kind]
+    fields = [column.name for column in model.__table__.columns]
+    if kind == 'player':
+        fields += PLAYER_PROFILE_FIELDS
+    values = {field: form.get(field) or None for field in fields}
+    if kind == 'player':
+        values['player_team'] = current_user.club.name
+    return SimpleNamespace(**values)
+
+@app.route('/reports/<kind>/<int:report_id>/preview')
+@login_required
+def preview_report(kind, report_id):
+    """Shows a saved report as HTML, built from its row without rendering a PDF."""
+    if kind not in REPORT_SECTIONS:
+        abort(404)
+    data_version = club_data_version(current_user.club.id)
+
+    def render():
+        report = get_club_report(kind, report_id)
+        preview_html = cached_fragment('_report_preview.html', data_version, lambda: report_preview_context(kind, report), extra_key=(kind, report_id))
+        return render_template('report_preview.html', kind=kind, report=report, preview_html=preview_html)
+    return conditional_club_page(data_version, render)
+
+@app.route('/reports/<kind>/preview', methods=['POST'])
+@login_required
+def live_preview_report(kind):
+    """Renders the preview fragment for a report form that has not been saved yet."""
+    if kind not in REPORT_SECTIONS:
+        abort(404)
+    report = preview_report_from_form(kind, request.form)
+    return render_template('_report_preview.html', **report_preview_context(kind, report))
+
+@app.route('/reports/<kind>/<int:report_id>/share', methods=['GET', 'POST'])
+@login_required
+def share_report(kind, report_id):
+    """Creates an expiring link to the report's current PDF that works without logging in."""
+    report = get_club_report(kind, report_id)
+    share_url = expires_at = None
+    if request.method == 'POST':
+        days = request.form.get('days', type=int)
+        if days not in SHARE_LINK_DAYS or days > app.config['SHARE_LINK_MAX_DAYS']:
+            flash('Please choose how long the link should stay valid.', 'danger')
+        elif not report.versions or not report_storage().exists(report.versions[-1].blob_sha256):
+            flash('The PDF for this report could not be found.', 'danger')
+        else:
+            share_url = request.url_root.rstrip('/') + SHARE_LINK_PREFIX + create_share_token(report, days)
+            expires_at = datetime.now() + timedelta(days=days)
+    day_choices = [days for days in SHARE_LINK_DAYS if days <= app.config['SHARE_LINK_MAX_DAYS']]
+    return render_template('share_report.html', kind=kind, report=report, share_url=share_url, expires_at=expires_at, day_choices=day_choices)
+
+@app.route('/reports/<kind>/<int:report_id>/versions/<int:version>/restore', methods=['POST'])
+@login_required
+def restore_report_version(kind, report_id, version):
+    """Rolls a report back by re-publishing an earlier version's fields and PDF as the newest version."""
+    report = get_club_report(kind, report_id)
+    report_version = next((v for v in report.versions if v.version == version), None)
+    if report_version is None:
         abort(404)
 
+    if report_version.snapshot:
+        snapshot = json.loads(report_version.snapshot)
+        identity = {field: snapshot.pop(field) for field in PLAYER_PROFILE_FIELDS if field in snapshot}
+        for field, value in snapshot.items():
+            setattr(report, field, value)
+        if identity:
+            assign_player_identity(report, identity)
+
+    report.versions.append(ReportVersion(
+        version=report.versions[-1].version + 1,
+        blob_sha256=report_version.blob_sha256,
+        snapshot=report_version.snapshot,
+        note=f'Restored v{version}',
+        created_by_id=current_user.id,
+    ))
+    db.session.commit()
+
+    flash(f'Report restored to version {version}.', 'success')
+    return redirect(url_for('report_history', kind=kind, report_id=report_id))
+
 
 @app.route('/edit_player/<int:player_id>', methods=['GET', 'POST'])
 @login_required
@@ -638,6 +2843,14 @@ def edit_player(player_id):
         if not form_data.get('player_name'):
             errors.append('Player Name is required.')
         
+        # Identity fields live on the player's profile and are applied once the form is valid
+        identity = {}
+        def set_field(field, value):
+            if field in PLAYER_PROFILE_FIELDS:
+                identity[field] = value
+            else:
+                setattr(player, field, value)
+
         # Process and validate numeric fields
         numeric_fields = {
             'jersey_number': int, 'matches_played': int, 'total_minutes_played': int, 
@@ -651,12 +2864,12 @@ def edit_player(player_id):
                     if converted_value < 0:
                         errors.append(f'{field.replace("_", " ").title()} must be a non-negative number.')
                     else:
-                        setattr(player, field, converted_value)
+                        set_field(field, converted_value)
                 except (ValueError, TypeError):
                     errors.append(f'{field.replace("_", " ").title()} must be a valid number.')
-                    setattr(player, field, None)
+                    set_field(field, None)
             else:
-                setattr(player, field, None)
+                set_field(field, None)
 
         if errors:
             for error in errors:
@@ -666,10 +2879,10 @@ def edit_player(player_id):
         # --- End Validation ---
 
         # Update text-based fields
-        player.player_name = form_data.get('player_name')
+        identity.update(player_name=form_data.get('player_name'), dob=form_data.get('dob'), preferred_foot=form_data.get('preferred_foot'))
+        with db.session.no_autoflush: # The edits are written with the new version, after the render
+            assign_player_identity(player, identity)
         player.position = form_data.get('position')
-        player.dob = form_data.get('dob')
-        player.preferred_foot = form_data.get('preferred_foot')
         player.sub_team = form_data.get('sub_team')
         player.primary_positions = form_data.get('primary_positions')
         player.report_period_start = form_data.get('report_period_start')
@@ -694,14 +2907,11 @@ def edit_player(player_id):
         
         # Regenerate PDF
         if report_type_choice == 'default_summary_player_report':
-            pdf_buffer = create_summary_player_report_pdf(player, logo_path)
+            pdf_buffer = render_pdf(create_summary_player_report_pdf, player, logo_path=logo_path)
         else:
-            pdf_buffer = create_detailed_player_report_pdf(player, logo_path)
+            pdf_buffer = render_pdf(create_detailed_player_report_pdf, player, logo_path=logo_path)
         
-        full_pdf_path = os.path.join(app.config['REPORT_FOLDER'], player.pdf_report_path)
-        with open(full_pdf_path, 'wb') as f:
-            f.write(pdf_buffer.getbuffer())
-
+        record_report_version(player, pdf_buffer, 'Edited')
         db.session.commit()
 
         if logo_path and os.path.exists(logo_path):
@@ -717,16 +2927,18 @@ def edit_player(player_id):
 def delete_player(player_id):
     player = db.session.query(Player).filter_by(id=player_id, club_id=current_user.club.id).first_or_404()
 
-    pdf_file_path = os.path.join(app.config['REPORT_FOLDER'], player.pdf_report_path)
-    if os.path.exists(pdf_file_path):
-        try:
-            os.remove(pdf_file_path)
-        except OSError as e:
-            flash(f'Error deleting PDF report file: {e}', 'danger')
-
+    blob_sha256s = [v.blob_sha256 for v in player.versions]
+    profile = player.profile
     db.session.delete(player)
+    db.session.flush()
+    if not db.session.query(Player.id).filter_by(profile_id=profile.id).first():
+        db.session.delete(profile) # That was the player's last report
+    orphaned_keys = prune_unreferenced_blobs(blob_sha256s)
     db.session.commit()
 
+    remove_report_blobs(orphaned_keys)
+    remove_report_files([os.path.join(app.config['REPORT_FOLDER'], player.pdf_report_path)])
+
     flash(f'Player "{player.player_name}" and their report have been deleted.', 'success')
     return redirect(url_for('list_players'))
 
@@ -789,15 +3001,15 @@ def generate_match_report():
             logo_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
             file.save(logo_path)
 
-    # **FIX**: Use time.time() to generate a unique timestamp for the filename
-    unique_timestamp = int(time.time())
     home_team_name = form_data.get('home_team', 'Home').replace(' ', '_')
     away_team_name = form_data.get('away_team', 'Away').replace(' ', '_')
-    pdf_filename = f"Match_Report_{home_team_name}_vs_{away_team_name}_{unique_timestamp}.pdf"
+    pdf_filename = new_report_name('Match_Report', home_team_name, 'vs', away_team_name)
 
     # Create Match object
     new_match = Match(
         club_id=current_user.club.id,
+        club=current_user.club, # Set with created_at here, so rendering needs no flush
+        created_at=utc_now(),
         competition=form_data.get('competition'),
         season=form_data.get('season'),
         match_date=form_data.get('match_date'),
@@ -823,15 +3035,14 @@ def generate_match_report():
         **match_data_dict # Add validated numeric fields
     )
     
+    db.session.add(new_match)
+
     # Generate and save PDF
     club_name = current_user.club.name
-    pdf_buffer = create_match_report_pdf(new_match, club_name, logo_path)
-    full_pdf_path = os.path.join(app.config['REPORT_FOLDER'], pdf_filename)
-    with open(full_pdf_path, 'wb') as f:
-        f.write(pdf_buffer.getbuffer())
+    pdf_buffer = render_pdf(create_match_report_pdf, new_match, club_name, logo_path=logo_path)
 
     # Commit to DB and cleanup
-    db.session.add(new_match)
+    record_report_version(new_match, pdf_buffer, 'Created')
     db.session.commit()
 
     if logo_path and os.path.exists(logo_path):
@@ -843,8 +3054,24 @@ def generate_match_report():
 @app.route('/matches')
 @login_required
 def list_matches():
-    matches = Match.query.filter_by(club_id=current_user.club.id).order_by(Match.match_date.desc()).all()
-    return render_template('match_list.html', matches=matches)
+    data_version = club_data_version(current_user.club.id)
+
+    def render():
+        table_html = cached_fragment('_match_table.html', data_version, lambda: {
+            'matches': club_match_results_query(current_user.club.id, current_user.club.name).order_by(Match.match_date.desc()).all(),
+        })
+        return render_template('match_list.html', table_html=table_html)
+
+    return conditional_club_page(data_version, render)
+
+@app.route('/matches/summary')
+@login_required
+def season_summary():
+    season = request.args.get('season') or None
+    form_length = request.args.get('form', DEFAULT_FORM_LENGTH, type=int)
+    form_length = max(1, min(form_length, MAX_FORM_LENGTH))
+    summaries = club_season_summary(current_user.club.id, current_user.club.name, season=season, form_length=form_length)
+    return render_template('season_summary.html', summaries=summaries, season=season, form_length=form_length)
 
 @app.route('/edit_match/<int:match_id>', methods=['GET', 'POST'])
 @login_required
@@ -915,11 +3142,8 @@ def edit_match(match_id):
                 file.save(logo_path)
         
         # Regenerate PDF
-        pdf_buffer = create_match_report_pdf(match, logo_path) 
-        full_pdf_path = os.path.join(app.config['REPORT_FOLDER'], match.pdf_report_path)
-        with open(full_pdf_path, 'wb') as f:
-            f.write(pdf_buffer.getbuffer())
-        
+        pdf_buffer = render_pdf(create_match_report_pdf, match, current_user.club.name, logo_path=logo_path)
+        record_report_version(match, pdf_buffer, 'Edited')
         db.session.commit()
 
         if logo_path and os.path.exists(logo_path):
@@ -935,21 +3159,238 @@ def edit_match(match_id):
 def delete_match(match_id):
     match = db.session.query(Match).filter_by(id=match_id, club_id=current_user.club.id).first_or_404()
 
-    pdf_file_path = os.path.join(app.config['REPORT_FOLDER'], match.pdf_report_path)
-    if os.path.exists(pdf_file_path):
-        try:
-            os.remove(pdf_file_path)
-        except OSError as e:
-            flash(f'Error deleting PDF report file: {e}', 'danger')
-
     flash_message = f'Match report for "{match.home_team} vs {match.away_team}" on {match.match_date} has been deleted.'
+    blob_sha256s = [v.blob_sha256 for v in match.versions]
     db.session.delete(match)
+    db.session.flush()
+    orphaned_keys = prune_unreferenced_blobs(blob_sha256s)
     db.session.commit()
 
+    remove_report_blobs(orphaned_keys)
+    remove_report_files([os.path.join(app.config['REPORT_FOLDER'], match.pdf_report_path)])
+
     flash(flash_message, 'success')
     return redirect(url_for('list_matches'))
 
 
+@app.errorhandler(RenderBusy)
+def render_busy(error):
+    response = Response(render_template('render_busy.html', retry_after=error.retry_after), status=429)
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+
+# --- JSON API (v1) ---
+# Read-only access to the logged-in user's club. Lists use keyset pagination on id behind an
+# opaque cursor, so pages stay stable while reports are added. fields=a,b,c limits both the
+# response and the columns loaded, which lets clients skip the long notes columns. Every
+# response carries an ETag built from the club's data version: a poll with If-None-Match
+# costs one indexed lookup and no row queries when nothing has changed.
+
+API_DEFAULT_LIMIT = 50
+API_MAX_LIMIT = 200
+
+# Columns that are internal to the app rather than part of a report
+API_EXCLUDED_FIELDS = {'club_id', 'pdf_report_path'}
+
+API_RESOURCES = {'players': Player, 'matches': Match}
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+@app.errorhandler(ApiError)
+def handle_api_error(error):
+    return jsonify({'error': error.message}), error.status
+
+def api_login_required(view):
+    """Like login_required, but answers unauthenticated requests with a JSON 401 instead of a redirect."""
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        if not current_user.is_authenticated:
+            raise ApiError(401, 'Authentication required.')
+        return view(*args, **kwargs)
+    return wrapped
+
+def api_fields(model):
+    """Every field the API can return for a model, in a stable order."""
+    fields = [column.name for column in model.__table__.columns if column.name not in API_EXCLUDED_FIELDS]
+    if model is Player:
+        fields.extend(PLAYER_PROFILE_FIELDS)
+    return fields
+
+def requested_api_fields(model):
+    """Parses ?fields=, always including id."""
+    available = api_fields(model)
+    if not request.args.get('fields'):
+        return available
+    fields = [field.strip() for field in request.args['fields'].split(',') if field.strip()]
+    unknown = [field for field in fields if field not in available]
+    if unknown:
+        raise ApiError(400, f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(available)}.")
+    return ['id'] + [field for field in dict.fromkeys(fields) if field != 'id']
+
+def api_query(model, fields):
+    """The club's rows of a model, loading only the columns behind the requested fields."""
+    profile_fields = [field for field in fields if model is Player and field in PLAYER_PROFILE_FIELDS]
+    columns = [getattr(model, field) for field in fields if field not in profile_fields]
+    query = model.query.filter(model.club_id == current_user.club.id).options(load_only(*columns))
+    if profile_fields:
+        query = query.join(Player.profile).options(
+            contains_eager(Player.profile).load_only(*[getattr(PlayerProfile, field) for field in profile_fields])
+        )
+    return query
+
+def api_item(obj, fields):
+    item = {}
+    for field in fields:
+        value = getattr(obj, field)
+        item[field] = value.isoformat() if isinstance(value, datetime) else value
+    return item
+
+def encode_cursor(last_id):
+    return base64.urlsafe_b64encode(str(last_id).encode('ascii')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    try:
+        return int(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('ascii'))
+    except (ValueError, UnicodeDecodeError):
+        raise ApiError(400, 'Invalid cursor.')
+
+def conditional_api_response(build):
+    """Serves JSON from build() with an ETag derived from the club's data version and the request URL."""
+    etag = hashlib.sha256('|'.join([
+        'v1', request.full_path, str(current_user.club.id), str(club_data_version(current_user.club.id)),
+    ]).encode('utf-8')).hexdigest()[:32]
+
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = build()
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+def _api_model(resource):
+    if resource not in API_RESOURCES:
+        raise ApiError(404, f"Unknown resource '{resource}'. Available: {', '.join(API_RESOURCES)}.")
+    return API_RESOURCES[resource]
+
+@app.route('/api/v1/<resource>')
+@api_login_required
+def api_list(resource):
+    """Lists the club's players or matches by ascending id: ?limit=, ?cursor= and ?fields=."""
+    model = _api_model(resource)
+    fields = requested_api_fields(model)
+    limit = request.args.get('limit', API_DEFAULT_LIMIT, type=int)
+    if not 1 <= limit <= API_MAX_LIMIT:
+        raise ApiError(400, f'limit must be between 1 and {API_MAX_LIMIT}.')
+    after_id = decode_cursor(request.args['cursor']) if request.args.get('cursor') else None
+
+    def build():
+        query = api_query(model, fields)
+        if after_id is not None:
+            query = query.filter(model.id > after_id)
+        rows = query.order_by(model.id).limit(limit + 1).all()
+        next_cursor = encode_cursor(rows[limit - 1].id) if len(rows) > limit else None
+        response = jsonify({'data': [api_item(row, fields) for row in rows[:limit]], 'next_cursor': next_cursor})
+        if next_cursor:
+            next_url = url_for('api_list', resource=resource, _external=True, **dict(request.args, cursor=next_cursor))
+            response.headers['Link'] = f'<{next_url}>; rel="next"'
+        return response
+
+    return conditional_api_response(build)
+
+@app.route('/api/v1/<resource>/<int:item_id>')
+@api_login_required
+def api_detail(resource, item_id):
+    """One of the club's players or matches: ?fields=."""
+    model = _api_model(resource)
+    fields = requested_api_fields(model)
+
+    def build():
+        obj = api_query(model, fields).filter(model.id == item_id).first()
+        if obj is None:
+            raise ApiError(404, f'{resource[:-1].title()} {item_id} not found.')
+        return jsonify({'data': api_item(obj, fields)})
+
+    return conditional_api_response(build)
+
+
+@app.route('/autocomplete/<field>')
+@login_required
+def autocomplete(field):
+    """Suggestions for a form field as the user types: ?q=<prefix>."""
+    if field not in AUTOCOMPLETE_FIELDS:
+        abort(404)
+    response = jsonify(autocomplete_suggestions(current_user.club.id, field, request.args.get('q', '')))
+    response.headers['Cache-Control'] = 'private, max-age=60'
+    return response
+
+
+# --- Metrics ---
+
+@app.route('/metrics')
+def metrics():
+    """Exposes this worker's render admission, report size and query metrics in the Prometheus text format."""
+    token = app.config['METRICS_TOKEN']
+    if not token:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return Response('Metrics token required.\n', 401, {'WWW-Authenticate': 'Bearer'}, mimetype='text/plain')
+    lines = []
+    series = [
+        ('render_queue_depth', 'gauge', 'Render requests waiting for a slot.', 'queued'),
+        ('render_active', 'gauge', 'Renders currently in progress.', 'active'),
+        ('render_admitted_total', 'counter', 'Render requests admitted.', 'admitted'),
+        ('render_rejected_total', 'counter', 'Render requests rejected with 429.', 'rejected'),
+        ('render_wait_seconds_total', 'counter', 'Time admitted requests spent queued.', 'wait_seconds'),
+        ('render_seconds_total', 'counter', 'Time spent rendering.', 'render_seconds'),
+    ]
+    snapshot = render_admission.snapshot()
+    for name, metric_type, help_text, key in series:
+        lines.append(f'# HELP football_reports_{name} {help_text}')
+        lines.append(f'# TYPE football_reports_{name} {metric_type}')
+        for club_id, values in snapshot.items():
+            lines.append(f'football_reports_{name}{{club_id="{club_id}"}} {values[key]}')
+
+    size_series = [
+        ('report_renders_total', 'counter', 'Reports rendered.', 'renders'),
+        ('report_bytes_total', 'counter', 'Bytes of PDF output.', 'bytes'),
+        ('report_last_bytes', 'gauge', 'Size of the most recent report.', 'last_bytes'),
+        ('report_max_bytes', 'gauge', 'Largest report rendered.', 'max_bytes'),
+        ('report_over_budget_total', 'counter', 'Reports larger than the PDF size budget.', 'over_budget'),
+    ]
+    sizes = report_sizes.snapshot()
+    for name, metric_type, help_text, key in size_series:
+        lines.append(f'# HELP football_reports_{name} {help_text}')
+        lines.append(f'# TYPE football_reports_{name} {metric_type}')
+        for kind, values in sizes.items():
+            lines.append(f'football_reports_{name}{{report="{kind}"}} {values[key]}')
+
+    query_series = [
+        ('http_requests_total', 'counter', 'Requests handled.', 'requests'),
+        ('db_queries_total', 'counter', 'SQL statements executed by requests.', 'queries'),
+        ('db_seconds_total', 'counter', 'Time requests spent in SQL statements.', 'seconds'),
+        ('db_max_queries', 'gauge', 'Most SQL statements executed by one request.', 'max_queries'),
+        ('db_repeated_query_requests_total', 'counter', 'Requests flagged as likely N+1 patterns.', 'repeated'),
+    ]
+    queries = endpoint_queries.snapshot()
+    for name, metric_type, help_text, key in query_series:
+        lines.append(f'# HELP football_reports_{name} {help_text}')
+        lines.append(f'# TYPE football_reports_{name} {metric_type}')
+        for endpoint, values in queries.items():
+            lines.append(f'football_reports_{name}{{endpoint="{endpoint}"}} {values[key]}')
+    budget = pdf_size_budget()
+    if budget is not None:
+        lines.append('# HELP football_reports_report_budget_bytes PDF size budget of the active output profile.')
+        lines.append('# TYPE football_reports_report_budget_bytes gauge')
+        lines.append(f'football_reports_report_budget_bytes{{profile="{app.config["PDF_OUTPUT_PROFILE"]}"}} {budget}')
+    return Response('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
+
+
 # --- User Authentication Routes ---
 
 @app.route('/register', methods=['GET', 'POST'])
@@ -1032,6 +3473,402 @@ def logout():
     return redirect(url_for('login'))
 
 
+# --- CLI Commands ---
+
+report_cli = AppGroup('reports', help='Report storage maintenance commands.')
+app.cli.add_command(report_cli)
+
+@report_cli.command('import-legacy')
+def import_legacy_reports():
+    """Moves pre-versioning flat PDFs into the blob store as version 1 of their report."""
+    imported_paths, missing_paths = [], []
+    for model in REPORT_MODELS.values():
+        for report in model.query.filter(~model.versions.any()).all():
+            legacy_path = os.path.join(app.config['REPORT_FOLDER'], report.pdf_report_path)
+            if not os.path.exists(legacy_path):
+                missing_paths.append(legacy_path)
+                continue
+            with open(legacy_path, 'rb') as f:
+                blob = store_report_blob(f.read())
+            report.versions.append(ReportVersion(version=1, blob=blob, snapshot=report_snapshot(report), note='Imported'))
+            imported_paths.append(legacy_path)
+    db.session.commit()
+
+    for path in imported_paths:
+        os.remove(path)
+    click.echo(f'Imported {len(imported_paths)} legacy report(s) into the blob store.')
+    for path in missing_paths:
+        click.echo(f'Missing legacy PDF: {path}', err=True)
+    if missing_paths:
+        raise click.ClickException(f'{len(missing_paths)} report(s) without a version have no legacy PDF to import.')
+
+
+@report_cli.command('migrate-storage')
+@click.option('--from', 'source_kind', type=click.Choice(['local', 's3']), default='local', show_default=True)
+@click.option('--to', 'target_kind', type=click.Choice(['local', 's3']), required=True)
+def migrate_storage(source_kind, target_kind):
+    """Copies every report blob the target storage does not have yet, checking each hash."""
+    if source_kind == target_kind:
+        raise click.ClickException('--from and --to must name different storages.')
+    source, target = report_storage(kind=source_kind), report_storage(kind=target_kind)
+    copied = present = 0
+    for sha256 in source.keys():
+        if target.exists(sha256):
+            present += 1
+            continue
+        with source.open(sha256) as f:
+            data = f.read()
+        if hashlib.sha256(data).hexdigest() != sha256:
+            raise click.ClickException(f'Blob {sha256} in {source_kind} storage does not match its hash.')
+        target.put(sha256, data)
+        copied += 1
+    click.echo(f'Copied {copied} blob(s) to {target_kind} storage; {present} were already there.')
+
+
+@report_cli.command('rebuild-autocomplete')
+def rebuild_autocomplete():
+    """Recreates the autocomplete index from every saved player and match."""
+    uses = {}
+    for model, sources in AUTOCOMPLETE_SOURCES.items():
+        for attribute, field in sources.items():
+            column = getattr(model, attribute)
+            rows = db.session.query(model.club_id, column, func.count()).filter(column.isnot(None)).group_by(model.club_id, column)
+            for club_id, value, count in rows:
+                _count_autocomplete_use(uses, club_id, field, value, count)
+    db.session.query(AutocompleteValue).delete()
+    upsert_autocomplete_values(db.session.connection(), uses)
+    db.session.commit()
+    click.echo(f'Indexed {len(uses)} distinct value(s) across {len(AUTOCOMPLETE_FIELDS)} field(s).')
+
+
+@report_cli.command('precompress-static')
+def precompress_static():
+    """Writes .gz (and, with brotli installed, .br) variants of the compressible static files."""
+    encodings = [(name, suffix) for name, suffix in STATIC_ENCODINGS if name != 'br' or brotli]
+    written = 0
+    for filename in static_files():
+        if mimetypes.guess_type(filename)[0] not in COMPRESSIBLE_MIMETYPES:
+            continue
+        path = os.path.join(app.static_folder, filename)
+        with open(path, 'rb') as f:
+            data = f.read()
+        for encoding, suffix in encodings:
+            if encoding == 'br':
+                compressed = brotli.compress(data, quality=11)
+            else:
+                compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            with open(path + suffix, 'wb') as f:
+                f.write(compressed)
+            written += 1
+            click.echo(f'{filename}{suffix}: {len(data)} -> {len(compressed)} bytes')
+    if not brotli:
+        click.echo('brotli is not installed; only gzip variants were written.', err=True)
+    click.echo(f'Wrote {written} precompressed file(s).')
+
+
+# --- Backups ---
+# `flask backup create DIR` writes backup-<timestamp>.tar.gz holding a consistent database
+# snapshot (SQLite online backup API, or pg_dump on PostgreSQL), the report files that are
+# new or changed since the previous backup in DIR, and manifest.json. The manifest lists
+# every report file at snapshot time with its size, mtime and sha256, and names the archive
+# it builds on; a copy is kept next to the archive so the next run need not open the tar.
+# `flask backup restore ARCHIVE` follows that chain back to the full backup.
+
+backup_cli = AppGroup('backup', help='Database and report folder backups.')
+app.cli.add_command(backup_cli)
+
+BACKUP_MANIFEST_SUFFIX = '.manifest.json'
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def scan_report_files(previous_files):
+    """Lists the report folder as {relative path: {size, mtime_ns, sha256}}.
+
+    Files whose size and mtime match the previous manifest keep its hash without being re-read.
+    """
+    report_folder = app.config['REPORT_FOLDER']
+    files = {}
+    for root, _, names in os.walk(report_folder):
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            if name.endswith('.tmp') or not os.path.isfile(path):
+                continue # Half-written blobs (see store_report_blob)
+            rel_path = os.path.relpath(path, report_folder).replace(os.sep, '/')
+            stat = os.stat(path)
+            entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+            previous = previous_files.get(rel_path)
+            if previous and previous['size'] == entry['size'] and previous['mtime_ns'] == entry['mtime_ns']:
+                entry['sha256'] = previous['sha256']
+            else:
+                entry['sha256'] = file_sha256(path)
+            files[rel_path] = entry
+    return files
+
+def run_database_tool(args):
+    """Runs pg_dump/pg_restore, turning a missing or failing tool into a CLI error."""
+    try:
+        subprocess.run(args, check=True)
+    except FileNotFoundError:
+        raise click.ClickException(f'{args[0]} is not installed or not on PATH.')
+    except subprocess.CalledProcessError as e:
+        raise click.ClickException(f'{args[0]} failed with exit code {e.returncode}.')
+
+def snapshot_database(path):
+    """Writes a consistent copy of the live database to path and returns the dump format."""
+    url = db.engine.url
+    if url.get_backend_name() == 'sqlite':
+        source = db.engine.raw_connection()
+        target = sqlite3.connect(path)
+        try:
+            source.driver_connection.backup(target)
+        finally:
+            target.close()
+            source.close()
+        return 'sqlite'
+    if url.get_backend_name() == 'postgresql':
+        run_database_tool(['pg_dump', '--format=custom', '--no-owner', f'--file={path}',
+                           url.set(drivername='postgresql').render_as_string(hide_password=False)])
+        return 'pg_dump'
+    raise click.ClickException(f'Backups are not supported for {url.get_backend_name()} databases.')
+
+def restore_database(path, dump_format):
+    """Replaces the live database with a snapshot written by snapshot_database."""
+    url = db.engine.url
+    db.session.remove()
+    db.engine.dispose()
+    if dump_format == 'sqlite' and url.get_backend_name() == 'sqlite':
+        source = sqlite3.connect(path)
+        target = db.engine.raw_connection()
+        try:
+            source.backup(target.driver_connection)
+        finally:
+            target.close()
+            source.close()
+    elif dump_format == 'pg_dump' and url.get_backend_name() == 'postgresql':
+        run_database_tool(['pg_restore', '--clean', '--if-exists', '--no-owner', '--single-transaction',
+                           f'--dbname={url.set(drivername="postgresql").render_as_string(hide_password=False)}', path])
+    else:
+        raise click.ClickException(f'A {dump_format} snapshot cannot be restored into a {url.get_backend_name()} database.')
+
+def latest_backup_manifest(backup_dir):
+    """Returns (archive name, manifest) of the newest backup in backup_dir, or (None, None)."""
+    names = sorted(name for name in os.listdir(backup_dir) if name.endswith(BACKUP_MANIFEST_SUFFIX))
+    if not names:
+        return None, None
+    with open(os.path.join(backup_dir, names[-1])) as f:
+        manifest = json.load(f)
+    return manifest['archive'], manifest
+
+def read_backup_manifest(archive_path):
+    with tarfile.open(archive_path, 'r|gz') as tar:
+        for member in tar:
+            if member.name == 'manifest.json':
+                return json.load(tar.extractfile(member))
+    raise click.ClickException(f'{archive_path} has no manifest.json.')
+
+def add_bytes_to_tar(tar, name, data):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(data))
+
+@backup_cli.command('create')
+@click.argument('backup_dir', type=click.Path(file_okay=False))
+@click.option('--full', is_flag=True, help='Include every report file instead of only those changed since the last backup.')
+def create_backup(backup_dir, full):
+    """Writes a database snapshot plus new or changed report files to BACKUP_DIR."""
+    os.makedirs(backup_dir, exist_ok=True)
+    base_archive, base_manifest = (None, None) if full else latest_backup_manifest(backup_dir)
+    previous_files = base_manifest['files'] if base_manifest else {}
+    archive = f'backup-{datetime.now().strftime("%Y%m%d-%H%M%S")}.tar.gz'
+    archive_path = os.path.join(backup_dir, archive)
+    if os.path.exists(archive_path):
+        raise click.ClickException(f'{archive_path} already exists; wait a second and try again.')
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        # The database goes first: blobs are written before the rows that point at them are
+        # committed, so every file the snapshot references is already on disk for the scan.
+        db_path = os.path.join(work_dir, 'database')
+        dump_format = snapshot_database(db_path)
+        files = scan_report_files(previous_files)
+        changed = [rel_path for rel_path, entry in files.items() if previous_files.get(rel_path, {}).get('sha256') != entry['sha256']]
+        manifest = {
+            'archive': archive,
+            'base': base_archive,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'database': dump_format,
+            'files': files,
+            'included': changed,
+        }
+
+        partial_path = archive_path + '.partial'
+        with tarfile.open(partial_path, 'w:gz') as tar:
+            add_bytes_to_tar(tar, 'manifest.json', json.dumps(manifest, indent=1, sort_keys=True).encode('utf-8'))
+            tar.add(db_path, arcname='database')
+            for rel_path in changed:
+                tar.add(os.path.join(app.config['REPORT_FOLDER'], rel_path), arcname=f'reports/{rel_path}')
+        os.replace(partial_path, archive_path)
+
+    with open(os.path.join(backup_dir, archive[:-len('.tar.gz')] + BACKUP_MANIFEST_SUFFIX), 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    kind = f'incremental on {base_archive}' if base_archive else 'full'
+    if app.config['REPORT_STORAGE'] != 'local':
+        click.echo(f"Report blobs live in {app.config['REPORT_STORAGE']} storage; only files under the report folder were backed up.", err=True)
+    click.echo(f'Wrote {archive_path} ({kind}): database plus {len(changed)} of {len(files)} report file(s), '
+               f'{os.path.getsize(archive_path)} bytes.')
+
+@backup_cli.command('restore')
+@click.argument('archive_path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--force', is_flag=True, help='Overwrite a non-empty report folder and the current database.')
+def restore_backup(archive_path, force):
+    """Rebuilds the database and report folder from ARCHIVE_PATH and the backups it builds on."""
+    report_folder = app.config['REPORT_FOLDER']
+    if not force and os.path.isdir(report_folder) and os.listdir(report_folder):
+        raise click.ClickException(f'{report_folder} is not empty; pass --force to replace its contents.')
+
+    # Newest first: each file is taken from the latest archive in the chain that included it
+    backup_dir = os.path.dirname(os.path.abspath(archive_path))
+    archive_chain = [(archive_path, read_backup_manifest(archive_path))]
+    while archive_chain[-1][1]['base']:
+        base_path = os.path.join(backup_dir, archive_chain[-1][1]['base'])
+        if not os.path.exists(base_path):
+            raise click.ClickException(f'{base_path}, which {os.path.basename(archive_chain[-1][0])} builds on, is missing.')
+        archive_chain.append((base_path, read_backup_manifest(base_path)))
+
+    target = archive_chain[0][1]
+    wanted = {}
+    for path, manifest in archive_chain:
+        for rel_path in manifest['included']:
+            if rel_path in target['files'] and target['files'][rel_path]['sha256'] == manifest['files'][rel_path]['sha256']:
+                wanted.setdefault(rel_path, path)
+    missing = set(target['files']) - set(wanted)
+    if missing:
+        raise click.ClickException(f'{len(missing)} report file(s) are in no archive of the chain, e.g. {sorted(missing)[0]}.')
+
+    staging_dir = report_folder.rstrip('/\\') + '.restoring'
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(os.path.join(staging_dir, 'reports'))
+    with tempfile.TemporaryDirectory() as work_dir:
+        for path, _ in archive_chain:
+            with tarfile.open(path, 'r|gz') as tar:
+                for member in tar:
+                    if member.name == 'database' and path == archive_path:
+                        tar.extract(member, work_dir, filter='data')
+                    elif member.name.startswith('reports/'):
+                        rel_path = member.name[len('reports/'):]
+                        if wanted.get(rel_path) == path:
+                            tar.extract(member, staging_dir, filter='data')
+
+        for rel_path, entry in target['files'].items():
+            restored_path = os.path.join(staging_dir, 'reports', rel_path)
+            if file_sha256(restored_path) != entry['sha256']:
+                raise click.ClickException(f'{rel_path} does not match its manifest hash.')
+            os.utime(restored_path, ns=(entry['mtime_ns'], entry['mtime_ns']))
+
+        restore_database(os.path.join(work_dir, 'database'), target['database'])
+
+    shutil.rmtree(report_folder, ignore_errors=True)
+    os.replace(os.path.join(staging_dir, 'reports'), report_folder)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    click.echo(f'Restored the database and {len(target["files"])} report file(s) from {len(archive_chain)} archive(s).')
+
+
+@report_cli.command('rebuild-progression')
+def rebuild_progression():
+    """Recreates every player's progression series from their reports."""
+    profile_ids = [profile_id for profile_id, in db.session.query(PlayerProfile.id).order_by(PlayerProfile.id)]
+    db.session.query(ProgressionPoint).delete()
+    for start in range(0, len(profile_ids), 500):
+        refresh_progression(db.session.connection(), profile_ids[start:start + 500])
+    db.session.commit()
+    click.echo(f'Rebuilt {ProgressionPoint.query.count()} progression point(s) for {len(profile_ids)} player(s).')
+
+
+PLAYER_NOTES_FIELDS = [
+    'technical_tactical_notes', 'physical_notes', 'psychological_notes', 'social_notes',
+    'overall_performance_summary', 'key_strengths_exhibited', 'primary_areas_development', 'recommended_action_plan',
+]
+MATCH_NOTES_FIELDS = [
+    'home_lineup_notes', 'away_lineup_notes', 'home_attacking_phase', 'home_defensive_phase', 'home_key_transitions',
+    'away_attacking_phase', 'away_defensive_phase', 'away_key_transitions', 'overall_match_summary',
+    'key_turning_points', 'final_analyst_notes',
+]
+
+def sample_notes(length):
+    """Generates report-like filler text of the given length, with occasional line breaks."""
+    sentence = 'Presses high after losing the ball and recovers shape quickly when the line is broken. '
+    text = ''.join(sentence if i % 6 else sentence.strip() + '\n' for i in range(length // len(sentence) + 1))
+    return text[:length]
+
+def sample_player(notes_length=800):
+    """Builds an unsaved Player with typical field values for benchmarks."""
+    notes = sample_notes(notes_length)
+    return Player(
+        player_name='Sample Player', coach_name='Sample Coach', sub_team='U21', player_team='Sample FC',
+        position='CM', primary_positions='CM, CAM', jersey_number=8, dob='2006-04-12', preferred_foot='Right',
+        height=178.0, weight=71.5, report_period_start='2025-01-01', report_period_end='2025-03-31',
+        matches_played=12, total_minutes_played=960, goals=4, assists=6,
+        **{field: notes for field in PLAYER_NOTES_FIELDS},
+    )
+
+def time_render(render, iterations):
+    """Returns (average seconds, output bytes) for a renderer returning a BytesIO."""
+    size = len(render().getvalue()) # Warm-up, also keeps one-off font/image setup out of the timing
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return (time.perf_counter() - started_at) / iterations, size
+
+@report_cli.command('bench')
+@click.option('--iterations', default=20, show_default=True)
+@click.option('--notes-length', default=800, show_default=True, help='Characters per notes field.')
+def bench_reports(iterations, notes_length):
+    """Compares render time and size of the detailed and summary player reports."""
+    player = sample_player(notes_length)
+    detailed_time, detailed_size = time_render(lambda: create_detailed_player_report_pdf(player), iterations)
+    summary_time, summary_size = time_render(lambda: create_summary_player_report_pdf(player), iterations)
+    click.echo(f'detailed: {detailed_time * 1000:7.1f} ms {detailed_size / 1024:6.1f} KB')
+    click.echo(f' summary: {summary_time * 1000:7.1f} ms {summary_size / 1024:6.1f} KB')
+    click.echo(f' speedup: {detailed_time / summary_time:.1f}x')
+
+
+def sample_match(notes_length=800):
+    """Builds an unsaved Match with typical field values for benchmarks."""
+    return Match(
+        competition='Sample League', season='2024/25', match_date='2025-03-01', venue='Sample Park',
+        home_team='Sample FC', away_team='Visitors United', final_score_home=2, final_score_away=1,
+        home_formation_initial='4-3-3', away_formation_initial='4-4-2', man_of_the_match='Sample Player',
+        **{field: sample_notes(notes_length) for field in MATCH_NOTES_FIELDS},
+    )
+
+@report_cli.command('bench-profiles')
+@click.option('--logo', type=click.Path(exists=True, dir_okay=False), default=None, help='Logo image to embed in the header.')
+def bench_profiles(logo):
+    """Compares report sizes under each PDF output profile against its budget."""
+    player, match = sample_player(), sample_match()
+    renderers = [
+        ('detailed', lambda: create_detailed_player_report_pdf(player, logo)),
+        ('summary', lambda: create_summary_player_report_pdf(player, logo)),
+        ('match', lambda: create_match_report_pdf(match, match.home_team, logo)),
+    ]
+    configured = app.config['PDF_OUTPUT_PROFILE']
+    try:
+        for name, profile in PDF_OUTPUT_PROFILES.items():
+            app.config['PDF_OUTPUT_PROFILE'] = name
+            budget = profile['max_bytes']
+            for kind, render in renderers:
+                size = render().getbuffer().nbytes
+                verdict = 'no budget' if budget is None else ('OVER' if size > budget else 'ok')
+                click.echo(f'{name:>8} {kind:>8}: {size / 1024:7.1f} KB ({verdict})')
+    finally:
+        app.config['PDF_OUTPUT_PROFILE'] = configured
+
+
 if __name__ == '__main__':
     # Ensure necessary folders exist
     if not os.path.exists(UPLOAD_FOLDER):
@@ -0,0 +1,19 @@
+# Gunicorn settings, read from the working directory by: gunicorn app:app
+#
+# PDF render admission (RENDER_* in app.py) queues renders and answers 429 between the
+# request threads of one worker process, so workers must be threaded. With sync workers
+# each process serves a single request, nothing ever queues and a busy club is never refused.
+import os
+
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'gthread'
+# More threads than RENDER_MAX_CONCURRENCY, so requests beyond the render limit wait in the
+# admission queue (or get a 429) instead of waiting for a free thread.
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+
+
+def on_starting(server):
+    if server.cfg.worker_class_str in ('sync', 'gthread') and server.cfg.threads < 2:
+        server.log.warning('Render admission needs threaded workers: with one thread per worker, renders '
+                           'are neither queued nor rejected per club. Set --threads above 1.')
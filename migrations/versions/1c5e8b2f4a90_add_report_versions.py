@@ -0,0 +1,57 @@
+"""add report blobs and versions
+
+Revision ID: 1c5e8b2f4a90
+Revises: 
+Create Date: 2026-10-19 09:08:03.502771
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1c5e8b2f4a90'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('report_blob',
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('sha256')
+    )
+    op.create_table('report_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('player_id', sa.Integer(), nullable=True),
+    sa.Column('match_id', sa.Integer(), nullable=True),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('blob_sha256', sa.String(length=64), nullable=False),
+    sa.Column('snapshot', sa.Text(), nullable=True),
+    sa.Column('note', sa.String(length=100), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('created_by_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['blob_sha256'], ['report_blob.sha256'], ),
+    sa.ForeignKeyConstraint(['created_by_id'], ['user.id'], ),
+    sa.ForeignKeyConstraint(['match_id'], ['match.id'], ),
+    sa.ForeignKeyConstraint(['player_id'], ['player.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('match_id', 'version'),
+    sa.UniqueConstraint('player_id', 'version')
+    )
+    with op.batch_alter_table('report_version', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_report_version_blob_sha256'), ['blob_sha256'], unique=False)
+        batch_op.create_index(batch_op.f('ix_report_version_match_id'), ['match_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_report_version_player_id'), ['player_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('report_version', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_report_version_player_id'))
+        batch_op.drop_index(batch_op.f('ix_report_version_match_id'))
+        batch_op.drop_index(batch_op.f('ix_report_version_blob_sha256'))
+
+    op.drop_table('report_version')
+    op.drop_table('report_blob')
@@ -0,0 +1,26 @@
+"""add club data_version
+
+Revision ID: 3f9c2a7d1b10
+Revises: 1c5e8b2f4a90
+Create Date: 2026-10-19 09:12:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9c2a7d1b10'
+down_revision = '1c5e8b2f4a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('club', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('data_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('club', schema=None) as batch_op:
+        batch_op.drop_column('data_version')
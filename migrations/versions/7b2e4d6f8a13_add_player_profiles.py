@@ -0,0 +1,109 @@
+"""add player profiles
+
+Revision ID: 7b2e4d6f8a13
+Revises: 3f9c2a7d1b10
+Create Date: 2026-10-19 13:05:27.640913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b2e4d6f8a13'
+down_revision = '3f9c2a7d1b10'
+branch_labels = None
+depends_on = None
+
+PROFILE_FIELDS = ['player_name', 'jersey_number', 'dob', 'preferred_foot', 'height', 'weight']
+
+
+def profile_columns(player_name_nullable=False):
+    return [
+        sa.Column('player_name', sa.String(length=100), nullable=player_name_nullable),
+        sa.Column('jersey_number', sa.Integer(), nullable=True),
+        sa.Column('dob', sa.String(length=20), nullable=True),
+        sa.Column('preferred_foot', sa.String(length=20), nullable=True),
+        sa.Column('height', sa.Float(), nullable=True),
+        sa.Column('weight', sa.Float(), nullable=True),
+    ]
+
+
+def name_key(player_name):
+    return ' '.join((player_name or '').split()).lower()
+
+
+def upgrade():
+    op.create_table('player_profile',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('name_key', sa.String(length=100), nullable=False),
+    *profile_columns(),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['club_id'], ['club.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('player_profile', schema=None) as batch_op:
+        # One profile per club, name key and date of birth; a blank date of birth counts as a value
+        batch_op.create_index('uq_player_profile_identity', ['club_id', 'name_key', sa.text("coalesce(dob, '')")], unique=True)
+
+    with op.batch_alter_table('player', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('profile_id', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_player_profile_id'), ['profile_id'], unique=False)
+        batch_op.create_foreign_key('fk_player_profile_id_player_profile', 'player_profile', ['profile_id'], ['id'])
+
+    # Backfill: one profile per club, trimmed lower-cased name and date of birth. Reports are
+    # read oldest first so the newest non-blank value of each field ends up on the profile.
+    bind = op.get_bind()
+    player = sa.table('player', sa.column('id'), sa.column('club_id'), sa.column('created_at'), sa.column('profile_id'),
+                      *[sa.column(field) for field in PROFILE_FIELDS])
+    profile = sa.Table('player_profile', sa.MetaData(), sa.Column('id', sa.Integer(), primary_key=True),
+                       sa.Column('club_id'), sa.Column('name_key'), sa.Column('created_at'),
+                       *[sa.Column(field) for field in PROFILE_FIELDS])
+    groups = {}
+    for row in bind.execute(sa.select(player).order_by(player.c.created_at, player.c.id)):
+        key = (row.club_id, name_key(row.player_name), row.dob or None)
+        group = groups.setdefault(key, {'report_ids': [], 'values': {'player_name': row.player_name or ''}, 'created_at': row.created_at})
+        group['report_ids'].append(row.id)
+        for field in PROFILE_FIELDS:
+            value = getattr(row, field)
+            if field == 'player_name' and value:
+                value = ' '.join(value.split())
+            if value is not None and value != '':
+                group['values'][field] = value
+    for (club_id, key, dob), group in groups.items():
+        values = dict(group['values'], dob=dob)
+        profile_id = bind.execute(profile.insert().values(
+            club_id=club_id, name_key=key, created_at=group['created_at'], **values,
+        )).inserted_primary_key[0]
+        bind.execute(player.update().where(player.c.id.in_(group['report_ids'])).values(profile_id=profile_id))
+
+    with op.batch_alter_table('player', schema=None) as batch_op:
+        batch_op.alter_column('profile_id', existing_type=sa.Integer(), nullable=False)
+        for field in PROFILE_FIELDS:
+            batch_op.drop_column(field)
+
+
+def downgrade():
+    with op.batch_alter_table('player', schema=None) as batch_op:
+        for column in profile_columns(player_name_nullable=True):
+            batch_op.add_column(column)
+
+    bind = op.get_bind()
+    player = sa.table('player', sa.column('profile_id'), *[sa.column(field) for field in PROFILE_FIELDS])
+    profile = sa.table('player_profile', sa.column('id'), *[sa.column(field) for field in PROFILE_FIELDS])
+    bind.execute(player.update().values({
+        field: sa.select(profile.c[field]).where(profile.c.id == player.c.profile_id).scalar_subquery()
+        for field in PROFILE_FIELDS
+    }))
+
+    with op.batch_alter_table('player', schema=None) as batch_op:
+        batch_op.alter_column('player_name', existing_type=sa.String(length=100), nullable=False)
+        batch_op.drop_constraint('fk_player_profile_id_player_profile', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_player_profile_id'))
+        batch_op.drop_column('profile_id')
+
+    with op.batch_alter_table('player_profile', schema=None) as batch_op:
+        batch_op.drop_index('uq_player_profile_identity')
+
+    op.drop_table('player_profile')
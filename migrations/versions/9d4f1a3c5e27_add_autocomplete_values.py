@@ -0,0 +1,61 @@
+"""add autocomplete values
+
+Revision ID: 9d4f1a3c5e27
+Revises: 7b2e4d6f8a13
+Create Date: 2026-10-19 14:21:53.904117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4f1a3c5e27'
+down_revision = '7b2e4d6f8a13'
+branch_labels = None
+depends_on = None
+
+# table -> {column: autocomplete field}; home and away teams share the 'team' list
+SOURCES = {
+    'match': {'home_team': 'team', 'away_team': 'team', 'competition': 'competition', 'venue': 'venue', 'season': 'season'},
+    'player': {'coach_name': 'coach', 'sub_team': 'sub_team'},
+}
+VALUE_LENGTH = 100
+
+
+def upgrade():
+    op.create_table('autocomplete_value',
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('field', sa.String(length=30), nullable=False),
+    sa.Column('value_key', sa.String(length=100), nullable=False),
+    sa.Column('value', sa.String(length=100), nullable=False),
+    sa.Column('use_count', sa.Integer(), nullable=False),
+    sa.Column('last_used_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['club_id'], ['club.id'], ),
+    sa.PrimaryKeyConstraint('club_id', 'field', 'value_key')
+    )
+
+    # Backfill: one row per club, field and trimmed lower-cased value, counting the rows that
+    # use it. Rows are read oldest first so the newest spelling of a value is the one kept.
+    bind = op.get_bind()
+    uses = {}
+    for table_name, columns in SOURCES.items():
+        source = sa.table(table_name, sa.column('id'), sa.column('club_id'), *[sa.column(column) for column in columns])
+        for row in bind.execute(sa.select(source).where(source.c.club_id.isnot(None)).order_by(source.c.id)):
+            for column, field in columns.items():
+                value = ' '.join((getattr(row, column) or '').split())[:VALUE_LENGTH]
+                if not value:
+                    continue
+                key = (row.club_id, field, value.lower())
+                uses[key] = (value, uses.get(key, (None, 0))[1] + 1)
+    autocomplete_value = sa.table('autocomplete_value', sa.column('club_id'), sa.column('field'), sa.column('value_key'),
+                                  sa.column('value'), sa.column('use_count'), sa.column('last_used_at'))
+    if uses:
+        bind.execute(autocomplete_value.insert().values(last_used_at=sa.func.now()), [
+            {'club_id': club_id, 'field': field, 'value_key': value_key, 'value': value, 'use_count': count}
+            for (club_id, field, value_key), (value, count) in uses.items()
+        ])
+
+
+def downgrade():
+    op.drop_table('autocomplete_value')
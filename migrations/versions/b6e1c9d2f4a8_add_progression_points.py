@@ -0,0 +1,54 @@
+"""add progression points
+
+Revision ID: b6e1c9d2f4a8
+Revises: 9d4f1a3c5e27
+Create Date: 2026-10-19 16:02:11.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e1c9d2f4a8'
+down_revision = '9d4f1a3c5e27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('progression_point',
+    sa.Column('profile_id', sa.Integer(), nullable=False),
+    sa.Column('period_start', sa.String(length=20), nullable=False),
+    sa.Column('period_end', sa.String(length=20), nullable=False),
+    sa.Column('report_id', sa.Integer(), nullable=False),
+    sa.Column('matches_played', sa.Integer(), nullable=False),
+    sa.Column('minutes', sa.Integer(), nullable=False),
+    sa.Column('goals', sa.Integer(), nullable=False),
+    sa.Column('assists', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['profile_id'], ['player_profile.id'], ),
+    sa.PrimaryKeyConstraint('profile_id', 'period_start', 'period_end')
+    )
+
+    # Backfill: one point per profile and reporting period. Reports are read oldest first so
+    # the latest report on a period is the one whose figures are kept.
+    bind = op.get_bind()
+    player = sa.table('player', sa.column('id'), sa.column('profile_id'), sa.column('created_at'),
+                      sa.column('report_period_start'), sa.column('report_period_end'), sa.column('matches_played'),
+                      sa.column('total_minutes_played'), sa.column('goals'), sa.column('assists'))
+    points = {}
+    for report in bind.execute(sa.select(player).order_by(player.c.created_at, player.c.id)):
+        key = (report.profile_id, report.report_period_start or '', report.report_period_end or '')
+        points[key] = {
+            'profile_id': key[0], 'period_start': key[1], 'period_end': key[2], 'report_id': report.id,
+            'matches_played': report.matches_played or 0, 'minutes': report.total_minutes_played or 0,
+            'goals': report.goals or 0, 'assists': report.assists or 0,
+        }
+    progression_point = sa.table('progression_point', *[sa.column(column) for column in (
+        'profile_id', 'period_start', 'period_end', 'report_id', 'matches_played', 'minutes', 'goals', 'assists')])
+    if points:
+        bind.execute(progression_point.insert(), list(points.values()))
+
+
+def downgrade():
+    op.drop_table('progression_point')
@@ -0,0 +1,51 @@
+// Suggests previously used values for inputs marked with data-autocomplete-url.
+// Each input gets its own <datalist>, refreshed from the server as the user types.
+(function () {
+    var DELAY_MS = 120;
+
+    document.querySelectorAll('input[data-autocomplete-url]').forEach(function (input) {
+        var datalist = document.createElement('datalist');
+        datalist.id = input.id + '-suggestions';
+        input.setAttribute('list', datalist.id);
+        input.setAttribute('autocomplete', 'off');
+        input.parentNode.appendChild(datalist);
+
+        var cache = {};
+        var timer = null;
+        var pending = null;
+
+        function show(values) {
+            datalist.innerHTML = '';
+            values.forEach(function (value) {
+                var option = document.createElement('option');
+                option.value = value;
+                datalist.appendChild(option);
+            });
+        }
+
+        function load() {
+            var prefix = input.value.trim().toLowerCase();
+            if (cache.hasOwnProperty(prefix)) {
+                show(cache[prefix]);
+                return;
+            }
+            if (pending) {
+                pending.abort();
+            }
+            pending = new AbortController();
+            fetch(input.dataset.autocompleteUrl + '?q=' + encodeURIComponent(prefix), {signal: pending.signal, credentials: 'same-origin'})
+                .then(function (response) { return response.ok ? response.json() : []; })
+                .then(function (values) {
+                    cache[prefix] = values;
+                    show(values);
+                })
+                .catch(function () {});
+        }
+
+        input.addEventListener('input', function () {
+            clearTimeout(timer);
+            timer = setTimeout(load, DELAY_MS);
+        });
+        input.addEventListener('focus', load);
+    });
+})();
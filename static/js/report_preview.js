@@ -0,0 +1,36 @@
+// Live HTML preview for report forms marked with data-preview-url.
+// The form is posted (without the logo upload) a moment after the user stops typing,
+// and the returned fragment replaces the contents of the data-preview-target element.
+(function () {
+    var DELAY_MS = 400;
+
+    document.querySelectorAll('form[data-preview-url]').forEach(function (form) {
+        var target = document.getElementById(form.getAttribute('data-preview-target'));
+        if (!target) {
+            return;
+        }
+        var timer = null;
+        var latest = 0;
+
+        function refresh() {
+            var data = new FormData(form);
+            data.delete('club_logo');
+            var request = ++latest;
+            fetch(form.getAttribute('data-preview-url'), {method: 'POST', body: data, credentials: 'same-origin'})
+                .then(function (response) { return response.ok ? response.text() : null; })
+                .then(function (html) {
+                    // Ignore responses that arrive after a newer request was sent
+                    if (html !== null && request === latest) {
+                        target.innerHTML = html;
+                    }
+                })
+                .catch(function () {});
+        }
+
+        form.addEventListener('input', function () {
+            clearTimeout(timer);
+            timer = setTimeout(refresh, DELAY_MS);
+        });
+        refresh();
+    });
+})();
@@ -0,0 +1,87 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+
+# app.py reads DATABASE_URL at import time, so point it at a scratch database first
+_database_dir = tempfile.mkdtemp(prefix='football-reports-tests-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_database_dir, 'test.db')
+
+import app as football_reports  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path):
+    flask_app = football_reports.app
+    flask_app.config.update(
+        TESTING=True,
+        REPORT_STORAGE='local',
+        REPORT_FOLDER=str(tmp_path / 'reports'),
+        UPLOAD_FOLDER=str(tmp_path / 'uploads'),
+        METRICS_TOKEN='test-token',
+    )
+    os.makedirs(flask_app.config['REPORT_FOLDER'])
+    os.makedirs(flask_app.config['UPLOAD_FOLDER'])
+    # No app context stays pushed during the test, so each request gets its own session as in production
+    with flask_app.app_context():
+        football_reports.db.create_all()
+    yield flask_app
+    with flask_app.app_context():
+        football_reports.db.drop_all()
+    football_reports.fragment_cache.clear()
+
+
+@pytest.fixture
+def client(app):
+    """A client logged in as the only user of the club 'Barcelona'."""
+    client = app.test_client()
+    client.post('/register', data={'club_name': 'Barcelona', 'username': 'scout', 'password': 'secret1'})
+    response = client.post('/login', data={'username': 'scout', 'password': 'secret1'})
+    assert response.status_code == 302
+    return client
+
+
+@pytest.fixture
+def player_form():
+    """Builds the form data of a detailed player report, overriding any field."""
+    def build(**fields):
+        return {
+            'report_type_choice': 'default_detailed_player_report',
+            'player_name': 'Shivam Chopra', 'dob': '2005-03-03', 'sub_team': 'U21', 'coach_name': 'Pep',
+            'report_period_start': '2025-01-01', 'report_period_end': '2025-02-01',
+            'matches_played': '6', 'total_minutes_played': '540', 'goals': '3', 'assists': '2',
+            'technical_tactical_notes': 'Good passing.',
+            **fields,
+        }
+    return build
+
+
+@pytest.fixture
+def match_form():
+    """Builds the form data of a match report, overriding any field."""
+    def build(**fields):
+        return {
+            'report_type_choice': 'default_match_report',
+            'match_date': '2025-03-01', 'season': '2024/25', 'home_team': 'Barcelona', 'away_team': 'Real Madrid',
+            'final_score_home': '2', 'final_score_away': '1',
+            **fields,
+        }
+    return build
+
+
+@pytest.fixture
+def assert_query_budget():
+    """Context manager failing with the executed statements if its block runs more than max_queries queries.
+
+        with assert_query_budget(3):
+            client.get('/players')
+    """
+    @contextmanager
+    def budget(max_queries):
+        with football_reports.track_queries() as stats:
+            yield stats
+        if stats.count > max_queries:
+            details = '\n'.join(f'{n} x {sql}' for sql, n in stats.statements.items())
+            raise AssertionError(f'{stats.count} queries run, budget is {max_queries}:\n{details}')
+    return budget
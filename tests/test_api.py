@@ -0,0 +1,71 @@
+import re
+
+import pytest
+
+
+@pytest.fixture
+def matches(client, match_form):
+    for i in range(5):
+        client.post('/generate_match_report', data=match_form(away_team=f'Rival {i}'))
+
+
+def test_list_pages_through_cursor_and_link_header(client, matches):
+    response = client.get('/api/v1/matches?limit=2&fields=away_team')
+    seen = []
+    while True:
+        body = response.get_json()
+        seen.extend(item['away_team'] for item in body['data'])
+        if body['next_cursor'] is None:
+            assert 'Link' not in response.headers
+            break
+        next_url = re.fullmatch(r'<(.+)>; rel="next"', response.headers['Link']).group(1)
+        assert f'cursor={body["next_cursor"]}' in next_url and 'limit=2' in next_url
+        response = client.get(next_url)
+    assert seen == [f'Rival {i}' for i in range(5)]
+
+
+def test_fields_limits_the_response(client, matches):
+    item = client.get('/api/v1/matches/1?fields=home_team,away_team').get_json()['data']
+    assert item == {'id': 1, 'home_team': 'Barcelona', 'away_team': 'Rival 0'}
+
+
+def test_player_fields_include_profile_fields(client, player_form):
+    client.post('/generate_player_report', data=player_form())
+    item = client.get('/api/v1/players/1?fields=player_name,dob,goals').get_json()['data']
+    assert item == {'id': 1, 'player_name': 'Shivam Chopra', 'dob': '2005-03-03', 'goals': 3}
+
+
+@pytest.mark.parametrize('url', ['/api/v1/matches?fields=away_team,club_id', '/api/v1/matches/1?fields=password_hash'])
+def test_unknown_field_is_a_bad_request(client, matches, url):
+    response = client.get(url)
+    assert response.status_code == 400
+    assert 'Unknown field' in response.get_json()['error']
+
+
+def test_another_clubs_report_is_not_found(app, client, matches, match_form):
+    other = app.test_client()
+    other.post('/register', data={'club_name': 'Sevilla', 'username': 'rival', 'password': 'secret2'})
+    other.post('/login', data={'username': 'rival', 'password': 'secret2'})
+    other.post('/generate_match_report', data=match_form(home_team='Sevilla'))
+
+    assert client.get('/api/v1/matches/6').status_code == 404
+    assert other.get('/api/v1/matches/1').status_code == 404
+    assert [item['id'] for item in other.get('/api/v1/matches').get_json()['data']] == [6]
+
+
+def test_anonymous_request_gets_a_json_401(app):
+    response = app.test_client().get('/api/v1/players')
+    assert response.status_code == 401
+    assert response.get_json() == {'error': 'Authentication required.'}
+
+
+def test_unchanged_list_is_not_modified(client, matches, match_form):
+    etag = client.get('/api/v1/matches').headers['ETag']
+    response = client.get('/api/v1/matches', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+
+    client.post('/generate_match_report', data=match_form(away_team='Rival 5'))
+    response = client.get('/api/v1/matches', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert len(response.get_json()['data']) == 6
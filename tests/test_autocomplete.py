@@ -0,0 +1,57 @@
+from app import AutocompleteValue, db
+
+
+def team_counts(app, club_id=1):
+    with app.app_context():
+        rows = db.session.query(AutocompleteValue).filter_by(club_id=club_id, field='team')
+        return {row.value: row.use_count for row in rows}
+
+
+def test_saving_a_report_counts_its_values(app, client, match_form):
+    client.post('/generate_match_report', data=match_form())
+    assert team_counts(app) == {'Barcelona': 1, 'Real Madrid': 1}
+    client.post('/generate_match_report', data=match_form(away_team='Sevilla'))
+    assert team_counts(app) == {'Barcelona': 2, 'Real Madrid': 1, 'Sevilla': 1}
+
+
+def test_editing_other_fields_keeps_the_counts(app, client, match_form):
+    client.post('/generate_match_report', data=match_form())
+    client.post('/edit_match/1', data=match_form(overall_match_summary='A tight game.'))
+    assert team_counts(app) == {'Barcelona': 1, 'Real Madrid': 1}
+
+
+def test_replacing_a_value_moves_its_use(app, client, match_form):
+    client.post('/generate_match_report', data=match_form())
+    client.post('/generate_match_report', data=match_form(match_date='2025-03-08'))
+    client.post('/edit_match/1', data=match_form(away_team='Sevilla'))
+    assert team_counts(app) == {'Barcelona': 2, 'Real Madrid': 1, 'Sevilla': 1}
+    client.post('/edit_match/2', data=match_form(match_date='2025-03-08', away_team='Sevilla'))
+    assert team_counts(app) == {'Barcelona': 2, 'Sevilla': 2}
+
+
+def test_deleting_a_report_drops_unused_values(app, client, match_form):
+    client.post('/generate_match_report', data=match_form())
+    client.post('/generate_match_report', data=match_form(away_team='Sevilla'))
+    client.post('/delete_match/2')
+    assert team_counts(app) == {'Barcelona': 1, 'Real Madrid': 1}
+    client.post('/delete_match/1')
+    assert team_counts(app) == {}
+
+
+def test_values_differing_in_case_and_whitespace_are_one_entry(app, client, match_form):
+    client.post('/generate_match_report', data=match_form(away_team='real  madrid '))
+    client.post('/generate_match_report', data=match_form(away_team='Real Madrid'))
+    assert team_counts(app) == {'Barcelona': 2, 'Real Madrid': 2} # The newest spelling is kept
+
+
+def test_suggestions_are_the_clubs_values_most_used_first(app, client, match_form):
+    for away_team in ['Real Betis', 'Real Madrid', 'Real Madrid', 'Rayo Vallecano', 'Valencia']:
+        client.post('/generate_match_report', data=match_form(away_team=away_team))
+    other = app.test_client()
+    other.post('/register', data={'club_name': 'Zaragoza', 'username': 'rival', 'password': 'secret2'})
+    other.post('/login', data={'username': 'rival', 'password': 'secret2'})
+    other.post('/generate_match_report', data=match_form(home_team='Real Zaragoza'))
+
+    assert client.get('/autocomplete/team?q=re').get_json() == ['Real Madrid', 'Real Betis']
+    assert client.get('/autocomplete/team?q=RA').get_json() == ['Rayo Vallecano']
+    assert other.get('/autocomplete/team?q=re').get_json() == ['Real Madrid', 'Real Zaragoza']
@@ -0,0 +1,56 @@
+import os
+import shutil
+from datetime import datetime
+
+import pytest
+
+import app as football_reports
+from app import Player, db
+
+
+@pytest.fixture
+def backup_clock(monkeypatch):
+    """Moves the clock a second on every reading, as archives are named after the second they were made in."""
+    readings = (datetime(2025, 6, 1, 12, 0, second) for second in range(60))
+
+    class Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return next(readings)
+    monkeypatch.setattr(football_reports, 'datetime', Clock)
+
+
+def test_incremental_backup_restores_database_and_reports(app, client, player_form, tmp_path, backup_clock):
+    runner = app.test_cli_runner()
+    backup_dir = str(tmp_path / 'backups')
+    client.post('/generate_player_report', data=player_form())
+    result = runner.invoke(args=['backup', 'create', backup_dir])
+    assert result.exit_code == 0, result.output
+    assert '(full)' in result.output
+
+    client.post('/generate_player_report', data=player_form(player_name='Second Player'))
+    result = runner.invoke(args=['backup', 'create', backup_dir])
+    assert result.exit_code == 0, result.output
+    assert 'incremental on backup-' in result.output
+    latest = sorted(name for name in os.listdir(backup_dir) if name.endswith('.tar.gz'))[-1]
+    report_files = sorted(os.listdir(app.config['REPORT_FOLDER']))
+
+    client.post('/generate_player_report', data=player_form(player_name='Not Backed Up'))
+    shutil.rmtree(app.config['REPORT_FOLDER'])
+    result = runner.invoke(args=['backup', 'restore', os.path.join(backup_dir, latest)])
+    assert result.exit_code == 0, result.output
+
+    assert sorted(os.listdir(app.config['REPORT_FOLDER'])) == report_files
+    with app.app_context():
+        assert sorted(player.player_name for player in db.session.query(Player)) == ['Second Player', 'Shivam Chopra']
+
+
+def test_restore_refuses_a_non_empty_report_folder(app, client, player_form, tmp_path):
+    runner = app.test_cli_runner()
+    client.post('/generate_player_report', data=player_form())
+    assert runner.invoke(args=['backup', 'create', str(tmp_path / 'backups')]).exit_code == 0
+    archive = next(name for name in os.listdir(tmp_path / 'backups') if name.endswith('.tar.gz'))
+
+    result = runner.invoke(args=['backup', 'restore', str(tmp_path / 'backups' / archive)])
+    assert result.exit_code == 1
+    assert 'is not empty; pass --force' in result.output
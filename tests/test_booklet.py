@@ -0,0 +1,65 @@
+import re
+
+import pytest
+
+# (name, sub team, period start, period end)
+REPORTS = [
+    ('Shivam Chopra', 'U21', '2025-01-01', '2025-01-31'),
+    ('Ana Lopez', 'U21', '2025-02-01', '2025-02-28'),
+    ('Leo Garcia', 'U18', '2025-03-01', '2025-03-31'),
+]
+
+
+def outline_entries(pdf):
+    """Titles of the PDF outline's entries, in order."""
+    titles = re.findall(rb'/Parent \d+ 0 R[^()]*?/Title \(((?:[^()\\]|\\.)*)\)', pdf)
+    return [re.sub(rb'\\(.)', rb'\1', title).decode('latin-1') for title in titles]
+
+
+@pytest.fixture
+def reports(client, player_form):
+    for name, sub_team, start, end in REPORTS:
+        client.post('/generate_player_report', data=player_form(
+            player_name=name, sub_team=sub_team, report_period_start=start, report_period_end=end,
+        ))
+
+
+def test_booklet_outlines_every_report_by_sub_team_and_name(client, reports):
+    response = client.post('/players/booklet', data={})
+    assert response.status_code == 200
+    assert response.mimetype == 'application/pdf'
+    assert outline_entries(response.data) == [
+        'Leo Garcia (01/03/2025 - 31/03/2025)',
+        'Ana Lopez (01/02/2025 - 28/02/2025)',
+        'Shivam Chopra (01/01/2025 - 31/01/2025)',
+    ]
+
+
+def test_booklet_filters_by_sub_team(client, reports):
+    response = client.post('/players/booklet', data={'sub_team': 'U21'})
+    assert [entry.split(' (')[0] for entry in outline_entries(response.data)] == ['Ana Lopez', 'Shivam Chopra']
+
+
+@pytest.mark.parametrize('period_from, period_to, names', [
+    ('2025-02-10', '2025-02-20', ['Ana Lopez']),
+    ('2025-01-31', '2025-03-01', ['Leo Garcia', 'Ana Lopez', 'Shivam Chopra']), # Periods overlapping at one day count
+    ('2025-02-15', '', ['Leo Garcia', 'Ana Lopez']),
+    ('', '2025-01-15', ['Shivam Chopra']),
+])
+def test_booklet_filters_by_overlapping_period(client, reports, period_from, period_to, names):
+    response = client.post('/players/booklet', data={'period_from': period_from, 'period_to': period_to})
+    assert [entry.split(' (')[0] for entry in outline_entries(response.data)] == names
+
+
+def test_booklet_over_the_player_cap_is_refused(app, client, reports, monkeypatch):
+    monkeypatch.setitem(app.config, 'BOOKLET_MAX_PLAYERS', 2)
+    response = client.post('/players/booklet', data={})
+    assert response.mimetype == 'text/html'
+    assert 'at most 2 player reports; this selection has 3' in response.get_data(as_text=True)
+    assert client.post('/players/booklet', data={'sub_team': 'U21'}).mimetype == 'application/pdf'
+
+
+def test_empty_selection_is_refused(client, reports):
+    response = client.post('/players/booklet', data={'sub_team': 'U16'})
+    assert response.mimetype == 'text/html'
+    assert 'No player reports match this selection.' in response.get_data(as_text=True)
@@ -0,0 +1,62 @@
+import re
+
+import pytest
+
+import app as football_reports
+from app import Club, db
+
+LIST_PAGES = ['/players', '/matches']
+
+
+@pytest.fixture
+def reports(client, player_form, match_form):
+    client.post('/generate_player_report', data=player_form())
+    client.post('/generate_match_report', data=match_form())
+    client.get('/players') # Consumes the flash messages of the two saves
+
+
+def club_data_version(app):
+    with app.app_context():
+        return db.session.get(Club, 1).data_version
+
+
+@pytest.mark.parametrize('url', LIST_PAGES)
+def test_unchanged_list_page_is_not_modified(client, reports, url):
+    etag = client.get(url).headers['ETag']
+    football_reports.fragment_cache.clear() # So a rendered page would have to query the list again
+
+    with football_reports.track_queries() as stats:
+        response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+    list_queries = [sql for sql in stats.statements if re.search(r'\bFROM (player|match)\b', sql)]
+    assert list_queries == []
+
+
+@pytest.mark.parametrize('edit_url, form, url', [
+    ('/edit_player/1', 'player_form', '/players'),
+    ('/edit_match/1', 'match_form', '/matches'),
+])
+def test_editing_a_report_changes_the_page(app, client, reports, player_form, match_form, edit_url, form, url):
+    etag = client.get(url).headers['ETag']
+    data_version = club_data_version(app)
+
+    build = player_form if form == 'player_form' else match_form
+    client.post(edit_url, data=build(coach_name='Xavi', venue='Camp Nou'))
+    assert club_data_version(app) > data_version
+
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+@pytest.mark.parametrize('url', LIST_PAGES)
+def test_page_with_pending_flash_messages_is_rendered(client, reports, url):
+    etag = client.get(url).headers['ETag']
+    with client.session_transaction() as session:
+        session['_flashes'] = [('success', 'Saved.')]
+
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert 'Saved.' in response.get_data(as_text=True)
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
@@ -0,0 +1,110 @@
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+
+import app as football_reports
+from app import (
+    Match, Player, create_detailed_player_report_pdf, create_match_report_pdf, create_summary_player_report_pdf, db,
+    sample_match, sample_player,
+)
+
+
+def move_clock_forward(monkeypatch, seconds):
+    """Makes the wall clock seen by app.py and ReportLab read `seconds` later, instead of sleeping."""
+    now = time.time() + seconds
+    localtime, gmtime, strftime = time.localtime, time.gmtime, time.strftime
+    monkeypatch.setattr(time, 'time', lambda: now)
+    monkeypatch.setattr(time, 'localtime', lambda secs=None: localtime(now if secs is None else secs))
+    monkeypatch.setattr(time, 'gmtime', lambda secs=None: gmtime(now if secs is None else secs))
+    monkeypatch.setattr(time, 'strftime', lambda format, t=None: strftime(format, localtime(now) if t is None else t))
+
+    class LaterDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.fromtimestamp(now, tz)
+    monkeypatch.setattr(football_reports, 'datetime', LaterDatetime)
+
+
+def sample_cases():
+    player, match = sample_player(), sample_match()
+    player.created_at = match.created_at = datetime(2025, 3, 1, 18, 30)
+    return {
+        'sample player (detailed)': lambda: create_detailed_player_report_pdf(player),
+        'sample player (summary)': lambda: create_summary_player_report_pdf(player),
+        'sample match': lambda: create_match_report_pdf(match, match.home_team),
+    }
+
+
+@pytest.mark.parametrize('case', list(sample_cases()))
+def test_sample_reports_render_byte_identical_later(app, monkeypatch, case):
+    render = sample_cases()[case]
+    first = render().getvalue()
+    move_clock_forward(monkeypatch, 3600)
+    assert render().getvalue() == first
+
+
+def test_saved_reports_render_byte_identical_later(app, client, player_form, match_form, monkeypatch):
+    client.post('/generate_player_report', data=player_form())
+    client.post('/generate_match_report', data=match_form())
+    with app.app_context():
+        player, match = db.session.query(Player).one(), db.session.query(Match).one()
+        renders = [lambda: create_detailed_player_report_pdf(player), lambda: create_match_report_pdf(match, match.club.name)]
+
+        first = [render().getvalue() for render in renders]
+        move_clock_forward(monkeypatch, 3600)
+        assert [render().getvalue() for render in renders] == first
+
+
+def test_creation_date_is_when_the_record_was_created(app):
+    player = sample_player()
+    player.created_at = datetime(2025, 3, 1, 18, 30)
+    assert b"/CreationDate (D:20250301183000+00'00')" in create_summary_player_report_pdf(player).getvalue()
+
+
+def database_is_writable():
+    """Whether another connection can take the SQLite write lock right now."""
+    connection = sqlite3.connect(db.engine.url.database, timeout=0)
+    try:
+        connection.execute('BEGIN IMMEDIATE')
+        connection.rollback()
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize('url, form', [
+    ('/generate_player_report', 'player_form'), ('/generate_match_report', 'match_form'),
+    ('/edit_player/1', 'player_form'), ('/edit_match/1', 'match_form'),
+])
+def test_rendering_does_not_hold_the_write_lock(app, client, player_form, match_form, monkeypatch, url, form):
+    client.post('/generate_player_report', data=player_form())
+    client.post('/generate_match_report', data=match_form())
+    slot = football_reports.render_admission.slot
+    writable = []
+
+    @contextmanager
+    def probing_slot(*args):
+        with slot(*args):
+            writable.append(database_is_writable())
+            yield
+            writable.append(database_is_writable())
+    monkeypatch.setattr(football_reports.render_admission, 'slot', probing_slot)
+
+    build = player_form if form == 'player_form' else match_form
+    response = client.post(url, data=build(player_name='Renamed Player', home_team='Renamed FC'))
+    assert response.status_code == 302
+    assert writable == [True, True]
+
+
+def test_clock_changes_output_when_determinism_is_off(app, monkeypatch):
+    # Guards the test above: without DETERMINISTIC_PDF the moved clock must show up in the output
+    monkeypatch.setitem(app.config, 'DETERMINISTIC_PDF', False)
+    render = sample_cases()['sample player (detailed)']
+    first = render().getvalue()
+    move_clock_forward(monkeypatch, 3600)
+    assert render().getvalue() != first
@@ -0,0 +1,31 @@
+import os
+
+from app import Club, Match, db
+
+
+def add_unversioned_match(app, pdf_report_path):
+    with app.app_context():
+        club_id = db.session.query(Club.id).scalar()
+        db.session.add(Match(match_date='2025-03-01', home_team='Home', away_team='Away', club_id=club_id, pdf_report_path=pdf_report_path))
+        db.session.commit()
+
+
+def test_import_legacy_moves_flat_pdfs_into_versions(app, client):
+    add_unversioned_match(app, 'legacy.pdf')
+    legacy_path = os.path.join(app.config['REPORT_FOLDER'], 'legacy.pdf')
+    with open(legacy_path, 'wb') as f:
+        f.write(b'%PDF-1.4 legacy')
+
+    result = app.test_cli_runner().invoke(args=['reports', 'import-legacy'])
+    assert result.exit_code == 0, result.output
+    assert 'Imported 1 legacy report(s)' in result.output
+    assert not os.path.exists(legacy_path)
+    with app.app_context():
+        assert [version.note for version in db.session.query(Match).one().versions] == ['Imported']
+
+
+def test_import_legacy_fails_for_reports_without_a_pdf(app, client):
+    add_unversioned_match(app, 'gone.pdf')
+    result = app.test_cli_runner().invoke(args=['reports', 'import-legacy'])
+    assert result.exit_code == 1
+    assert 'Missing legacy PDF' in result.output and '1 report(s) without a version' in result.output
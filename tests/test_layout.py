@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from app import (
+    MATCH_NOTES_FIELDS, PLAYER_NOTES_FIELDS, Match, Player, create_detailed_player_report_pdf, create_match_report_pdf,
+    sample_notes,
+)
+
+NOTES_CHARS = 50000
+# Allowed factor above linear growth of layout time between a quarter and the full notes length
+LINEAR_TOLERANCE = 1.5
+# Each size is timed this many times and the fastest run kept, so a slow outlier does not fail the test
+REPEATS = 3
+
+
+def render_player(notes):
+    return create_detailed_player_report_pdf(Player(player_name='Stress Test', **notes))
+
+
+def render_match(notes):
+    return create_match_report_pdf(Match(match_date='2025-01-01', home_team='Home', away_team='Away', **notes), 'Home')
+
+
+@pytest.mark.parametrize('render, fields', [(render_player, PLAYER_NOTES_FIELDS), (render_match, MATCH_NOTES_FIELDS)])
+def test_layout_time_grows_linearly_with_notes_length(app, render, fields):
+    timings = []
+    for size in (NOTES_CHARS // 4, NOTES_CHARS):
+        notes = {field: sample_notes(size) for field in fields}
+        best = float('inf')
+        for _ in range(REPEATS):
+            started_at = time.perf_counter()
+            pdf = render(notes).getvalue()
+            best = min(best, time.perf_counter() - started_at)
+            assert pdf.startswith(b'%PDF')
+        timings.append((size, best))
+
+    (small_size, small_time), (large_size, large_time) = timings
+    growth = (large_time / small_time) / (large_size / small_size)
+    assert growth <= LINEAR_TOLERANCE, f'layout time grew {growth:.2f}x faster than linearly'
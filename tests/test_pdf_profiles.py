@@ -0,0 +1,56 @@
+import os
+
+import pytest
+from PIL import Image
+from reportlab.lib.units import inch
+
+from app import (
+    HEADER_LOGO_SIZE, PDF_OUTPUT_PROFILES, create_detailed_player_report_pdf, create_match_report_pdf,
+    create_summary_player_report_pdf, prepare_logo, sample_match, sample_player,
+)
+
+BUDGETED_PROFILES = [name for name, profile in PDF_OUTPUT_PROFILES.items() if profile['max_bytes'] is not None]
+
+
+@pytest.fixture
+def logo_path(tmp_path):
+    """A large photographic logo, noisy so it does not compress away on its own."""
+    path = str(tmp_path / 'logo.png')
+    Image.frombytes('RGB', (1200, 1200), os.urandom(1200 * 1200 * 3)).save(path)
+    return path
+
+
+def render_detailed(logo_path):
+    return create_detailed_player_report_pdf(sample_player(), logo_path)
+
+
+def render_summary(logo_path):
+    return create_summary_player_report_pdf(sample_player(), logo_path)
+
+
+def render_match(logo_path):
+    match = sample_match()
+    return create_match_report_pdf(match, match.home_team, logo_path)
+
+
+@pytest.mark.parametrize('profile_name', BUDGETED_PROFILES)
+@pytest.mark.parametrize('render', [render_detailed, render_summary, render_match])
+def test_sample_reports_fit_the_profile_budget(app, monkeypatch, logo_path, profile_name, render):
+    monkeypatch.setitem(app.config, 'PDF_OUTPUT_PROFILE', profile_name)
+    size = render(logo_path).getbuffer().nbytes
+    budget = PDF_OUTPUT_PROFILES[profile_name]['max_bytes']
+    assert size <= budget, f'{render.__name__} is {size} bytes under {profile_name!r}, budget is {budget}'
+
+
+def test_screen_profile_downsamples_the_logo(logo_path):
+    profile = PDF_OUTPUT_PROFILES['screen']
+    width, height = prepare_logo(logo_path, profile).getSize()
+    box = round(HEADER_LOGO_SIZE / inch * profile['logo_dpi'])
+    assert max(width, height) <= box < 1200
+
+
+def test_screen_logo_is_smaller_than_the_original(app, monkeypatch, logo_path):
+    monkeypatch.setitem(app.config, 'PDF_OUTPUT_PROFILE', 'archive')
+    original = render_summary(logo_path).getbuffer().nbytes
+    monkeypatch.setitem(app.config, 'PDF_OUTPUT_PROFILE', 'screen')
+    assert render_summary(logo_path).getbuffer().nbytes < original / 10
@@ -0,0 +1,116 @@
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+from app import Player, PlayerProfile, db
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_DATABASE = os.path.join(ROOT, 'instance', 'football_reports.db')
+
+
+def profiles(app):
+    """{player name: sorted report ids} for every profile of the club."""
+    with app.app_context():
+        return {
+            profile.player_name: sorted(report.id for report in profile.reports)
+            for profile in db.session.query(PlayerProfile).filter_by(club_id=1)
+        }
+
+
+def test_reports_share_a_profile_by_normalised_name_and_dob(app, client, player_form):
+    client.post('/generate_player_report', data=player_form())
+    client.post('/generate_player_report', data=player_form(player_name='  shivam   CHOPRA '))
+    client.post('/generate_player_report', data=player_form(dob='2006-01-01'))
+    with app.app_context():
+        keys = sorted((p.name_key, p.dob, len(p.reports)) for p in db.session.query(PlayerProfile))
+    assert keys == [('shivam chopra', '2005-03-03', 2), ('shivam chopra', '2006-01-01', 1)]
+
+
+def test_newest_non_blank_value_wins(app, client, player_form):
+    client.post('/generate_player_report', data=player_form(jersey_number='7', height='180', preferred_foot='Left'))
+    client.post('/generate_player_report', data=player_form(jersey_number='9', height='', preferred_foot=''))
+    with app.app_context():
+        profile = db.session.query(PlayerProfile).one()
+        assert (profile.jersey_number, profile.height, profile.preferred_foot) == (9, 180.0, 'Left')
+
+
+def test_editing_the_name_moves_the_report_and_back(app, client, player_form):
+    client.post('/generate_player_report', data=player_form())
+    client.post('/generate_player_report', data=player_form(report_period_start='2025-02-01'))
+
+    client.post('/edit_player/2', data=player_form(player_name='Bob Jones'))
+    assert profiles(app) == {'Shivam Chopra': [1], 'Bob Jones': [2]}
+    client.post('/edit_player/2', data=player_form())
+    assert profiles(app) == {'Shivam Chopra': [1, 2]}
+
+
+def test_editing_a_players_only_report_renames_the_profile(app, client, player_form):
+    client.post('/generate_player_report', data=player_form())
+    with app.app_context():
+        profile_id = db.session.get(Player, 1).profile_id
+    client.post('/edit_player/1', data=player_form(player_name='Bob Jones'))
+    with app.app_context():
+        assert db.session.get(Player, 1).profile_id == profile_id
+    assert profiles(app) == {'Bob Jones': [1]}
+
+
+def test_restoring_a_version_restores_the_profile(app, client, player_form):
+    client.post('/generate_player_report', data=player_form())
+    client.post('/generate_player_report', data=player_form(report_period_start='2025-02-01'))
+    client.post('/edit_player/2', data=player_form(player_name='Bob Jones'))
+
+    client.post('/reports/player/2/versions/1/restore')
+    assert profiles(app) == {'Shivam Chopra': [1, 2]}
+
+
+def test_deleting_the_last_report_deletes_the_profile(app, client, player_form):
+    client.post('/generate_player_report', data=player_form())
+    client.post('/generate_player_report', data=player_form(report_period_start='2025-02-01'))
+    client.post('/delete_player/1')
+    assert profiles(app) == {'Shivam Chopra': [2]}
+    client.post('/delete_player/2')
+    assert profiles(app) == {}
+
+
+def flask_db_upgrade(database, revision):
+    subprocess.run(
+        [sys.executable, '-m', 'flask', '--app', 'app', 'db', 'upgrade', revision],
+        cwd=ROOT, env=dict(os.environ, DATABASE_URL='sqlite:///' + database), check=True, capture_output=True,
+    )
+
+
+def test_profile_migration_merges_duplicate_player_rows(tmp_path):
+    if not os.path.exists(BASELINE_DATABASE):
+        pytest.skip('The baseline database is not in the checkout')
+    database = str(tmp_path / 'baseline.db')
+    shutil.copy(BASELINE_DATABASE, database)
+    flask_db_upgrade(database, '3f9c2a7d1b10') # The revision before player profiles
+
+    with sqlite3.connect(database) as connection:
+        club_id = connection.execute('SELECT id FROM club').fetchone()[0]
+        connection.executemany(
+            'INSERT INTO player (player_name, dob, jersey_number, height, pdf_report_path, created_at, club_id)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [
+                ('Alex Smith', '2004-05-06', 7, 180.0, 'a.pdf', '2025-01-01 10:00:00', club_id),
+                ('  alex   SMITH ', '2004-05-06', None, 182.0, 'b.pdf', '2025-02-01 10:00:00', club_id),
+                ('Alex Smith', None, 11, None, 'c.pdf', '2025-03-01 10:00:00', club_id),
+            ],
+        )
+    flask_db_upgrade(database, '7b2e4d6f8a13')
+
+    with sqlite3.connect(database) as connection:
+        rows = connection.execute(
+            'SELECT player.pdf_report_path, player_profile.id, player_profile.player_name, player_profile.dob,'
+            ' player_profile.jersey_number, player_profile.height'
+            ' FROM player JOIN player_profile ON player_profile.id = player.profile_id'
+            " WHERE player_profile.name_key = 'alex smith' ORDER BY player.pdf_report_path"
+        ).fetchall()
+    (a, b, c) = rows
+    assert a[1] == b[1] != c[1]
+    assert a[2:] == ('alex SMITH', '2004-05-06', 7, 182.0) # Newest non-blank values win
+    assert c[2:] == ('Alex Smith', None, 11, None)
@@ -0,0 +1,68 @@
+import re
+
+import pytest
+
+import app as football_reports
+from app import Club, PrincipalCache, User, db
+
+
+@pytest.fixture
+def principal_cache(app, client, monkeypatch):
+    """Turns the principal cache on, empty, and caches the logged-in user with one request."""
+    monkeypatch.setitem(app.config, 'AUTH_CACHE_TTL', 60)
+    cache = PrincipalCache()
+    monkeypatch.setattr(football_reports, 'principal_cache', cache)
+    client.get('/players')
+    assert cache.get(1) is not None
+    return cache
+
+
+def user_queries(client, url):
+    with football_reports.track_queries() as stats:
+        response = client.get(url)
+    return response, [sql for sql in stats.statements if re.search(r'\bFROM "?user"?\b', sql)]
+
+
+def test_cached_principal_skips_the_user_query(client, principal_cache):
+    response, queries = user_queries(client, '/players')
+    assert response.status_code == 200
+    assert queries == []
+
+
+def test_updating_the_user_drops_its_entry(app, client, principal_cache):
+    with app.app_context():
+        db.session.get(User, 1).username = 'chief-scout'
+        db.session.commit()
+    assert principal_cache.get(1) is None
+
+    response, queries = user_queries(client, '/players')
+    assert queries != []
+    assert 'chief-scout' in response.get_data(as_text=True)
+
+
+def test_updating_the_club_drops_its_users_entries(app, client, principal_cache):
+    with app.app_context():
+        db.session.get(Club, 1).name = 'FC Barcelona'
+        db.session.commit()
+    assert principal_cache.get(1) is None
+    assert 'FC Barcelona' in client.get('/players').get_data(as_text=True)
+
+
+def test_deleting_the_user_drops_its_entry(app, client, principal_cache):
+    with app.app_context():
+        db.session.delete(db.session.get(User, 1))
+        db.session.commit()
+    assert principal_cache.get(1) is None
+    assert client.get('/players').status_code == 302 # Back to the login page
+
+
+def test_deleting_the_club_drops_its_users_entries(app, client, principal_cache):
+    with app.app_context():
+        other = Club(name='Girona')
+        db.session.add(other)
+        db.session.flush()
+        # Moves the user with a Core update, which fires no ORM event, so only the club delete can drop the entry
+        db.session.execute(User.__table__.update().values(club_id=other.id))
+        db.session.delete(db.session.get(Club, 1))
+        db.session.commit()
+    assert principal_cache.get(1) is None
@@ -0,0 +1,70 @@
+from app import Player, ProgressionPoint, create_detailed_player_report_pdf, db
+
+JANUARY = {'report_period_start': '2025-01-01', 'report_period_end': '2025-02-01'}
+FEBRUARY = {'report_period_start': '2025-02-01', 'report_period_end': '2025-03-01'}
+
+
+def points(app):
+    """(profile id, period start, report id, goals) of every progression point."""
+    with app.app_context():
+        rows = db.session.query(ProgressionPoint).order_by(ProgressionPoint.profile_id, ProgressionPoint.period_start)
+        return [(row.profile_id, row.period_start, row.report_id, row.goals) for row in rows]
+
+
+def has_progression_chart(app, monkeypatch, report_id):
+    monkeypatch.setitem(app.config, 'PDF_OUTPUT_PROFILE', 'draft') # Leaves the page text readable
+    with app.app_context():
+        pdf = create_detailed_player_report_pdf(db.session.get(Player, report_id)).getvalue()
+    return b'(Progression) Tj' in pdf
+
+
+def test_adding_reports_adds_points(app, client, player_form):
+    client.post('/generate_player_report', data=player_form(goals='1', **JANUARY))
+    assert points(app) == [(1, '2025-01-01', 1, 1)]
+    client.post('/generate_player_report', data=player_form(goals='2', **FEBRUARY))
+    assert points(app) == [(1, '2025-01-01', 1, 1), (1, '2025-02-01', 2, 2)]
+
+
+def test_newest_report_on_a_period_wins(app, client, player_form):
+    client.post('/generate_player_report', data=player_form(goals='1', **JANUARY))
+    client.post('/generate_player_report', data=player_form(goals='4', **JANUARY))
+    assert points(app) == [(1, '2025-01-01', 2, 4)]
+
+
+def test_moving_a_report_to_another_period_moves_its_point(app, client, player_form):
+    client.post('/generate_player_report', data=player_form(goals='1', **JANUARY))
+    client.post('/generate_player_report', data=player_form(goals='2', **JANUARY))
+    assert points(app) == [(1, '2025-01-01', 2, 2)]
+
+    client.post('/edit_player/2', data=player_form(goals='2', **FEBRUARY))
+    assert points(app) == [(1, '2025-01-01', 1, 1), (1, '2025-02-01', 2, 2)]
+
+
+def test_moving_a_report_to_another_player_rebuilds_both(app, client, player_form):
+    client.post('/generate_player_report', data=player_form(goals='1', **JANUARY))
+    client.post('/generate_player_report', data=player_form(goals='2', **FEBRUARY))
+    client.post('/edit_player/2', data=player_form(player_name='Bob Jones', goals='2', **FEBRUARY))
+    with app.app_context():
+        bob = db.session.get(Player, 2).profile_id
+    assert points(app) == [(1, '2025-01-01', 1, 1), (bob, '2025-02-01', 2, 2)]
+
+
+def test_deleting_reports_removes_their_points(app, client, player_form):
+    client.post('/generate_player_report', data=player_form(goals='1', **JANUARY))
+    client.post('/generate_player_report', data=player_form(goals='2', **FEBRUARY))
+    client.post('/delete_player/2')
+    assert points(app) == [(1, '2025-01-01', 1, 1)]
+    client.post('/delete_player/1')
+    assert points(app) == []
+
+
+def test_chart_needs_two_periods(app, client, player_form, monkeypatch):
+    client.post('/generate_player_report', data=player_form(**JANUARY))
+    assert not has_progression_chart(app, monkeypatch, 1)
+
+    client.post('/generate_player_report', data=player_form(**FEBRUARY))
+    assert has_progression_chart(app, monkeypatch, 2)
+    assert not has_progression_chart(app, monkeypatch, 1) # Later periods are not added to an earlier report
+
+    client.post('/delete_player/1')
+    assert not has_progression_chart(app, monkeypatch, 2)
@@ -0,0 +1,39 @@
+import pytest
+
+# Statements each page may run, whatever the number of reports, including loading the logged-in
+# user: more means an N+1 pattern crept in
+QUERY_BUDGETS = {
+    '/players': 3,
+    '/matches': 3,
+    '/players/profile/1': 4,
+    '/api/v1/players': 3,
+    '/api/v1/matches': 3,
+    '/reports/player/1/history': 4,
+    '/autocomplete/team?q=Re': 2,
+}
+
+
+@pytest.fixture
+def reports(client, player_form, match_form):
+    for i in range(6):
+        client.post('/generate_player_report', data=player_form(report_period_start=f'2025-0{i + 1}-01'))
+        client.post('/generate_player_report', data=player_form(player_name=f'Player {i}'))
+        client.post('/generate_match_report', data=match_form(away_team=f'Rival {i}'))
+
+
+@pytest.mark.parametrize('url, budget', QUERY_BUDGETS.items())
+def test_page_stays_within_query_budget(client, reports, assert_query_budget, url, budget):
+    with assert_query_budget(budget):
+        response = client.get(url)
+    assert response.status_code == 200
+
+
+def test_query_budget_reports_the_statements(client, reports, assert_query_budget):
+    with pytest.raises(AssertionError, match=r'queries run, budget is 0:\n\d+ x SELECT'):
+        with assert_query_budget(0):
+            client.get('/players')
+
+
+def test_server_timing_reports_query_count(client, reports):
+    response = client.get('/players')
+    assert f'desc="{QUERY_BUDGETS["/players"]} queries"' in response.headers['Server-Timing']
@@ -0,0 +1,179 @@
+import threading
+import time
+
+import pytest
+
+from app import RenderAdmission, RenderBusy
+
+CLUB_A, CLUB_B = 1, 2
+
+
+def render_config(**overrides):
+    return {
+        'RENDER_MAX_CONCURRENCY': 1, 'RENDER_MAX_PER_CLUB': 1, 'RENDER_MAX_QUEUED_PER_CLUB': 4, 'RENDER_QUEUE_TIMEOUT': 5,
+        **overrides,
+    }
+
+
+class Renders:
+    """Runs renders on threads that hold their slot until released, recording the order they were admitted in."""
+
+    def __init__(self, admission, config):
+        self.admission = admission
+        self.config = config
+        self.admitted = []
+        self.errors = {}
+        self._done = {}
+        self._threads = []
+
+    def start(self, name, club_id):
+        done = self._done[name] = threading.Event()
+
+        def render():
+            try:
+                with self.admission.slot(club_id, self.config):
+                    self.admitted.append(name)
+                    done.wait(5)
+            except RenderBusy as error:
+                self.errors[name] = error
+        thread = threading.Thread(target=render, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def finish(self, name):
+        self._done[name].set()
+
+    def finish_all(self):
+        for done in self._done.values():
+            done.set()
+        for thread in self._threads:
+            thread.join(5)
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out waiting for the render threads'
+        time.sleep(0.005)
+
+
+def club_state(admission, club_id):
+    values = admission.snapshot().get(club_id, {'queued': 0, 'active': 0})
+    return values['active'], values['queued']
+
+
+@pytest.fixture
+def admission():
+    return RenderAdmission()
+
+
+def test_second_club_is_admitted_while_the_first_clubs_backlog_waits(admission):
+    renders = Renders(admission, render_config(RENDER_MAX_CONCURRENCY=2))
+    try:
+        renders.start('a1', CLUB_A)
+        wait_until(lambda: renders.admitted == ['a1'])
+        renders.start('a2', CLUB_A)
+        renders.start('a3', CLUB_A)
+        wait_until(lambda: club_state(admission, CLUB_A) == (1, 2))
+
+        renders.start('b1', CLUB_B)
+        wait_until(lambda: 'b1' in renders.admitted)
+        assert club_state(admission, CLUB_A) == (1, 2)
+    finally:
+        renders.finish_all()
+
+
+def test_waiting_clubs_take_turns(admission):
+    renders = Renders(admission, render_config())
+    try:
+        renders.start('a1', CLUB_A)
+        wait_until(lambda: renders.admitted == ['a1'])
+        renders.start('a2', CLUB_A)
+        wait_until(lambda: club_state(admission, CLUB_A) == (1, 1))
+        renders.start('a3', CLUB_A)
+        wait_until(lambda: club_state(admission, CLUB_A) == (1, 2))
+        renders.start('b1', CLUB_B)
+        wait_until(lambda: club_state(admission, CLUB_B) == (0, 1))
+
+        for name, expected in [('a1', ['a1', 'a2']), ('a2', ['a1', 'a2', 'b1']), ('b1', ['a1', 'a2', 'b1', 'a3'])]:
+            renders.finish(name)
+            wait_until(lambda: len(renders.admitted) == len(expected))
+            assert renders.admitted == expected
+    finally:
+        renders.finish_all()
+
+
+def test_per_club_and_global_caps(admission):
+    renders = Renders(admission, render_config(RENDER_MAX_CONCURRENCY=2, RENDER_MAX_PER_CLUB=2))
+    try:
+        for name, state in [('a1', (1, 0)), ('a2', (2, 0)), ('a3', (2, 1))]:
+            renders.start(name, CLUB_A)
+            wait_until(lambda: club_state(admission, CLUB_A) == state)
+        renders.start('b1', CLUB_B)
+        wait_until(lambda: club_state(admission, CLUB_B) == (0, 1)) # Both slots are taken
+
+        renders.finish('a1')
+        wait_until(lambda: club_state(admission, CLUB_A) == (2, 0)) # Club A was queued first
+        assert club_state(admission, CLUB_B) == (0, 1)
+        renders.finish('a2')
+        wait_until(lambda: club_state(admission, CLUB_B) == (1, 0))
+    finally:
+        renders.finish_all()
+    assert renders.errors == {}
+
+
+def test_full_queue_is_rejected_with_retry_after(admission):
+    renders = Renders(admission, render_config(RENDER_MAX_QUEUED_PER_CLUB=1))
+    try:
+        renders.start('a1', CLUB_A)
+        wait_until(lambda: renders.admitted == ['a1'])
+        renders.start('a2', CLUB_A)
+        wait_until(lambda: club_state(admission, CLUB_A) == (1, 1))
+
+        with pytest.raises(RenderBusy) as busy:
+            with admission.slot(CLUB_A, renders.config):
+                pass
+        assert busy.value.retry_after >= 1
+        assert admission.snapshot()[CLUB_A]['rejected'] == 1
+    finally:
+        renders.finish_all()
+
+
+def test_queued_render_gives_up_after_the_timeout(admission):
+    renders = Renders(admission, render_config(RENDER_QUEUE_TIMEOUT=0.2))
+    try:
+        renders.start('a1', CLUB_A)
+        wait_until(lambda: renders.admitted == ['a1'])
+
+        started_at = time.monotonic()
+        with pytest.raises(RenderBusy) as busy:
+            with admission.slot(CLUB_A, renders.config):
+                pass
+        assert time.monotonic() - started_at >= 0.2
+        assert busy.value.retry_after >= 1
+        assert club_state(admission, CLUB_A) == (1, 0)
+    finally:
+        renders.finish_all()
+
+
+def test_busy_render_returns_429_with_retry_after(app, client, player_form, monkeypatch):
+    monkeypatch.setitem(app.config, 'RENDER_MAX_PER_CLUB', 0)
+    monkeypatch.setitem(app.config, 'RENDER_MAX_QUEUED_PER_CLUB', 0)
+    response = client.post('/generate_player_report', data=player_form())
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+
+
+def test_metrics_require_the_token(app, monkeypatch):
+    client = app.test_client()
+    response = client.get('/metrics')
+    assert response.status_code == 401
+    assert response.headers['WWW-Authenticate'] == 'Bearer'
+    assert client.get('/metrics', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+
+    response = client.get('/metrics', headers={'Authorization': 'Bearer test-token'})
+    assert response.status_code == 200
+    assert 'football_reports_render_queue_depth' in response.get_data(as_text=True)
+
+    monkeypatch.setitem(app.config, 'METRICS_TOKEN', None)
+    assert client.get('/metrics').status_code == 404
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+import reportlab
+
+from app import (
+    PDF_OUTPUT_PROFILES, FontRegistry, _styles, create_detailed_player_report_pdf, create_summary_player_report_pdf,
+    report_fonts, sample_player,
+)
+
+VERA = os.path.join(os.path.dirname(reportlab.__file__), 'fonts', 'Vera.ttf')
+VERA_BOLD = os.path.join(os.path.dirname(reportlab.__file__), 'fonts', 'VeraBd.ttf')
+
+
+@pytest.fixture
+def ttf_fonts():
+    if not os.path.exists(VERA):
+        pytest.skip("ReportLab's bundled Vera fonts are not installed")
+    return report_fonts.register_family('TestSans', VERA, VERA_BOLD)
+
+
+def test_register_family_is_idempotent(ttf_fonts):
+    assert ttf_fonts == ('TestSans', 'TestSans-Bold')
+    assert report_fonts.register_family('TestSans', VERA, VERA_BOLD) == ttf_fonts
+
+
+@pytest.mark.parametrize('renderer', [create_detailed_player_report_pdf, create_summary_player_report_pdf])
+def test_reports_embed_the_active_ttf_family(app, ttf_fonts, renderer):
+    player = sample_player()
+    player.player_name = 'Zoë Ørsted-Nakamura'
+    builtin = renderer(player).getvalue()
+    with report_fonts.using(*ttf_fonts, _styles):
+        embedded = renderer(player).getvalue()
+
+    if (report_fonts.regular, report_fonts.bold) == FontRegistry.BUILTIN:
+        assert b'/FontFile2' not in builtin and b'/Helvetica' in builtin
+    assert b'/FontFile2' in embedded
+    # Only the glyphs used are embedded, so reports stay within the screen profile's budget
+    assert len(embedded) <= PDF_OUTPUT_PROFILES['screen']['max_bytes']
+
+
+def test_using_restores_the_previous_fonts(app, ttf_fonts):
+    previous = (report_fonts.regular, report_fonts.bold)
+    with report_fonts.using(*ttf_fonts, _styles):
+        assert (report_fonts.regular, report_fonts.bold) == ttf_fonts
+        assert _styles['MyKeyInfo'].fontName == 'TestSans'
+    assert (report_fonts.regular, report_fonts.bold) == previous
+    assert _styles['MyKeyInfo'].fontName == previous[0]
@@ -0,0 +1,59 @@
+import html
+import re
+
+import pytest
+
+from app import REPORT_MODELS, REPORT_SECTIONS, create_detailed_player_report_pdf, create_match_report_pdf, db
+
+
+def pdf_strings(pdf):
+    """The text shown by a PDF rendered with uncompressed page streams (the draft profile)."""
+    strings = re.findall(rb'\(((?:[^()\\]|\\.)*)\) Tj', pdf)
+    return [re.sub(rb'\\(.)', rb'\1', s).decode('latin-1') for s in strings]
+
+
+def in_order(items, strings):
+    """Whether every item is one of the strings, in the same order."""
+    position = 0
+    for item in items:
+        if item not in strings[position:]:
+            return False
+        position = strings.index(item, position) + 1
+    return True
+
+
+@pytest.fixture
+def reports(client, player_form, match_form):
+    # Two periods for the same player, so the second report has progression charts
+    client.post('/generate_player_report', data=player_form())
+    client.post('/generate_player_report', data=player_form(report_period_start='2025-02-01', report_period_end='2025-03-01', goals='5'))
+    client.post('/generate_match_report', data=match_form(venue='Camp Nou', man_of_the_match='Pedri'))
+
+
+@pytest.mark.parametrize('kind, report_id', [('player', 1), ('player', 2), ('match', 1)])
+def test_preview_shows_the_pdf_sections(app, client, reports, monkeypatch, kind, report_id):
+    monkeypatch.setitem(app.config, 'PDF_OUTPUT_PROFILE', 'draft')
+    with app.app_context():
+        report = db.session.get(REPORT_MODELS[kind], report_id)
+        sections = REPORT_SECTIONS[kind][1](report)
+        if kind == 'player':
+            pdf = create_detailed_player_report_pdf(report).getvalue()
+        else:
+            pdf = create_match_report_pdf(report, report.club.name).getvalue()
+    page = client.get(f'/reports/{kind}/{report_id}/preview').get_data(as_text=True)
+    shown = pdf_strings(pdf)
+
+    headings = [heading for _, heading, _ in sections]
+    assert [html.unescape(caption) for caption in re.findall(r'<caption>(.*?)</caption>', page)] == headings
+    assert in_order(headings, shown)
+
+    labels = [label for _, _, rows in sections for label, _ in rows]
+    assert [html.unescape(label) for label in re.findall(r'<th scope="row">(.*?)</th>', page)] == labels
+    assert in_order(labels, shown)
+
+    values = [str(value) for layout, _, rows in sections if layout in ('vitals', 'table') for _, value in rows if value != '']
+    for value in values:
+        assert value in shown
+        assert f'<td>{html.escape(value)}</td>' in page
+
+    assert ('Progression' in headings) == (kind == 'player' and report_id == 2)
@@ -0,0 +1,90 @@
+import hashlib
+
+import pytest
+
+import app as football_reports
+from app import LocalReportStorage, ReportStorage, S3ReportStorage
+
+BUCKET = 'football-reports-test'
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """A mocked S3 with an empty bucket, for as long as the test runs."""
+    pytest.importorskip('boto3')
+    moto = pytest.importorskip('moto')
+    for name, value in [('AWS_ACCESS_KEY_ID', 'testing'), ('AWS_SECRET_ACCESS_KEY', 'testing'), ('AWS_DEFAULT_REGION', 'us-east-1')]:
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(football_reports, '_s3_report_storages', {}) # Clients made outside the mock would reach AWS
+    with moto.mock_aws():
+        football_reports.boto3.client('s3').create_bucket(Bucket=BUCKET)
+        yield
+
+
+@pytest.fixture(params=['local', 's3'])
+def storage(request, tmp_path):
+    if request.param == 'local':
+        return LocalReportStorage(str(tmp_path))
+    request.getfixturevalue('s3')
+    return S3ReportStorage(BUCKET, prefix='reports/')
+
+
+def blob(text):
+    data = f'%PDF-1.4 {text}'.encode('ascii')
+    return hashlib.sha256(data).hexdigest(), data
+
+
+def test_report_storage_is_abstract():
+    with pytest.raises(TypeError):
+        ReportStorage()
+
+
+def test_put_open_and_delete(storage):
+    key, data = blob('one')
+    assert not storage.exists(key)
+    storage.put(key, data)
+    assert storage.exists(key)
+    with storage.open(key) as f:
+        assert f.read() == data
+
+    storage.delete(key)
+    assert not storage.exists(key)
+    storage.delete(key) # Deleting a missing blob is not an error
+
+
+def test_open_missing_blob_raises_file_not_found(storage):
+    with pytest.raises(FileNotFoundError):
+        storage.open(blob('missing')[0])
+
+
+def test_keys_lists_every_blob(storage):
+    keys = set()
+    for text in ('one', 'two', 'three'):
+        key, data = blob(text)
+        storage.put(key, data)
+        keys.add(key)
+    assert set(storage.keys()) == keys
+
+
+def test_s3_keys_stay_under_the_prefix(s3):
+    key, data = blob('one')
+    S3ReportStorage(BUCKET, prefix='reports/').put(key, data)
+    listing = football_reports.boto3.client('s3').list_objects_v2(Bucket=BUCKET)
+    assert [item['Key'] for item in listing['Contents']] == [f'reports/blobs/{key[:2]}/{key}.pdf']
+    assert list(S3ReportStorage(BUCKET, prefix='other/').keys()) == []
+
+
+def test_reports_are_stored_in_and_served_from_s3(app, client, player_form, s3, monkeypatch):
+    monkeypatch.setitem(app.config, 'REPORT_STORAGE', 's3')
+    monkeypatch.setitem(app.config, 'REPORT_S3_BUCKET', BUCKET)
+    client.post('/generate_player_report', data=player_form())
+
+    with app.app_context():
+        player = football_reports.db.session.query(football_reports.Player).one()
+        key = player.versions[-1].blob_sha256
+        player_id = player.id
+    assert football_reports.report_storage().exists(key)
+
+    response = client.get(f'/reports/player/{player_id}/versions/1')
+    assert response.status_code == 200
+    assert hashlib.sha256(response.data).hexdigest() == key
@@ -0,0 +1,52 @@
+import pytest
+
+from app import Club, Match, club_season_summary, db
+
+# (date, season, home, away, home score, away score), from Barcelona's point of view in the comments
+FIXTURES = [
+    ('2024-05-01', '2023/24', 'Barcelona', 'Atletico', 0, 1),      # L
+    ('2024-08-10', '2024/25', 'Barcelona', 'Valencia', 2, 1),      # W
+    ('2024-08-17', '2024/25', 'Sevilla', 'barcelona', 1, 1),       # D, away
+    ('2024-08-24', '2024/25', 'Real Madrid', 'Barcelona', 3, 0),   # L, away
+    ('2024-08-31', '2024/25', 'BARCELONA', 'Getafe', 4, 2),        # W
+    ('2024-09-07', '2024/25', 'Girona', 'Barcelona', 0, 2),        # W, away
+    ('2024-09-14', '2024/25', 'Barcelona', 'Betis', None, None),   # Not played yet
+]
+
+
+@pytest.fixture
+def club_id(app, client):
+    with app.app_context():
+        club = db.session.query(Club).filter_by(name='Barcelona').one()
+        for i, (date, season, home, away, home_score, away_score) in enumerate(FIXTURES):
+            db.session.add(Match(
+                club_id=club.id, match_date=date, season=season, home_team=home, away_team=away,
+                final_score_home=home_score, final_score_away=away_score, pdf_report_path=f'match-{i}.pdf',
+            ))
+        db.session.commit()
+        return club.id
+
+
+def summaries(app, club_id, **options):
+    with app.app_context():
+        return club_season_summary(club_id, 'Barcelona', **options)
+
+
+def test_summary_counts_results_from_the_clubs_side(app, club_id):
+    current, previous = summaries(app, club_id)
+    assert current == {
+        'season': '2024/25', 'played': 5, 'won': 3, 'drawn': 1, 'lost': 1,
+        'goals_for': 9, 'goals_against': 7, 'goal_difference': 2, 'points': 10,
+        'form': ['W', 'W', 'L', 'D', 'W'],
+    }
+    assert (previous['season'], previous['played'], previous['lost'], previous['points'], previous['form']) == ('2023/24', 1, 1, 0, ['L'])
+
+
+def test_form_length_and_season_filter(app, club_id):
+    (summary,) = summaries(app, club_id, season='2024/25', form_length=3)
+    assert summary['form'] == ['W', 'W', 'L']
+
+
+def test_summary_page_lists_each_season(client, club_id):
+    page = client.get('/matches/summary?form=3').get_data(as_text=True)
+    assert '2024/25' in page and '2023/24' in page
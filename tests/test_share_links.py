@@ -0,0 +1,80 @@
+import re
+from datetime import datetime, timedelta
+
+import pytest
+
+import app as football_reports
+
+
+def mint_share_link(client, days=7, kind='player', report_id=1):
+    """Creates a share link through the form and returns its path, or None if none was shown."""
+    response = client.post(f'/reports/{kind}/{report_id}/share', data={'days': days})
+    assert response.status_code == 200
+    found = re.search(r'value="http://localhost(/share/[^"]+)"', response.get_data(as_text=True))
+    return found and found.group(1)
+
+
+def move_clock_forward(monkeypatch, days):
+    class LaterDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(days=days)
+    monkeypatch.setattr(football_reports, 'datetime', LaterDatetime)
+
+
+@pytest.fixture
+def share_path(client, player_form):
+    client.post('/generate_player_report', data=player_form())
+    return mint_share_link(client)
+
+
+def test_valid_link_serves_the_pdf_without_a_session_or_queries(app, share_path, assert_query_budget):
+    with assert_query_budget(0):
+        response = app.test_client().get(share_path)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/pdf'
+    assert response.data.startswith(b'%PDF')
+
+
+def test_link_sets_cache_and_robots_headers(app, share_path):
+    response = app.test_client().get(share_path)
+    assert response.headers['Cache-Control'] == 'private, max-age=3600'
+    assert response.headers['X-Robots-Tag'] == 'noindex'
+
+
+def test_tampered_link_is_not_found(app, share_path):
+    token = share_path.removeprefix('/share/')
+    # Changes the payload rather than the signature's last character, whose low bits are padding
+    tampered = token[:5] + ('A' if token[5] != 'A' else 'B') + token[6:]
+    assert app.test_client().get('/share/' + tampered).status_code == 404
+
+
+def test_expired_link_is_gone(app, share_path, monkeypatch):
+    move_clock_forward(monkeypatch, 8)
+    assert app.test_client().get(share_path).status_code == 410
+
+
+def test_lowering_the_max_days_shortens_existing_links(app, client, player_form, monkeypatch):
+    client.post('/generate_player_report', data=player_form())
+    share_path = mint_share_link(client, days=30)
+    monkeypatch.setitem(app.config, 'SHARE_LINK_MAX_DAYS', 1)
+    move_clock_forward(monkeypatch, 2)
+    assert app.test_client().get(share_path).status_code == 410
+
+
+def test_minting_is_capped_at_max_days(app, client, player_form, monkeypatch):
+    client.post('/generate_player_report', data=player_form())
+    monkeypatch.setitem(app.config, 'SHARE_LINK_MAX_DAYS', 7)
+    assert mint_share_link(client, days=30) is None
+    assert '<option value="30"' not in client.get('/reports/player/1/share').get_data(as_text=True)
+    assert mint_share_link(client, days=7) is not None
+
+
+def test_another_clubs_report_cannot_be_shared(app, client, player_form):
+    other = app.test_client()
+    other.post('/register', data={'club_name': 'Real Madrid', 'username': 'rival', 'password': 'secret2'})
+    other.post('/login', data={'username': 'rival', 'password': 'secret2'})
+    other.post('/generate_player_report', data=player_form())
+
+    response = client.post('/reports/player/1/share', data={'days': 7})
+    assert response.status_code == 404
@@ -0,0 +1,82 @@
+import gzip
+import os
+
+import pytest
+from flask import url_for
+
+CSS = b'body { color: #123456; }\n' * 40
+
+
+@pytest.fixture
+def static_folder(app, tmp_path, monkeypatch):
+    """A static folder holding site.css with gzip and brotli variants."""
+    folder = tmp_path / 'static'
+    (folder / 'css').mkdir(parents=True)
+    (folder / 'css' / 'site.css').write_bytes(CSS)
+    (folder / 'css' / 'site.css.gz').write_bytes(gzip.compress(CSS))
+    (folder / 'css' / 'site.css.br').write_bytes(b'brotli bytes') # Only served, never decoded here
+    monkeypatch.setattr(app, 'static_folder', str(folder))
+    return folder
+
+
+def static_url(app, filename):
+    with app.test_request_context():
+        return url_for('static', filename=filename)
+
+
+def test_fingerprinted_url_is_immutable(app, static_folder):
+    url = static_url(app, 'css/site.css')
+    assert '?v=' in url
+    client = app.test_client()
+    assert 'immutable' in client.get(url).headers['Cache-Control']
+    assert client.get('/static/css/site.css').headers['Cache-Control'] == 'public, no-cache'
+    assert client.get('/static/css/site.css?v=0123456789ab').headers['Cache-Control'] == 'public, no-cache'
+
+
+def test_changing_a_file_changes_its_fingerprint(app, static_folder):
+    url = static_url(app, 'css/site.css')
+    (static_folder / 'css' / 'site.css').write_bytes(CSS + b'p { margin: 0; }\n')
+    assert static_url(app, 'css/site.css') != url
+
+
+@pytest.mark.parametrize('accept_encoding, encoding', [
+    ('gzip, br', 'br'), ('gzip', 'gzip'), ('br;q=0, gzip', 'gzip'), ('identity', None), (None, None),
+])
+def test_precompressed_variant_follows_accept_encoding(app, static_folder, accept_encoding, encoding):
+    headers = {'Accept-Encoding': accept_encoding} if accept_encoding else {}
+    response = app.test_client().get('/static/css/site.css', headers=headers)
+    assert response.headers.get('Content-Encoding') == encoding
+    assert 'Accept-Encoding' in response.vary
+    body = response.get_data()
+    assert {'br': b'brotli bytes', 'gzip': gzip.compress(CSS), None: CSS}[encoding] == body
+
+
+def test_stale_variant_is_not_served(app, static_folder):
+    original = static_folder / 'css' / 'site.css'
+    os.utime(static_folder / 'css' / 'site.css.gz', (0, 0))
+    os.utime(static_folder / 'css' / 'site.css.br', (0, 0))
+    response = app.test_client().get('/static/css/site.css', headers={'Accept-Encoding': 'gzip, br'})
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_data() == original.read_bytes()
+
+
+def test_small_responses_are_not_compressed(app, client, monkeypatch):
+    headers = {'Accept-Encoding': 'gzip'}
+    response = client.get('/autocomplete/team?q=re', headers=headers)
+    assert len(response.get_data()) < app.config['COMPRESS_MIN_BYTES']
+    assert 'Content-Encoding' not in response.headers
+
+    monkeypatch.setitem(app.config, 'COMPRESS_MIN_BYTES', 1)
+    response = client.get('/autocomplete/team?q=re', headers=headers)
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.get_data()) == b'[]\n'
+
+
+def test_compression_weakens_the_etag(client):
+    etag, weak = client.get('/players').get_etag()
+    assert not weak
+
+    response = client.get('/players', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.get_etag() == (etag, True)
+    assert client.get('/players', headers={'Accept-Encoding': 'gzip', 'If-None-Match': f'W/"{etag}"'}).status_code == 304